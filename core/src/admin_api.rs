@@ -28,28 +28,52 @@ struct PluginResponse {
     status: String,
 }
 
-async fn get_status(State(state): State<AdminState>) -> Json<StatusResponse> {
-    let plugins = state.plugins.lock().unwrap_or_else(|poisoned| poisoned.into_inner());
-    Json(StatusResponse {
+/// Status and plugin list together, so a poller needs one request per refresh
+#[derive(Serialize)]
+struct StateResponse {
+    status: StatusResponse,
+    plugins: Vec<PluginResponse>,
+}
+
+fn status_response(state: &AdminState, plugins: &[WasmPlugin]) -> StatusResponse {
+    StatusResponse {
         status: "running".to_string(),
         buffer_len: state.buffer.len(),
         plugin_count: plugins.len(),
-    })
+    }
 }
 
-async fn get_plugins(State(state): State<AdminState>) -> Json<Vec<PluginResponse>> {
-    let plugins = state.plugins.lock().unwrap_or_else(|poisoned| poisoned.into_inner());
-    let list = plugins.iter().enumerate().map(|(i, _)| PluginResponse {
+fn plugin_list(plugins: &[WasmPlugin]) -> Vec<PluginResponse> {
+    plugins.iter().enumerate().map(|(i, _)| PluginResponse {
         id: i,
         status: "loaded".to_string(),
-    }).collect();
-    Json(list)
+    }).collect()
+}
+
+async fn get_status(State(state): State<AdminState>) -> Json<StatusResponse> {
+    let plugins = state.plugins.lock().unwrap_or_else(|poisoned| poisoned.into_inner());
+    Json(status_response(&state, &plugins))
+}
+
+async fn get_plugins(State(state): State<AdminState>) -> Json<Vec<PluginResponse>> {
+    let plugins = state.plugins.lock().unwrap_or_else(|poisoned| poisoned.into_inner());
+    Json(plugin_list(&plugins))
+}
+
+async fn get_state(State(state): State<AdminState>) -> Json<StateResponse> {
+    // One lock for both parts, so they describe the same moment
+    let plugins = state.plugins.lock().unwrap_or_else(|poisoned| poisoned.into_inner());
+    Json(StateResponse {
+        status: status_response(&state, &plugins),
+        plugins: plugin_list(&plugins),
+    })
 }
 
 pub async fn start_admin_server(state: AdminState, port: u16) {
     let app = Router::new()
         .route("/status", get(get_status))
         .route("/plugins", get(get_plugins))
+        .route("/state", get(get_state))
         .with_state(state);
 
     let addr = SocketAddr::from(([0, 0, 0, 0], port));
@@ -120,6 +144,21 @@ mod tests {
         assert!(json_str.contains("loaded"));
     }
     
+    #[tokio::test]
+    async fn test_get_state_combines_status_and_plugins() {
+        let state = create_test_state();
+        
+        let Json(response) = get_state(State(state)).await;
+        assert_eq!(response.status.status, "running");
+        assert_eq!(response.status.buffer_len, 0);
+        assert_eq!(response.status.plugin_count, 0);
+        assert!(response.plugins.is_empty());
+        
+        let json_str = serde_json::to_string(&response).unwrap();
+        assert!(json_str.contains("\"status\":{"));
+        assert!(json_str.contains("\"plugins\":[]"));
+    }
+    
     /// Test get_plugins handler logic directly
     /// This catches the mutation: replace get_plugins return with empty vec
     #[tokio::test]
@@ -220,6 +259,7 @@ mod tests {
         let _app: Router<()> = Router::new()
             .route("/status", get(get_status))
             .route("/plugins", get(get_plugins))
+            .route("/state", get(get_state))
             .with_state(state);
         
         // If we get here, router configuration is valid
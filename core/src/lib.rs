@@ -142,6 +142,235 @@ pub unsafe extern "C" fn zenith_publish(
     }
 }
 
+/// Publish one Arrow RecordBatch under a contiguous range of sequence numbers
+/// Imports the batch once and pushes `count` events (seq_start..seq_start+count)
+/// sharing the same Arrow buffers, so callers pay a single FFI crossing.
+/// Takes ownership of the FFI structs (they are moved into Rust)
+/// 
+/// # Returns
+/// - 0: Success
+/// - -1: Null pointer
+/// - -2: Buffer full (events before the full slot were published)
+/// - -3: Panic occurred
+/// - -4: FFI/Arrow error
+/// 
+/// # Safety
+/// - All pointers must be valid
+/// - array_ptr and schema_ptr ownership is transferred to Rust
+#[no_mangle]
+pub unsafe extern "C" fn zenith_publish_many(
+    engine_ptr: *mut c_void,
+    array_ptr: *mut FFI_ArrowArray,
+    schema_ptr: *mut FFI_ArrowSchema,
+    source_id: u32,
+    seq_start: u64,
+    count: u64
+) -> i32 {
+    if engine_ptr.is_null() || array_ptr.is_null() || schema_ptr.is_null() {
+        return ffi_error::NULL_POINTER;
+    }
+
+    let result = catch_unwind(AssertUnwindSafe(|| {
+        let engine = &*(engine_ptr as *mut ZenithEngine);
+        
+        // SAFETY: Caller has prepared valid FFI structs
+        let array = std::ptr::read(array_ptr);
+        let schema = std::ptr::read(schema_ptr);
+
+        match arrow::ffi::from_ffi(array, &schema) {
+            Ok(array_data) => {
+                let struct_array = arrow::array::StructArray::from(array_data);
+                let batch = RecordBatch::from(&struct_array);
+                let buffer = engine.get_ring_buffer();
+                
+                for seq_no in seq_start..seq_start.saturating_add(count) {
+                    // RecordBatch clones only bump the Arc refcounts of its columns
+                    let event = ZenithEvent::new(source_id, seq_no, batch.clone());
+                    if buffer.push(event).is_err() {
+                        return ffi_error::BUFFER_FULL;
+                    }
+                }
+                ffi_error::SUCCESS
+            },
+            Err(_) => ffi_error::FFI_ERROR,
+        }
+    }));
+    
+    match result {
+        Ok(code) => code,
+        Err(_) => {
+            eprintln!("[zenith] PANIC in zenith_publish_many - caught safely");
+            ffi_error::PANIC
+        }
+    }
+}
+
+/// Publish several Arrow RecordBatches in a single call
+/// Batch `i` is published with sequence number `seq_start + i`, so callers
+/// pay one FFI crossing for the whole slice.
+/// Takes ownership of all `count` FFI structs (they are moved into Rust)
+/// 
+/// # Returns
+/// - 0: Success
+/// - -1: Null pointer
+/// - -2: Buffer full (batches before the full slot were published)
+/// - -3: Panic occurred
+/// - -4: FFI/Arrow error (batches before the failing one were published)
+/// 
+/// # Safety
+/// - arrays_ptr and schemas_ptr must each point to `count` contiguous structs
+/// - Ownership of every struct is transferred to Rust
+#[no_mangle]
+pub unsafe extern "C" fn zenith_publish_batches(
+    engine_ptr: *mut c_void,
+    arrays_ptr: *mut FFI_ArrowArray,
+    schemas_ptr: *mut FFI_ArrowSchema,
+    count: usize,
+    source_id: u32,
+    seq_start: u64
+) -> i32 {
+    if engine_ptr.is_null() || arrays_ptr.is_null() || schemas_ptr.is_null() {
+        return ffi_error::NULL_POINTER;
+    }
+
+    let result = catch_unwind(AssertUnwindSafe(|| {
+        let engine = &*(engine_ptr as *mut ZenithEngine);
+        
+        // SAFETY: Caller has prepared `count` valid FFI structs. Take them all
+        // up front so any left unpublished are still released on return.
+        let structs: Vec<(FFI_ArrowArray, FFI_ArrowSchema)> = (0..count)
+            .map(|i| (std::ptr::read(arrays_ptr.add(i)), std::ptr::read(schemas_ptr.add(i))))
+            .collect();
+        let buffer = engine.get_ring_buffer();
+        
+        for (seq_no, (array, schema)) in (seq_start..).zip(structs) {
+            let array_data = match arrow::ffi::from_ffi(array, &schema) {
+                Ok(array_data) => array_data,
+                Err(_) => return ffi_error::FFI_ERROR,
+            };
+            let struct_array = arrow::array::StructArray::from(array_data);
+            let event = ZenithEvent::new(source_id, seq_no, RecordBatch::from(&struct_array));
+            if buffer.push(event).is_err() {
+                return ffi_error::BUFFER_FULL;
+            }
+        }
+        ffi_error::SUCCESS
+    }));
+    
+    match result {
+        Ok(code) => code,
+        Err(_) => {
+            eprintln!("[zenith] PANIC in zenith_publish_batches - caught safely");
+            ffi_error::PANIC
+        }
+    }
+}
+
+/// Import an Arrow RecordBatch once so it can be published repeatedly
+/// Returns an opaque handle owning the imported batch.
+/// Caller is responsible for calling zenith_prepared_free.
+/// Takes ownership of the FFI structs (they are moved into Rust)
+/// 
+/// # Safety
+/// - Returns null on error (including panic)
+/// - array_ptr and schema_ptr ownership is transferred to Rust
+#[no_mangle]
+pub unsafe extern "C" fn zenith_prepare(
+    array_ptr: *mut FFI_ArrowArray,
+    schema_ptr: *mut FFI_ArrowSchema
+) -> *mut c_void {
+    if array_ptr.is_null() || schema_ptr.is_null() {
+        return std::ptr::null_mut();
+    }
+
+    let result = catch_unwind(AssertUnwindSafe(|| {
+        // SAFETY: Caller has prepared valid FFI structs
+        let array = std::ptr::read(array_ptr);
+        let schema = std::ptr::read(schema_ptr);
+
+        match arrow::ffi::from_ffi(array, &schema) {
+            Ok(array_data) => {
+                let struct_array = arrow::array::StructArray::from(array_data);
+                let batch = RecordBatch::from(&struct_array);
+                Box::into_raw(Box::new(batch)) as *mut c_void
+            },
+            Err(_) => std::ptr::null_mut(),
+        }
+    }));
+    
+    match result {
+        Ok(ptr) => ptr,
+        Err(_) => {
+            eprintln!("[zenith] PANIC in zenith_prepare - caught safely");
+            std::ptr::null_mut()
+        }
+    }
+}
+
+/// Publish a batch previously imported with zenith_prepare
+/// Only the event header is created per call; the Arrow buffers are shared.
+/// 
+/// # Returns
+/// - 0: Success
+/// - -1: Null pointer
+/// - -2: Buffer full
+/// - -3: Panic occurred
+/// 
+/// # Safety
+/// - engine_ptr must be valid pointer from zenith_init
+/// - prepared_ptr must be valid pointer from zenith_prepare
+#[no_mangle]
+pub unsafe extern "C" fn zenith_publish_prepared(
+    engine_ptr: *mut c_void,
+    prepared_ptr: *const c_void,
+    source_id: u32,
+    seq_no: u64
+) -> i32 {
+    if engine_ptr.is_null() || prepared_ptr.is_null() {
+        return ffi_error::NULL_POINTER;
+    }
+
+    let result = catch_unwind(AssertUnwindSafe(|| {
+        let engine = &*(engine_ptr as *mut ZenithEngine);
+        let batch = &*(prepared_ptr as *const RecordBatch);
+        let event = ZenithEvent::new(source_id, seq_no, batch.clone());
+        
+        match engine.get_ring_buffer().push(event) {
+            Ok(_) => ffi_error::SUCCESS,
+            Err(_) => ffi_error::BUFFER_FULL,
+        }
+    }));
+    
+    match result {
+        Ok(code) => code,
+        Err(_) => {
+            eprintln!("[zenith] PANIC in zenith_publish_prepared - caught safely");
+            ffi_error::PANIC
+        }
+    }
+}
+
+/// Free a batch handle returned by zenith_prepare
+/// Events already published keep their own references to the buffers.
+/// 
+/// # Safety
+/// - prepared_ptr must be a valid pointer from zenith_prepare or null
+/// - Must not be called twice with the same pointer
+#[no_mangle]
+pub unsafe extern "C" fn zenith_prepared_free(prepared_ptr: *mut c_void) {
+    if prepared_ptr.is_null() {
+        return;
+    }
+    
+    let result = catch_unwind(AssertUnwindSafe(|| {
+        drop(Box::from_raw(prepared_ptr as *mut RecordBatch));
+    }));
+    
+    if result.is_err() {
+        eprintln!("[zenith] PANIC in zenith_prepared_free - caught safely");
+    }
+}
+
 /// Load a WASM plugin
 /// 
 /// # Returns
@@ -276,6 +505,141 @@ mod tests {
         }
     }
     
+    #[test]
+    fn test_zenith_publish_many_null_pointers() {
+        unsafe {
+            let result = zenith_publish_many(
+                std::ptr::null_mut(),
+                std::ptr::null_mut(),
+                std::ptr::null_mut(),
+                0,
+                0,
+                10
+            );
+            assert_eq!(result, ffi_error::NULL_POINTER,
+                "zenith_publish_many with null engine should return NULL_POINTER");
+        }
+    }
+    
+    #[test]
+    fn test_zenith_publish_many_pushes_range() {
+        use arrow::array::{Array, Int32Array, StructArray};
+        use arrow::datatypes::{DataType, Field};
+        use std::sync::Arc;
+        
+        let engine = ZenithEngine::new(16).unwrap();
+        let engine_ptr = Box::into_raw(Box::new(engine)) as *mut c_void;
+        
+        let values: arrow::array::ArrayRef = Arc::new(Int32Array::from(vec![1, 2, 3]));
+        let struct_array = StructArray::from(vec![
+            (Arc::new(Field::new("value", DataType::Int32, false)), values),
+        ]);
+        let (mut array, mut schema) = arrow::ffi::to_ffi(&struct_array.to_data()).unwrap();
+        
+        unsafe {
+            let result = zenith_publish_many(engine_ptr, &mut array, &mut schema, 7, 100, 5);
+            // Ownership moved into Rust; do not release the originals twice
+            std::mem::forget(array);
+            std::mem::forget(schema);
+            assert_eq!(result, ffi_error::SUCCESS);
+            
+            let engine = &*(engine_ptr as *mut ZenithEngine);
+            let buffer = engine.get_ring_buffer();
+            assert_eq!(buffer.len(), 5);
+            let first = buffer.pop().unwrap();
+            assert_eq!(first.header.source_id, 7);
+            assert_eq!(first.header.seq_no, 100);
+            
+            zenith_free(engine_ptr);
+        }
+    }
+    
+    #[test]
+    fn test_zenith_publish_batches_assigns_sequence_numbers() {
+        use arrow::array::{Array, Int32Array, StructArray};
+        use arrow::datatypes::{DataType, Field};
+        use std::sync::Arc;
+        
+        let engine = ZenithEngine::new(16).unwrap();
+        let engine_ptr = Box::into_raw(Box::new(engine)) as *mut c_void;
+        
+        let mut arrays = Vec::new();
+        let mut schemas = Vec::new();
+        for i in 0..3 {
+            let values: arrow::array::ArrayRef = Arc::new(Int32Array::from(vec![i; 4]));
+            let struct_array = StructArray::from(vec![
+                (Arc::new(Field::new("value", DataType::Int32, false)), values),
+            ]);
+            let (array, schema) = arrow::ffi::to_ffi(&struct_array.to_data()).unwrap();
+            arrays.push(array);
+            schemas.push(schema);
+        }
+        
+        unsafe {
+            let result = zenith_publish_batches(
+                engine_ptr, arrays.as_mut_ptr(), schemas.as_mut_ptr(), 3, 2, 10);
+            // Ownership moved into Rust; do not release the originals twice
+            arrays.set_len(0);
+            schemas.set_len(0);
+            assert_eq!(result, ffi_error::SUCCESS);
+            
+            let engine = &*(engine_ptr as *mut ZenithEngine);
+            let buffer = engine.get_ring_buffer();
+            assert_eq!(buffer.len(), 3);
+            for seq_no in 10..13 {
+                let event = buffer.pop().unwrap();
+                assert_eq!(event.header.source_id, 2);
+                assert_eq!(event.header.seq_no, seq_no);
+            }
+            
+            assert_eq!(
+                zenith_publish_batches(engine_ptr, std::ptr::null_mut(), std::ptr::null_mut(), 0, 0, 0),
+                ffi_error::NULL_POINTER
+            );
+            
+            zenith_free(engine_ptr);
+        }
+    }
+    
+    #[test]
+    fn test_zenith_prepare_and_publish_prepared() {
+        use arrow::array::{Array, Int32Array, StructArray};
+        use arrow::datatypes::{DataType, Field};
+        use std::sync::Arc;
+        
+        let engine = ZenithEngine::new(16).unwrap();
+        let engine_ptr = Box::into_raw(Box::new(engine)) as *mut c_void;
+        
+        let values: arrow::array::ArrayRef = Arc::new(Int32Array::from(vec![1, 2, 3]));
+        let struct_array = StructArray::from(vec![
+            (Arc::new(Field::new("value", DataType::Int32, false)), values),
+        ]);
+        let (mut array, mut schema) = arrow::ffi::to_ffi(&struct_array.to_data()).unwrap();
+        
+        unsafe {
+            let prepared = zenith_prepare(&mut array, &mut schema);
+            std::mem::forget(array);
+            std::mem::forget(schema);
+            assert!(!prepared.is_null());
+            
+            for seq_no in 0..3 {
+                assert_eq!(zenith_publish_prepared(engine_ptr, prepared, 1, seq_no),
+                    ffi_error::SUCCESS);
+            }
+            assert_eq!(zenith_publish_prepared(engine_ptr, std::ptr::null(), 1, 0),
+                ffi_error::NULL_POINTER);
+            
+            zenith_prepared_free(prepared);
+            
+            // Published events outlive the prepared handle
+            let engine = &*(engine_ptr as *mut ZenithEngine);
+            let event = engine.get_ring_buffer().pop().unwrap();
+            assert_eq!(event.payload.unwrap().num_rows(), 3);
+            
+            zenith_free(engine_ptr);
+        }
+    }
+    
     #[test]
     fn test_zenith_load_plugin_null_pointers() {
         unsafe {
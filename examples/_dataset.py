@@ -0,0 +1,96 @@
+"""
+Shared synthetic datasets for the examples.
+
+Datasets are generated once and cached under ``examples/data/`` as
+uncompressed Arrow IPC files, so every example (and every later run)
+memory-maps the same file instead of regenerating and re-encoding it.
+"""
+
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def create_sample_dataset(
+    path: Union[str, Path],
+    num_samples: int = 10000,
+    num_features: int = 10,
+    format: str = 'feather',
+):
+    """
+    Create a synthetic binary classification dataset.
+    
+    format='feather' writes an uncompressed Arrow IPC file that can be
+    memory-mapped back with no deserialization; 'parquet' is smaller on disk.
+    """
+    print(f"Creating sample dataset with {num_samples} samples...")
+    
+    # Generate synthetic classification data
+    rng = np.random.default_rng(42)
+    
+    # Features: random floats per sample, drawn directly as float32
+    features = rng.standard_normal((num_samples, num_features), dtype=np.float32)
+    
+    # Labels: binary classification
+    labels = (features[:, 0] + features[:, 1] > 0).astype(np.int64)
+    
+    # Create table (features wrap the contiguous float32 buffer, no per-row lists)
+    table = pa.Table.from_pydict({
+        'features': pa.FixedSizeListArray.from_arrays(
+            pa.array(features.reshape(-1)), num_features
+        ),
+        'label': pa.array(labels),
+    })
+    
+    if format == 'feather':
+        with pa.OSFile(str(path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    elif format == 'parquet':
+        pq.write_table(table, path)
+    else:
+        raise ValueError(f"Unsupported dataset format: {format}")
+    print(f"Dataset saved to: {path}")
+    return path
+
+
+def load_dataset(path: Union[str, Path]) -> pa.Table:
+    """Load a dataset written by create_sample_dataset."""
+    if str(path).endswith('.parquet'):
+        # pre_buffer coalesces column-chunk reads so IO overlaps decoding
+        with pa.memory_map(str(path), 'r') as source:
+            return pq.ParquetFile(source, pre_buffer=True).read(
+                columns=['features', 'label'], use_threads=True
+            )
+    
+    # Arrow IPC: buffers are mapped straight from the page cache
+    with pa.memory_map(str(path), 'r') as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def get_classification(
+    n: int = 10000,
+    d: int = 10,
+    path: Optional[Union[str, Path]] = None,
+) -> pa.Table:
+    """
+    Return the shared classification dataset, generating it on first use.
+    
+    Args:
+        n: Number of samples
+        d: Number of features per sample
+        path: Cache file (defaults to data/classification_{n}x{d}.arrow)
+    """
+    if path is None:
+        DATA_DIR.mkdir(exist_ok=True)
+        path = DATA_DIR / f"classification_{n}x{d}.arrow"
+    
+    if not Path(path).exists():
+        create_sample_dataset(path, num_samples=n, num_features=d)
+    
+    return load_dataset(path)
@@ -0,0 +1,36 @@
+"""
+Development import shim for the examples.
+
+Binds the in-tree ``zenith`` package from ``sdk-python/`` directly,
+without prepending to ``sys.path``. When zenith-ai is installed
+(``pip install -e ./sdk-python``) the installed package is used and
+this module does nothing.
+
+Usage (first import in an example script):
+
+    import _setup  # noqa: F401
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+SDK_PACKAGE_DIR = Path(__file__).resolve().parent.parent / "sdk-python" / "zenith"
+
+
+def bind_zenith() -> None:
+    """Register sdk-python/zenith as the top-level ``zenith`` package."""
+    if "zenith" in sys.modules or importlib.util.find_spec("zenith") is not None:
+        return
+    
+    spec = importlib.util.spec_from_file_location(
+        "zenith",
+        SDK_PACKAGE_DIR / "__init__.py",
+        submodule_search_locations=[str(SDK_PACKAGE_DIR)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["zenith"] = module
+    spec.loader.exec_module(module)
+
+
+bind_zenith()
@@ -9,11 +9,7 @@ Requirements:
     pip install zenith-ai[torch] pyarrow numpy
 """
 
-import os
-import sys
-
-# Add sdk-python to path for development
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'sdk-python'))
+import _setup  # noqa: F401  (binds the in-tree zenith package for development)
 
 try:
     import torch
@@ -23,35 +19,7 @@ except ImportError:
     TORCH_AVAILABLE = False
     print("[WARNING] PyTorch not installed. Install with: pip install torch")
 
-import pyarrow as pa
-import pyarrow.parquet as pq
-import numpy as np
-from pathlib import Path
-
-
-def create_sample_dataset(path: str, num_samples: int = 10000):
-    """Create a sample parquet dataset for demonstration."""
-    print(f"Creating sample dataset with {num_samples} samples...")
-    
-    # Generate synthetic classification data
-    np.random.seed(42)
-    
-    # Features: 10 random floats per sample
-    features = np.random.randn(num_samples, 10).astype(np.float32)
-    
-    # Labels: binary classification
-    labels = (features[:, 0] + features[:, 1] > 0).astype(np.int64)
-    
-    # Create table
-    table = pa.Table.from_pydict({
-        'features': [features[i].tolist() for i in range(num_samples)],
-        'label': labels.tolist(),
-    })
-    
-    # Save to parquet
-    pq.write_table(table, path)
-    print(f"Dataset saved to: {path}")
-    return path
+from _dataset import get_classification
 
 
 def main():
@@ -64,13 +32,8 @@ def main():
         print("Install with: pip install torch")
         return
     
-    # Create sample dataset
-    data_dir = Path(__file__).parent / "data"
-    data_dir.mkdir(exist_ok=True)
-    dataset_path = data_dir / "sample_train.parquet"
-    
-    if not dataset_path.exists():
-        create_sample_dataset(str(dataset_path))
+    # Create (or reuse) the shared sample dataset
+    table = get_classification(n=10000, d=10)
     
     print("\n[1] Setting up Zenith DataLoader...")
     
@@ -127,25 +90,22 @@ def main():
     """)
     
     # Show standard PyTorch comparison
-    print("\n[3] Standard PyTorch DataLoader (for comparison):")
-    
-    # Load data with PyArrow
-    table = pq.read_table(dataset_path)
-    features = np.array([row for row in table['features'].to_pylist()], dtype=np.float32)
-    labels = np.array(table['label'].to_pylist(), dtype=np.int64)
+    print("\n[3] Standard PyTorch in-memory training (for comparison):")
     
-    # Create PyTorch dataset
-    dataset = torch.utils.data.TensorDataset(
-        torch.from_numpy(features),
-        torch.from_numpy(labels)
+    # Columns of the memory-mapped Arrow table
+    feature_col = table.column('features').combine_chunks()
+    features = feature_col.flatten().to_numpy(zero_copy_only=True).reshape(
+        -1, feature_col.type.list_size
     )
+    labels = table.column('label').combine_chunks().to_numpy(zero_copy_only=True)
     
-    loader = torch.utils.data.DataLoader(
-        dataset,
-        batch_size=64,
-        shuffle=True,
-        num_workers=2
-    )
+    # The whole dataset fits in memory, so index tensors directly instead of
+    # paying DataLoader worker fork + pickle overhead per batch
+    features_t = torch.from_numpy(features)
+    labels_t = torch.from_numpy(labels)
+    num_samples = features_t.shape[0]
+    batch_size = 64
+    num_batches = (num_samples + batch_size - 1) // batch_size
     
     # Simple training demo
     model = nn.Sequential(
@@ -160,7 +120,10 @@ def main():
     print("    Training for 3 epochs...")
     for epoch in range(3):
         total_loss = 0
-        for batch_features, batch_labels in loader:
+        perm = torch.randperm(num_samples)
+        for start in range(0, num_samples, batch_size):
+            idx = perm[start:start + batch_size]
+            batch_features, batch_labels = features_t[idx], labels_t[idx]
             optimizer.zero_grad()
             outputs = model(batch_features)
             loss = criterion(outputs, batch_labels)
@@ -168,7 +131,7 @@ def main():
             optimizer.step()
             total_loss += loss.item()
         
-        avg_loss = total_loss / len(loader)
+        avg_loss = total_loss / num_batches
         print(f"    Epoch {epoch+1}: Loss = {avg_loss:.4f}")
     
     print("\n[4] Summary")
@@ -13,13 +13,25 @@ Author: Wahyu Ardiansyah
 Date: December 2025
 """
 
+import glob
+import io
 import os
+import re
 import sys
 import time
 import subprocess
 import json
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-# Colors for terminal output
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Colors for terminal output (off when piped or when NO_COLOR is set)
+USE_COLOR = sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+
 class Colors:
  GREEN = '\033[92m'
  YELLOW = '\033[93m'
@@ -28,6 +40,10 @@ class Colors:
  BOLD = '\033[1m'
  END = '\033[0m'
 
+if not USE_COLOR:
+ for _name in ('GREEN', 'YELLOW', 'RED', 'BLUE', 'BOLD', 'END'):
+ setattr(Colors, _name, '')
+
 def print_header(text):
  print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}")
  print(f"{Colors.BOLD}{Colors.BLUE} {text}{Colors.END}")
@@ -45,32 +61,130 @@ def print_error(text):
 def print_info(text):
  print(f"{Colors.BLUE}[i] {text}{Colors.END}")
 
-def run_command(cmd, cwd=None):
- """Run a command and return success status and output."""
+class ThreadOutput:
+ """Stdout proxy that buffers writes made from worker threads."""
+ def __init__(self, stream):
+ self.stream = stream
+ self.lock = threading.Lock()
+ self.local = threading.local()
+ 
+ def write(self, text):
+ buf = getattr(self.local, 'buffer', None)
+ return (buf if buf is not None else self.stream).write(text)
+ 
+ def flush(self):
+ if getattr(self.local, 'buffer', None) is None:
+ self.stream.flush()
+
+def run_buffered(output, name, test_func):
+ """Run a test with its output buffered, then print it in one piece."""
+ output.local.buffer = io.StringIO()
  try:
- result = subprocess.run(
- cmd,
- shell=True,
+ passed = test_func()
+ except Exception as e:
+ print_error(f"Test {name} crashed: {e}")
+ passed = False
+ finally:
+ text = output.local.buffer.getvalue()
+ output.local.buffer = None
+ with output.lock:
+ output.stream.write(text)
+ output.stream.flush()
+ return passed
+
+def run_command(argv, cwd=None, keep=None, tail=20, timeout=300):
+ """Run a command and return success status and output.
+ 
+ ``argv`` is executed directly (no shell) with stderr merged into stdout.
+ Output is read line by line as it is produced. When ``keep`` is given,
+ only lines matching that regex (plus the last ``tail`` lines, for error
+ context) are retained, so verbose commands run in constant memory.
+ """
+ kept = []
+ last = deque(maxlen=tail)
+ try:
+ proc = subprocess.Popen(
+ argv,
  cwd=cwd,
- capture_output=True,
+ stdout=subprocess.PIPE,
+ stderr=subprocess.STDOUT,
  text=True,
- timeout=300
+ bufsize=1
  )
- return result.returncode == 0, result.stdout, result.stderr
- except subprocess.TimeoutExpired:
- return False, "", "Command timed out"
  except Exception as e:
  return False, "", str(e)
+ 
+ deadline = time.monotonic() + timeout
+ killer = threading.Timer(timeout, proc.kill)
+ killer.start()
+ try:
+ with proc.stdout:
+ for line in proc.stdout:
+ if keep is None or keep.search(line):
+ kept.append(line)
+ else:
+ last.append(line)
+ returncode = proc.wait()
+ finally:
+ killer.cancel()
+ 
+ output = "".join(kept) + "".join(last)
+ if returncode != 0 and time.monotonic() >= deadline:
+ return False, output, "Command timed out"
+ return returncode == 0, output, ""
+
+WORKSPACE_CRATES = ["-p", "zenith-runtime-cpu", "-p", "zenith-runtime-gpu", "-p", "zenith-scheduler"]
+RUNTIME_INTEGRATION_TESTS = [
+ "integration_ring_buffer_throughput",
+ "integration_memory_pool_stress",
+ "integration_numa_discovery",
+]
+INTEGRATION_LINES = re.compile(
+ r'^test |^failures:|^ +\S+$|test result:|\[RING BUFFER\]|\[MEMORY POOL\]|\[NUMA\]'
+)
+THROUGHPUT_LINE = re.compile(r'Throughput.*$', re.M)
+MEMORY_POOL_LINES = re.compile(r'\[MEMORY POOL\].*$', re.M)
+NUMA_LINES = re.compile(r'\[NUMA\].*$', re.M)
+_integration_lock = threading.Lock()
+_integration_run = {}
+
+def run_cargo_tests(crate, tests, target="integration"):
+ """Run several tests of one cargo test target in a single invocation.
+ 
+ Returns a dict mapping each test name to whether it passed, and the
+ combined output.
+ """
+ success, stdout, stderr = run_command(
+ ["cargo", "test", "--release", "-p", crate, "--test", target,
+ "--", "--nocapture", "--test-threads=1", *tests],
+ cwd=PROJECT_ROOT,
+ keep=INTEGRATION_LINES
+ )
+ 
+ output = stdout + stderr
+ ran = set(re.findall(r'^test (\S+) \.\.\. ', output, re.M))
+ failures = re.search(r'^failures:\n((?: +\S+\n)+)', output, re.M)
+ failed = set(failures.group(1).split()) if failures else set()
+ return {name: name in ran and name not in failed for name in tests}, output
+
+def runtime_integration_results():
+ """Results of the shared zenith-runtime-cpu integration run."""
+ with _integration_lock:
+ if not _integration_run:
+ _integration_run['results'], _integration_run['output'] = run_cargo_tests(
+ "zenith-runtime-cpu", RUNTIME_INTEGRATION_TESTS
+ )
+ return _integration_run['results'], _integration_run['output']
 
 def test_rust_build():
  """Test 1: Verify Rust workspace builds."""
  print_header("Test 1: Rust Build Verification")
- 
- project_root = Path(__file__).parent.parent
- 
+# Build the test binaries rather than `cargo check`: the unit test step
+# reuses these artifacts, whereas check output would be thrown away
  success, stdout, stderr = run_command(
- "cargo check -p zenith-runtime-cpu -p zenith-runtime-gpu -p zenith-scheduler 2>&1",
- cwd=project_root
+ ["cargo", "test", "--no-run"] + WORKSPACE_CRATES,
+ cwd=PROJECT_ROOT,
+ keep=re.compile(r'^error')
  )
  
  if success:
@@ -78,18 +192,18 @@ def test_rust_build():
  return True
  else:
  print_error("Build failed")
- print(stderr[:500] if stderr else stdout[:500])
+ print(stderr or stdout)
  return False
 
 def test_unit_tests():
  """Test 2: Run unit tests."""
  print_header("Test 2: Unit Tests")
  
- project_root = Path(__file__).parent.parent
- 
  success, stdout, stderr = run_command(
- "cargo test -p zenith-runtime-cpu -p zenith-runtime-gpu -p zenith-scheduler 2>&1 | tail -40",
- cwd=project_root
+ ["cargo", "test"] + WORKSPACE_CRATES,
+ cwd=PROJECT_ROOT,
+ keep=re.compile(r'^test result:'),
+ tail=40
  )
  
  if "test result: ok" in stdout or "test result: ok" in stderr:
@@ -100,28 +214,21 @@ def test_unit_tests():
  return True
  else:
  print_error("Some tests failed")
- print(stdout[:500] if stdout else stderr[:500])
+ print(stdout or stderr)
  return False
 
 def test_ring_buffer_performance():
  """Test 3: Ring buffer performance benchmark."""
  print_header("Test 3: Ring Buffer Performance")
  
- project_root = Path(__file__).parent.parent
 # Run our integration test that measures throughput
- success, stdout, stderr = run_command(
- "cargo test integration_ring_buffer_throughput --release -p zenith-runtime-cpu -- --nocapture 2>&1",
- cwd=project_root
- )
- 
- output = stdout + stderr
+ results, output = runtime_integration_results()
  
- if "ok" in output and "M ops/sec" in output:
+ if results["integration_ring_buffer_throughput"] and "M ops/sec" in output:
 # Extract throughput
- for line in output.split('\n'):
- if "Throughput" in line:
- print_success(line.strip())
- break
+ match = THROUGHPUT_LINE.search(output)
+ if match:
+ print_success(match.group(0).strip())
  return True
  else:
  print_warning("Performance test skipped or failed")
@@ -132,19 +239,11 @@ def test_memory_pool():
  """Test 4: Memory pool stress test."""
  print_header("Test 4: Memory Pool Stress Test")
  
- project_root = Path(__file__).parent.parent
- 
- success, stdout, stderr = run_command(
- "cargo test integration_memory_pool_stress --release -p zenith-runtime-cpu -- --nocapture 2>&1",
- cwd=project_root
- )
- 
- output = stdout + stderr
+ results, output = runtime_integration_results()
  
- if "ok" in output:
- for line in output.split('\n'):
- if "[MEMORY POOL]" in line:
- print_success(line.strip())
+ if results["integration_memory_pool_stress"]:
+ for match in MEMORY_POOL_LINES.finditer(output):
+ print_success(match.group(0).strip())
  return True
  else:
  print_error("Memory pool test failed")
@@ -154,19 +253,11 @@ def test_numa_discovery():
  """Test 5: NUMA topology discovery."""
  print_header("Test 5: NUMA Topology Discovery")
  
- project_root = Path(__file__).parent.parent
- 
- success, stdout, stderr = run_command(
- "cargo test integration_numa_discovery -p zenith-runtime-cpu -- --nocapture 2>&1",
- cwd=project_root
- )
- 
- output = stdout + stderr
+ results, output = runtime_integration_results()
  
- if "ok" in output:
- for line in output.split('\n'):
- if "[NUMA]" in line:
- print_success(line.strip())
+ if results["integration_numa_discovery"]:
+ for match in NUMA_LINES.finditer(output):
+ print_success(match.group(0).strip())
  return True
  else:
  print_warning("NUMA discovery may have limited info on this system")
@@ -176,11 +267,9 @@ def test_state_persistence():
  """Test 6: State persistence."""
  print_header("Test 6: State Persistence")
  
- project_root = Path(__file__).parent.parent
- 
  success, stdout, stderr = run_command(
- "cargo test state::tests -p zenith-scheduler -- --nocapture 2>&1",
- cwd=project_root
+ ["cargo", "test", "state::tests", "-p", "zenith-scheduler", "--", "--nocapture"],
+ cwd=PROJECT_ROOT
  )
  
  output = stdout + stderr
@@ -193,28 +282,63 @@ def test_state_persistence():
  print_error("State persistence test failed")
  return False
 
+MEMINFO_FIELDS = re.compile(r'^(MemTotal|MemFree):\s+(\d+)', re.M)
+
+@lru_cache(maxsize=None)
+def numa_topology():
+ """NUMA node id -> CPU list, discovered the same way as NumaTopology::detect."""
+ nodes = {}
+ for node_path in glob.glob('/sys/devices/system/node/node[0-9]*'):
+ node_id = os.path.basename(node_path)[len('node'):]
+ if not node_id.isdigit():
+ continue
+ try:
+ with open(os.path.join(node_path, 'cpulist')) as f:
+ cpus = f.read().strip()
+ except OSError:
+ cpus = ""
+ nodes[int(node_id)] = cpus
+ return dict(sorted(nodes.items()))
+
+def cgroup_cpu_quota():
+ """CPU quota from cgroup v2 `cpu.max` in cores, or None when unlimited."""
+ try:
+ quota, period = Path('/sys/fs/cgroup/cpu.max').read_text().split()[:2]
+ except (OSError, ValueError):
+ return None
+ if quota == 'max':
+ return None
+ return int(quota) / int(period)
+
 def check_system_info():
  """Display system information."""
  print_header("System Information")
-# CPU info
+# CPU info: the affinity mask is what the runtime's thread pools can use
  cpu_count = os.cpu_count()
- print_info(f"CPU cores: {cpu_count}")
+ try:
+ usable = len(os.sched_getaffinity(0))
+ except AttributeError:
+ usable = cpu_count
+ print_info(f"CPU cores (usable): {usable}")
+ print_info(f"CPU cores (system): {cpu_count}")
+ quota = cgroup_cpu_quota()
+ if quota is not None:
+ print_info(f"cgroup CPU quota: {quota:.2f} cores")
 # Memory info
  try:
- with open('/proc/meminfo', 'r') as f:
- meminfo = f.read()
- for line in meminfo.split('\n'):
- if 'MemTotal' in line or 'MemFree' in line:
- print_info(line.strip())
- except:
+ meminfo = Path('/proc/meminfo').read_text()
+ for key, kb in MEMINFO_FIELDS.findall(meminfo):
+ print_info(f"{key}: {int(kb) // 1024} MiB")
+ except OSError:
  print_warning("Could not read memory info")
 # NUMA info
- numa_path = Path('/sys/devices/system/node')
- if numa_path.exists():
- nodes = [d for d in numa_path.iterdir() if d.name.startswith('node')]
+ nodes = numa_topology()
+ if nodes:
  print_info(f"NUMA nodes: {len(nodes)}")
+ for node_id, cpus in nodes.items():
+ print_info(f" Node {node_id}: CPUs {cpus}")
 # GPU info
- success, stdout, _ = run_command("nvidia-smi --query-gpu=name --format=csv,noheader 2>/dev/null")
+ success, stdout, _ = run_command(["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"])
  if success and stdout.strip():
  gpus = stdout.strip().split('\n')
  print_info(f"GPUs detected: {len(gpus)}")
@@ -239,8 +363,8 @@ def main():
  
  check_system_info()
  
- results = []
-# Run all tests
+ results = {}
+# Run all tests; they are independent cargo invocations, so overlap them
  tests = [
  ("Rust Build", test_rust_build),
  ("Unit Tests", test_unit_tests),
@@ -250,26 +374,30 @@ def main():
  ("State Persistence", test_state_persistence),
  ]
  
- for name, test_func in tests:
+ sys.stdout = output = ThreadOutput(sys.stdout)
  try:
- passed = test_func()
- results.append((name, passed))
- except Exception as e:
- print_error(f"Test {name} crashed: {e}")
- results.append((name, False))
+ with ThreadPoolExecutor(max_workers=min(len(tests), os.cpu_count() or 1)) as ex:
+ futures = {ex.submit(run_buffered, output, name, test_func): name for name, test_func in tests}
+ for future in as_completed(futures):
+ results[futures[future]] = future.result()
+ finally:
+ sys.stdout = output.stream
 # Summary
  print_header("Test Results Summary")
  
- passed = sum(1 for _, p in results if p)
+ passed = sum(1 for p in results.values() if p)
  total = len(results)
  
- for name, success in results:
- if success:
- print_success(f"{name}: PASSED")
+# Assemble the summary and write it in one go
+ out = []
+ for name, _ in tests:
+ if results[name]:
+ out.append(f"{Colors.GREEN}[] {name}: PASSED{Colors.END}\n")
  else:
- print_error(f"{name}: FAILED")
- 
- print(f"\n{Colors.BOLD}Total: {passed}/{total} tests passed{Colors.END}")
+ out.append(f"{Colors.RED}[] {name}: FAILED{Colors.END}\n")
+ out.append(f"\n{Colors.BOLD}Total: {passed}/{total} tests passed{Colors.END}\n")
+ sys.stdout.write(''.join(out))
+ sys.stdout.flush()
  
  if passed == total:
  print(f"\n{Colors.GREEN}{Colors.BOLD}[OK] ALL TESTS PASSED - ZENITH IS WORKING!{Colors.END}\n")
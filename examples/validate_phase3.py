@@ -6,11 +6,19 @@ Phase 3 Validation Script
 Validates all Phase 3 components work correctly.
 """
 
+import io
 import subprocess
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Colors for terminal output (off when piped or when NO_COLOR is set)
+USE_COLOR = sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+
 class Colors:
  GREEN = '\033[92m'
  YELLOW = '\033[93m'
@@ -19,26 +27,67 @@ class Colors:
  BOLD = '\033[1m'
  END = '\033[0m'
 
+if not USE_COLOR:
+ for _name in ('GREEN', 'YELLOW', 'RED', 'BLUE', 'BOLD', 'END'):
+ setattr(Colors, _name, '')
+
 def print_header(text):
  print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}")
  print(f"{Colors.BOLD}{Colors.BLUE} {text}{Colors.END}")
  print(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}\n")
 
+class ThreadOutput:
+ """Stdout proxy that buffers writes made from worker threads."""
+ def __init__(self, stream):
+ self.stream = stream
+ self.lock = threading.Lock()
+ self.local = threading.local()
+ 
+ def write(self, text):
+ buf = getattr(self.local, 'buffer', None)
+ return (buf if buf is not None else self.stream).write(text)
+ 
+ def flush(self):
+ if getattr(self.local, 'buffer', None) is None:
+ self.stream.flush()
+
+def run_buffered(output, name, test_fn):
+ """Run a validation with its output buffered, then print it in one piece."""
+ output.local.buffer = io.StringIO()
+ try:
+ passed = test_fn()
+ except Exception as e:
+ print(f"{Colors.RED}[] {name} crashed: {e}{Colors.END}")
+ passed = False
+ finally:
+ text = output.local.buffer.getvalue()
+ output.local.buffer = None
+ with output.lock:
+ output.stream.write(text)
+ output.stream.flush()
+ return passed
+
 def run_cmd(cmd, cwd=None):
+ """Run an argv list without a shell; stderr is merged into stdout."""
  try:
- result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True, timeout=120)
- return result.returncode == 0, result.stdout, result.stderr
+ result = subprocess.run(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=120)
+ return result.returncode == 0, result.stdout, ""
  except Exception as e:
  return False, "", str(e)
 
+def load_yaml(path):
+ """Parse a YAML file, using libyaml's C loader when it is available."""
+ import yaml
+ loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+ return yaml.load(path.read_bytes(), Loader=loader)
+
 def validate_circuit_breaker():
  """Test circuit breaker pattern"""
  print_header("Phase 3A: Circuit Breaker")
  
- project = Path(__file__).parent.parent
  success, out, err = run_cmd(
- "cargo test circuit_breaker --lib -p zenith-runtime-cpu -- --nocapture 2>&1",
- cwd=project
+ ["cargo", "test", "circuit_breaker", "--lib", "-p", "zenith-runtime-cpu", "--", "--nocapture"],
+ cwd=PROJECT_ROOT
  )
  
  output = out + err
@@ -56,10 +105,9 @@ def validate_health_checks():
  """Test health check system"""
  print_header("Phase 3A: Health Checks")
  
- project = Path(__file__).parent.parent
  success, out, err = run_cmd(
- "cargo test health --lib -p zenith-runtime-cpu -- --nocapture 2>&1",
- cwd=project
+ ["cargo", "test", "health", "--lib", "-p", "zenith-runtime-cpu", "--", "--nocapture"],
+ cwd=PROJECT_ROOT
  )
  
  output = out + err
@@ -76,8 +124,7 @@ def validate_helm_chart():
  """Validate Helm chart structure"""
  print_header("Phase 3B: Kubernetes Helm Chart")
  
- project = Path(__file__).parent.parent
- helm_dir = project / "deploy" / "helm" / "zenith"
+ helm_dir = PROJECT_ROOT / "deploy" / "helm" / "zenith"
  
  required_files = [
  "Chart.yaml",
@@ -86,19 +133,26 @@ def validate_helm_chart():
  "templates/scheduler-deployment.yaml"
  ]
  
+# One directory listing per folder instead of a stat() per file
+ present = set()
+ for sub in {os.path.dirname(f) for f in required_files}:
+ try:
+ with os.scandir(helm_dir / sub) as entries:
+ present.update(os.path.join(sub, e.name) for e in entries if e.is_file())
+ except OSError:
+ pass
+ 
  all_exist = True
  for f in required_files:
- path = helm_dir / f
- if path.exists():
+ if f in present:
  print(f"{Colors.GREEN}[] {f} exists{Colors.END}")
  else:
  print(f"{Colors.RED}[] {f} missing{Colors.END}")
  all_exist = False
 # Validate YAML syntax
- import yaml
  for f in ["Chart.yaml", "values.yaml"]:
  try:
- yaml.safe_load(open(helm_dir / f))
+ load_yaml(helm_dir / f)
  print(f"{Colors.GREEN}[] {f} is valid YAML{Colors.END}")
  except Exception as e:
  print(f"{Colors.RED}[] {f} has invalid YAML: {e}{Colors.END}")
@@ -110,8 +164,7 @@ def validate_dockerfile():
  """Validate Dockerfile"""
  print_header("Phase 3B: Dockerfile")
  
- project = Path(__file__).parent.parent
- dockerfile = project / "Dockerfile"
+ dockerfile = PROJECT_ROOT / "Dockerfile"
  
  if not dockerfile.exists():
  print(f"{Colors.RED}[] Dockerfile not found{Colors.END}")
@@ -140,16 +193,14 @@ def validate_openapi():
  """Validate OpenAPI spec"""
  print_header("Phase 3D: OpenAPI Documentation")
  
- project = Path(__file__).parent.parent
- openapi = project / "docs" / "api" / "openapi.yaml"
+ openapi = PROJECT_ROOT / "docs" / "api" / "openapi.yaml"
  
  if not openapi.exists():
  print(f"{Colors.RED}[] OpenAPI spec not found{Colors.END}")
  return False
  
- import yaml
  try:
- spec = yaml.safe_load(open(openapi))
+ spec = load_yaml(openapi)
  
  print(f"{Colors.GREEN}[] OpenAPI spec is valid YAML{Colors.END}")
  print(f" - Version: {spec.get('openapi', 'unknown')}")
@@ -170,16 +221,14 @@ def validate_ci_workflow():
  """Validate GitHub Actions workflow"""
  print_header("Phase 3E: CI/CD Pipeline")
  
- project = Path(__file__).parent.parent
- workflow = project / ".github" / "workflows" / "ci.yml"
+ workflow = PROJECT_ROOT / ".github" / "workflows" / "ci.yml"
  
  if not workflow.exists():
  print(f"{Colors.RED}[] CI workflow not found{Colors.END}")
  return False
  
- import yaml
  try:
- spec = yaml.safe_load(open(workflow))
+ spec = load_yaml(workflow)
  
  print(f"{Colors.GREEN}[] CI workflow is valid YAML{Colors.END}")
  
@@ -205,7 +254,7 @@ def main():
 {Colors.END}
 """)
  
- results = []
+ results = {}
  
  tests = [
  ("Circuit Breaker", validate_circuit_breaker),
@@ -216,26 +265,30 @@ def main():
  ("CI/CD", validate_ci_workflow),
  ]
  
- for name, test_fn in tests:
+ sys.stdout = output = ThreadOutput(sys.stdout)
  try:
- passed = test_fn()
- results.append((name, passed))
- except Exception as e:
- print(f"{Colors.RED}[] {name} crashed: {e}{Colors.END}")
- results.append((name, False))
+ with ThreadPoolExecutor(max_workers=min(len(tests), os.cpu_count() or 1)) as ex:
+ futures = {ex.submit(run_buffered, output, name, test_fn): name for name, test_fn in tests}
+ for future in as_completed(futures):
+ results[futures[future]] = future.result()
+ finally:
+ sys.stdout = output.stream
 # Summary
  print_header("Validation Summary")
  
- passed = sum(1 for _, p in results if p)
+ passed = sum(1 for p in results.values() if p)
  total = len(results)
  
- for name, success in results:
- if success:
- print(f"{Colors.GREEN}[] {name}: PASSED{Colors.END}")
+# Assemble the summary and write it in one go
+ out = []
+ for name, _ in tests:
+ if results[name]:
+ out.append(f"{Colors.GREEN}[] {name}: PASSED{Colors.END}\n")
  else:
- print(f"{Colors.RED}[] {name}: FAILED{Colors.END}")
- 
- print(f"\n{Colors.BOLD}Total: {passed}/{total} validations passed{Colors.END}")
+ out.append(f"{Colors.RED}[] {name}: FAILED{Colors.END}\n")
+ out.append(f"\n{Colors.BOLD}Total: {passed}/{total} validations passed{Colors.END}\n")
+ sys.stdout.write(''.join(out))
+ sys.stdout.flush()
  
  if passed == total:
  print(f"\n{Colors.GREEN}{Colors.BOLD}[OK] ALL PHASE 3 COMPONENTS VALIDATED!{Colors.END}\n")
@@ -7,11 +7,13 @@ This script validates that the Turbo Engine components work correctly
 in real-world scenarios with actual data processing.
 """
 
+import re
 import subprocess
 import sys
 import time
 import random
-import struct
+
+TEST_SUMMARY = re.compile(r'^.*\bpassed\b.*\bfailed\b.*$', re.M)
 
 def print_header(text):
     print(f"\n{'='*60}")
@@ -34,9 +36,8 @@ def run_rust_tests():
     # Count tests
     if "test result: ok" in output:
         # Find number of passed tests
-        for line in output.split('\n'):
-            if "passed" in line and "failed" in line:
-                print(f"[OK] {line.strip()}")
+        for match in TEST_SUMMARY.finditer(output):
+            print(f"[OK] {match.group(0).strip()}")
         return True
     else:
         print(f"[FAIL] Tests failed")
@@ -44,86 +45,90 @@ def run_rust_tests():
         return False
 
 def test_simd_operations():
-    """Test SIMD operations with Python simulation"""
-    print_header("2. Testing SIMD Operations (Python Simulation)")
+    """Test SIMD operations with a NumPy reference implementation"""
+    print_header("2. Testing SIMD Operations (NumPy Reference)")
     
-    import array
+    import numpy as np
     
     # Test normalize
-    data = [float(i) for i in range(1000)]
-    mean = sum(data) / len(data)
-    std = (sum((x - mean)**2 for x in data) / len(data)) ** 0.5
-    
-    normalized = [(x - mean) / std for x in data]
+    data = np.arange(1000, dtype=np.float32)
+    normalized = (data - data.mean()) / data.std()
     
-    new_mean = sum(normalized) / len(normalized)
-    new_std = (sum((x - new_mean)**2 for x in normalized) / len(normalized)) ** 0.5
+    new_mean = normalized.mean()
+    new_std = normalized.std()
     
     print(f"[OK] Normalize: mean={new_mean:.6f} (should be ~0), std={new_std:.6f} (should be ~1)")
     
     # Test ReLU
-    data_relu = [-2.0, -1.0, 0.0, 1.0, 2.0]
-    relu_result = [max(0, x) for x in data_relu]
-    expected = [0.0, 0.0, 0.0, 1.0, 2.0]
-    assert relu_result == expected, f"ReLU failed: {relu_result}"
-    print(f"[OK] ReLU: {data_relu} -> {relu_result}")
-    
-    # Test Softmax
-    import math
-    data_softmax = [1.0, 2.0, 3.0, 4.0]
-    max_val = max(data_softmax)
-    exp_vals = [math.exp(x - max_val) for x in data_softmax]
-    sum_exp = sum(exp_vals)
-    softmax_result = [x / sum_exp for x in exp_vals]
-    
-    assert abs(sum(softmax_result) - 1.0) < 0.0001, "Softmax sum != 1"
-    print(f"[OK] Softmax: sum={sum(softmax_result):.6f} (should be 1.0)")
+    data_relu = np.array([-2.0, -1.0, 0.0, 1.0, 2.0], dtype=np.float32)
+    relu_result = np.maximum(data_relu, 0.0)
+    expected = np.array([0.0, 0.0, 0.0, 1.0, 2.0], dtype=np.float32)
+    np.testing.assert_allclose(relu_result, expected, err_msg="ReLU failed")
+    print(f"[OK] ReLU: {data_relu.tolist()} -> {relu_result.tolist()}")
+    
+    # Test Softmax: FP32 result against a float64 reference, as the Rust SIMD path computes in FP32
+    data_softmax = np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32)
+    softmax_result = np.exp(data_softmax - data_softmax.max())
+    softmax_result /= softmax_result.sum()
+    
+    data64 = data_softmax.astype(np.float64)
+    e = np.exp(data64 - data64.max())
+    reference = (e / e.sum()).astype(np.float32)
+    
+    np.testing.assert_allclose(reference.sum(), 1.0, atol=1e-6, err_msg="Softmax sum != 1")
+    np.testing.assert_allclose(softmax_result, reference, rtol=1e-6, err_msg="Softmax mismatch")
+    print(f"[OK] Softmax: sum={softmax_result.sum():.6f} (should be 1.0)")
     
     return True
 
 def test_prefetch_simulation():
-    """Test prefetch pipeline concept with Python threads"""
+    """Test prefetch pipeline concept with a bounded SPSC ring buffer"""
     print_header("3. Testing Prefetch Pipeline (Python Simulation)")
     
     import threading
-    import queue
     
-    buffer_queue = queue.Queue(maxsize=4)
+    capacity = 4
+    num_buffers = 20
+    ring = [None] * capacity
+    # One semaphore counts free slots, the other filled slots (SPSC ring)
+    slots = threading.Semaphore(capacity)
+    items = threading.Semaphore(0)
     produced = [0]
     consumed = [0]
-    stop_flag = [False]
     
     def producer():
-        for i in range(20):
-            if stop_flag[0]:
-                break
+        head = 0
+        for i in range(num_buffers):
             data = [random.random() for _ in range(1000)]
-            buffer_queue.put(data)
+            slots.acquire()
+            ring[head] = data
+            head = (head + 1) % capacity
             produced[0] += 1
-            time.sleep(0.01)
+            items.release()
     
     def consumer():
-        while not stop_flag[0] or not buffer_queue.empty():
-            try:
-                data = buffer_queue.get(timeout=0.1)
-                consumed[0] += 1
-                # Simulate processing
-                _ = sum(data)
-            except queue.Empty:
-                pass
+        tail = 0
+        for _ in range(num_buffers):
+            items.acquire()
+            data = ring[tail]
+            ring[tail] = None
+            tail = (tail + 1) % capacity
+            slots.release()
+            consumed[0] += 1
+            # Simulate processing
+            _ = sum(data)
     
     # Start threads
     prod_thread = threading.Thread(target=producer)
     cons_thread = threading.Thread(target=consumer)
     
-    start = time.time()
+    start = time.perf_counter()
     prod_thread.start()
     cons_thread.start()
     
     prod_thread.join()
-    stop_flag[0] = True
     cons_thread.join()
-    elapsed = time.time() - start
+    elapsed = time.perf_counter() - start
     
     print(f"[OK] Produced: {produced[0]} buffers")
     print(f"[OK] Consumed: {consumed[0]} buffers")
@@ -136,59 +141,51 @@ def test_mixed_precision():
     """Test FP16/BF16 conversion"""
     print_header("4. Testing Mixed Precision Conversion")
     
-    import struct
+    import numpy as np
     
-    def float32_to_bfloat16(val):
-        """Convert f32 to bf16 (truncate lower 16 bits)"""
-        bits = struct.unpack('I', struct.pack('f', val))[0]
-        bf16_bits = bits >> 16
-        return bf16_bits
+    def float32_to_bfloat16(values):
+        """Convert f32 array to bf16 bits (truncate lower 16 bits)"""
+        return (values.view(np.uint32) >> 16).astype(np.uint16)
     
     def bfloat16_to_float32(bf16_bits):
-        """Convert bf16 back to f32"""
-        bits = bf16_bits << 16
-        return struct.unpack('f', struct.pack('I', bits))[0]
+        """Convert bf16 bits back to f32 array"""
+        return (bf16_bits.astype(np.uint32) << 16).view(np.float32)
     
-    test_values = [0.0, 1.0, -1.0, 3.14159, 100.0, 0.001]
+    test_values = np.array([0.0, 1.0, -1.0, 3.14159, 100.0, 0.001], dtype=np.float32)
     
-    for val in test_values:
-        bf16 = float32_to_bfloat16(val)
-        back = bfloat16_to_float32(bf16)
-        error = abs(val - back) / max(abs(val), 1e-6)
+    bf16 = float32_to_bfloat16(test_values)
+    back = bfloat16_to_float32(bf16)
+    errors = np.abs(test_values - back) / np.maximum(np.abs(test_values), 1e-6)
+    
+    for val, bits, restored, error in zip(test_values.tolist(), bf16.tolist(), back.tolist(), errors.tolist()):
         status = "OK" if error < 0.01 else "WARN"
-        print(f"[{status}] BF16: {val} -> 0x{bf16:04x} -> {back:.6f} (error: {error:.4%})")
+        print(f"[{status}] BF16: {val:g} -> 0x{bits:04x} -> {restored:.6f} (error: {error:.4%})")
     
     return True
 
 def test_throughput_benchmark():
-    """Benchmark raw Python throughput vs what Rust can achieve"""
+    """Benchmark vectorized NumPy throughput as a reference for the Rust SIMD path"""
     print_header("5. Throughput Benchmark")
     
-    # Simulate data processing
-    data_size = 1_000_000
-    data = [random.random() for _ in range(data_size)]
-    
-    # Pure Python sum
-    start = time.time()
-    for _ in range(10):
-        result = sum(data)
-    elapsed = time.time() - start
-    python_throughput = (10 * data_size) / elapsed
+    import numpy as np
     
-    print(f"[INFO] Python sum: {python_throughput/1e6:.2f} M elements/sec")
+    # Simulate data processing on a contiguous float32 buffer
+    data_size = 1_000_000
+    data = np.random.default_rng(0).random(data_size, dtype=np.float32)
     
-    # With list comprehension (slightly faster)
-    start = time.time()
+    # Vectorized reduction (SIMD inside NumPy's C loops)
+    start = time.perf_counter()
     for _ in range(10):
-        result = sum(x for x in data)
-    elapsed = time.time() - start
-    list_comp_throughput = (10 * data_size) / elapsed
+        result = data.sum()
+    elapsed = time.perf_counter() - start
+    numpy_throughput = (10 * data_size) / elapsed
+    bandwidth = (10 * data.nbytes) / elapsed
     
-    print(f"[INFO] Python list comp: {list_comp_throughput/1e6:.2f} M elements/sec")
+    print(f"[INFO] NumPy sum: {numpy_throughput/1e6:.2f} M elements/sec")
+    print(f"[INFO] NumPy bandwidth: {bandwidth/1e9:.2f} GB/s")
     
     # Note about Rust
-    print(f"\n[NOTE] Rust SIMD can achieve 10-100x higher throughput")
-    print(f"[NOTE] Expected Rust: {python_throughput*50/1e6:.0f}-{python_throughput*100/1e6:.0f} M elements/sec")
+    print(f"\n[NOTE] Rust SIMD kernels should match or exceed this reference")
     
     return True
 
@@ -282,11 +279,11 @@ def main():
     passed_count = sum(1 for _, p in results if p)
     total = len(results)
     
-    for name, passed in results:
-        status = "[PASS]" if passed else "[FAIL]"
-        print(f"  {status} {name}")
-    
-    print(f"\n  Total: {passed_count}/{total} validations passed")
+    # Assemble the summary and write it in one go
+    out = [f"  {'[PASS]' if passed else '[FAIL]'} {name}\n" for name, passed in results]
+    out.append(f"\n  Total: {passed_count}/{total} validations passed\n")
+    sys.stdout.write(''.join(out))
+    sys.stdout.flush()
     
     if passed_count == total:
         print("\n  ✅ ALL VALIDATIONS PASSED!")
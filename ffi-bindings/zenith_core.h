@@ -31,6 +31,36 @@ int32_t zenith_publish(
     uint64_t seq_no
 );
 
+// Publish one batch under seq_start..seq_start+count in a single call
+int32_t zenith_publish_many(
+    ZenithEngine engine,
+    void* array_ptr,
+    void* schema_ptr,
+    uint32_t source_id,
+    uint64_t seq_start,
+    uint64_t count
+);
+
+// Publish `count` batches from contiguous struct arrays; batch i gets seq_start + i
+int32_t zenith_publish_batches(
+    ZenithEngine engine,
+    void* arrays_ptr,
+    void* schemas_ptr,
+    size_t count,
+    uint32_t source_id,
+    uint64_t seq_start
+);
+
+// Prepared batches: import once, publish many times
+void* zenith_prepare(void* array_ptr, void* schema_ptr);
+int32_t zenith_publish_prepared(
+    ZenithEngine engine,
+    const void* prepared,
+    uint32_t source_id,
+    uint64_t seq_no
+);
+void zenith_prepared_free(void* prepared);
+
 // Plugin management
 int32_t zenith_load_plugin(
     ZenithEngine engine,
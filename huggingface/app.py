@@ -4,19 +4,22 @@ Zenith AI - Hugging Face Spaces Demo
 This is an interactive demo of Zenith AI's capabilities.
 """
 
+import functools
+
 import gradio as gr
+import pandas as pd  # installed with gradio
 
-def benchmark_comparison():
- """Show benchmark comparison data."""
- data = """
- | Task | Standard PyTorch | Zenith AI | Speedup |
- |------|------------------|-----------|---------|
- | ImageNet 1TB Loading | 45 min | 8 min | **5.6x** |
- | Text Tokenization (10M docs) | 12 min | 2 min | **6x** |
- | Real-time Inference | 50K events/s | 6M events/s | **120x** |
- """
- return data
+# Built once at import; rendered as a static table on every page load
+_BENCH_DF = pd.DataFrame(
+ [
+ ["ImageNet 1TB Loading", "45 min", "8 min", "5.6x"],
+ ["Text Tokenization (10M docs)", "12 min", "2 min", "6x"],
+ ["Real-time Inference", "50K events/s", "6M events/s", "120x"],
+ ],
+ columns=["Task", "Standard PyTorch", "Zenith AI", "Speedup"],
+)
 
+@functools.lru_cache(maxsize=None)
 def code_example(framework):
  """Return code example for selected framework."""
  if framework == "PyTorch":
@@ -59,6 +62,7 @@ engine.load_plugin("preprocess.wasm")
 data = engine.load("path/to/data")
 processed = engine.process(data)'''
 
+@functools.lru_cache(maxsize=None)
 def get_install_command(extras):
  """Generate install command based on selected extras."""
  if extras == "Basic":
@@ -81,7 +85,7 @@ with gr.Blocks(title="Zenith AI Demo", theme=gr.themes.Soft()) as demo:
  """)
  
  with gr.Tab(" Benchmarks"):
- gr.Markdown(benchmark_comparison())
+ gr.DataFrame(_BENCH_DF, interactive=False, wrap=True)
  gr.Markdown("""
 **Why is Zenith faster?**
 - **Rust Core**: No Python GIL limitations
@@ -96,9 +100,9 @@ with gr.Blocks(title="Zenith AI Demo", theme=gr.themes.Soft()) as demo:
  label="Select Framework",
  value="PyTorch"
  )
- code_output = gr.Code(language="python", label="Example Code")
+ # Initial value is part of the static page, not recomputed per visitor
+ code_output = gr.Code(code_example("PyTorch"), language="python", label="Example Code")
  framework.change(code_example, framework, code_output)
- demo.load(lambda: code_example("PyTorch"), outputs=code_output)
  
  with gr.Tab(" Installation"):
  extras = gr.Radio(
@@ -106,9 +110,8 @@ with gr.Blocks(title="Zenith AI Demo", theme=gr.themes.Soft()) as demo:
  label="Select Installation Type",
  value="Basic"
  )
- install_cmd = gr.Code(language="bash", label="Install Command")
+ install_cmd = gr.Code(get_install_command("Basic"), language="bash", label="Install Command")
  extras.change(get_install_command, extras, install_cmd)
- demo.load(lambda: get_install_command("Basic"), outputs=install_cmd)
  
  gr.Markdown("""
 ### Requirements
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Build the compiled cffi bindings for the Zenith core (``zenith._ffi``).
+
+The declarations are taken from ffi-bindings/zenith_core.h, the same header
+C/C++ consumers use, so the Python bindings cannot drift from the exported
+Rust signatures. The generated extension calls the core directly (cffi API
+mode) without ctypes' per-call argument conversion; zenith.engine uses it
+when it is importable and falls back to ctypes/cffi ABI mode otherwise.
+The library path is also written to zenith/_core_path.py so the fallbacks
+find it without probing the filesystem.
+
+Usage:
+    cargo build --release -p zenith-core
+    python build_ffi.py
+
+Environment:
+    ZENITH_CORE_HEADER: Path to zenith_core.h (default: ../ffi-bindings)
+    ZENITH_CORE_LIB_DIR: Directory containing libzenith_core (default: ../target/release)
+"""
+
+import ctypes
+import os
+import re
+from pathlib import Path
+
+from cffi import FFI
+
+ROOT = Path(__file__).resolve().parent.parent
+HEADER = Path(os.environ.get("ZENITH_CORE_HEADER", ROOT / "ffi-bindings" / "zenith_core.h"))
+LIB_DIR = Path(os.environ.get("ZENITH_CORE_LIB_DIR", ROOT / "target" / "release"))
+
+
+# A function prototype in the header, e.g. "int32_t zenith_publish(...);"
+FUNCTION_DECL = re.compile(r'^[^;{}()]*\b(zenith_\w+)\s*\([^;]*\);', re.MULTILINE)
+
+
+def header_cdef(header: Path, lib_path: Path) -> str:
+    """
+    Turn the C header into a cffi cdef.
+    
+    Preprocessor lines and the C++ guards are stripped (cffi's parser does
+    not accept them), and prototypes the built library does not export are
+    dropped, since API mode links a wrapper for every declared function.
+    """
+    text = header.read_text()
+    text = re.sub(r'^\s*#.*$', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^\s*extern "C" \{\s*$', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^\s*\}\s*$', '', text, flags=re.MULTILINE)
+    
+    lib = ctypes.CDLL(str(lib_path))
+    
+    def keep_exported(match):
+        if hasattr(lib, match.group(1)):
+            return match.group(0)
+        print(f"build_ffi: skipping {match.group(1)} (not exported by {lib_path.name})")
+        return ''
+    
+    return FUNCTION_DECL.sub(keep_exported, text)
+
+
+ffibuilder = FFI()
+ffibuilder.cdef(header_cdef(HEADER, LIB_DIR / "libzenith_core.so"))
+ffibuilder.set_source(
+    "zenith._ffi",
+    '#include "zenith_core.h"',
+    include_dirs=[str(HEADER.parent)],
+    libraries=["zenith_core"],
+    library_dirs=[str(LIB_DIR)],
+    runtime_library_dirs=[str(LIB_DIR)],
+)
+
+
+def write_core_path(lib_path: Path) -> None:
+    """Record the library location so zenith.engine need not search for it."""
+    out = Path(__file__).resolve().parent / "zenith" / "_core_path.py"
+    out.write_text(
+        "# Generated by build_ffi.py; do not edit\n"
+        f"CORE_LIB = {str(lib_path.resolve())!r}\n"
+    )
+
+
+if __name__ == "__main__":
+    ffibuilder.compile(tmpdir=str(Path(__file__).resolve().parent), verbose=True)
+    write_core_path(LIB_DIR / "libzenith_core.so")
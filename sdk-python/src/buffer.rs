@@ -7,18 +7,18 @@ use std::sync::atomic::{AtomicUsize, Ordering};
 use std::cell::UnsafeCell;
 
 /// A lock-free ring buffer for streaming data
-pub struct RingBuffer {
-    buffer: Vec<UnsafeCell<Option<Vec<u8>>>>,
+pub struct RingBuffer<T = Vec<u8>> {
+    buffer: Vec<UnsafeCell<Option<T>>>,
     capacity: usize,
     head: AtomicUsize,  // Writer position
     tail: AtomicUsize,  // Reader position
 }
 
 // Safety: RingBuffer is designed for SPSC use
-unsafe impl Send for RingBuffer {}
-unsafe impl Sync for RingBuffer {}
+unsafe impl<T: Send> Send for RingBuffer<T> {}
+unsafe impl<T: Send> Sync for RingBuffer<T> {}
 
-impl RingBuffer {
+impl<T> RingBuffer<T> {
     /// Create a new ring buffer with the specified capacity
     pub fn new(capacity: usize) -> Self {
         let capacity = capacity.next_power_of_two();
@@ -60,7 +60,7 @@ impl RingBuffer {
     /// Try to push data into the buffer
     ///
     /// Returns `Ok(())` if successful, `Err(data)` if buffer is full
-    pub fn try_push(&self, data: Vec<u8>) -> Result<(), Vec<u8>> {
+    pub fn try_push(&self, data: T) -> Result<(), T> {
         let head = self.head.load(Ordering::Relaxed);
         let tail = self.tail.load(Ordering::Acquire);
         
@@ -82,7 +82,7 @@ impl RingBuffer {
     /// Try to pop data from the buffer
     ///
     /// Returns `Some(data)` if available, `None` if buffer is empty
-    pub fn try_pop(&self) -> Option<Vec<u8>> {
+    pub fn try_pop(&self) -> Option<T> {
         let tail = self.tail.load(Ordering::Relaxed);
         let head = self.head.load(Ordering::Acquire);
         
@@ -6,18 +6,48 @@
 //! - Zero-copy data transfer
 
 use pyo3::prelude::*;
-use pyo3::exceptions::{PyRuntimeError, PyValueError, PyIOError};
+use pyo3::exceptions::{PyRuntimeError, PyTypeError, PyValueError, PyIOError};
 use std::sync::{Arc, Mutex};
-use std::path::Path;
+use std::path::{Path, PathBuf};
 use std::fs;
 
+use arrow::compute::concat_batches;
+use arrow::ffi_stream::ArrowArrayStreamReader;
+use arrow::pyarrow::{FromPyArrow, IntoPyArrow};
+use arrow::record_batch::{RecordBatch, RecordBatchIterator, RecordBatchReader};
+
 use crate::buffer::RingBuffer;
 use crate::plugin::PluginManager;
+use crate::reader::{self, ReadError};
 use crate::PyPluginInfo;
 
+/// A published batch waiting in the ring buffer
+pub struct Event {
+    pub source_id: u32,
+    pub seq_no: u64,
+    pub batch: RecordBatch,
+}
+
+/// Why a batch could not be queued
+enum PushError {
+    Stopped,
+    Full,
+    Poisoned,
+}
+
+impl From<PushError> for PyErr {
+    fn from(e: PushError) -> Self {
+        match e {
+            PushError::Stopped => PyRuntimeError::new_err("Engine is not running"),
+            PushError::Full => PyRuntimeError::new_err("Publish failed: ring buffer is full"),
+            PushError::Poisoned => PyRuntimeError::new_err("Failed to acquire engine lock"),
+        }
+    }
+}
+
 /// Internal engine state
 pub struct EngineCore {
-    buffer: RingBuffer,
+    buffer: RingBuffer<Event>,
     plugin_manager: PluginManager,
     is_running: bool,
 }
@@ -38,6 +68,69 @@ impl EngineCore {
     pub fn is_running(&self) -> bool {
         self.is_running
     }
+    
+    /// Queue `batch` once per sequence number
+    fn push<I>(&self, source_id: u32, seqs: I, batch: &RecordBatch) -> Result<(), PushError>
+    where
+        I: IntoIterator<Item = u64>,
+    {
+        if !self.is_running {
+            return Err(PushError::Stopped);
+        }
+        for seq_no in seqs {
+            // Cloning a RecordBatch only bumps the buffers' reference counts
+            let event = Event { source_id, seq_no, batch: batch.clone() };
+            self.buffer.try_push(event).map_err(|_| PushError::Full)?;
+        }
+        Ok(())
+    }
+}
+
+/// Import a PyArrow RecordBatch (or Table) through the Arrow C Data Interface
+///
+/// The FFI structs are allocated on this stack frame and PyArrow exports
+/// into them directly, so the column buffers are shared rather than copied.
+fn import_batch(data: &Bound<'_, PyAny>) -> PyResult<RecordBatch> {
+    if data.hasattr("to_batches")? {
+        // Tables arrive as a stream of chunks
+        let reader = ArrowArrayStreamReader::from_pyarrow_bound(data)?;
+        let schema = reader.schema();
+        let batches = reader
+            .collect::<Result<Vec<_>, _>>()
+            .map_err(|e| PyValueError::new_err(format!("Failed to import table: {}", e)))?;
+        return match batches.len() {
+            1 => Ok(batches.into_iter().next().unwrap()),
+            _ => concat_batches(&schema, &batches)
+                .map_err(|e| PyValueError::new_err(format!("Failed to import table: {}", e))),
+        };
+    }
+    RecordBatch::from_pyarrow_bound(data)
+}
+
+/// A batch imported once by Engine.prepare()
+///
+/// Holds the imported RecordBatch on the Rust side, so publish_prepared()
+/// only queues new references to its buffers instead of exporting the
+/// data from PyArrow again.
+#[pyclass(name = "PreparedBatch", frozen)]
+pub struct PyPreparedBatch {
+    batch: RecordBatch,
+}
+
+#[pymethods]
+impl PyPreparedBatch {
+    /// Number of rows in the prepared batch
+    #[getter]
+    fn num_rows(&self) -> usize {
+        self.batch.num_rows()
+    }
+    
+    fn __repr__(&self) -> String {
+        format!(
+            "<PreparedBatch(rows={}, columns={})>",
+            self.batch.num_rows(), self.batch.num_columns()
+        )
+    }
 }
 
 /// Zenith Engine - High-performance data processing
@@ -61,6 +154,31 @@ pub struct PyEngine {
     plugins: Vec<PyPluginInfo>,
 }
 
+impl PyEngine {
+    /// Check the engine state with the GIL released
+    ///
+    /// Producer threads contend on the engine lock; waiting for it without
+    /// the GIL lets other Python threads keep running in the meantime.
+    fn running_nogil(&self, py: Python<'_>) -> PyResult<bool> {
+        let inner = Arc::clone(&self.inner);
+        py.allow_threads(move || inner.lock().map(|core| core.is_running()).map_err(|_| ()))
+            .map_err(|_| PyRuntimeError::new_err("Failed to acquire engine lock"))
+    }
+    
+    /// Queue an imported batch with the GIL released
+    fn push_nogil<I>(&self, py: Python<'_>, source_id: u32, seqs: I, batch: &RecordBatch) -> PyResult<()>
+    where
+        I: IntoIterator<Item = u64> + Send,
+    {
+        let inner = Arc::clone(&self.inner);
+        py.allow_threads(move || {
+            let core = inner.lock().map_err(|_| PushError::Poisoned)?;
+            core.push(source_id, seqs, batch)
+        })?;
+        Ok(())
+    }
+}
+
 #[pymethods]
 impl PyEngine {
     /// Create a new Zenith Engine
@@ -93,7 +211,7 @@ impl PyEngine {
     /// Raises:
     ///     IOError: If the plugin file cannot be read
     ///     RuntimeError: If plugin loading fails
-    fn load_plugin(&mut self, path: &str) -> PyResult<()> {
+    fn load_plugin(&mut self, py: Python<'_>, path: &str) -> PyResult<()> {
         let plugin_path = Path::new(path);
         
         if !plugin_path.exists() {
@@ -102,7 +220,8 @@ impl PyEngine {
             )));
         }
         
-        let wasm_bytes = fs::read(plugin_path)
+        // Read the module without holding the GIL
+        let wasm_bytes = py.allow_threads(|| fs::read(plugin_path))
             .map_err(|e| PyIOError::new_err(format!(
                 "Failed to read plugin file: {}", e
             )))?;
@@ -136,22 +255,171 @@ impl PyEngine {
     /// Raises:
     ///     RuntimeError: If publishing fails
     #[pyo3(signature = (data, source_id=0, seq_no=0))]
-    fn publish(&self, data: &Bound<'_, PyAny>, source_id: u32, seq_no: u64) -> PyResult<()> {
-        let inner = self.inner.lock()
-            .map_err(|_| PyRuntimeError::new_err("Failed to acquire engine lock"))?;
+    fn publish(
+        &self,
+        py: Python<'_>,
+        data: &Bound<'_, PyAny>,
+        source_id: u32,
+        seq_no: u64,
+    ) -> PyResult<()> {
+        let batch = import_batch(data)?;
+        self.push_nogil(py, source_id, [seq_no], &batch)
+    }
+    
+    /// Publish the same data under a range of sequence numbers
+    ///
+    /// Args:
+    ///     data: PyArrow RecordBatch or Table
+    ///     source_id: Identifier for the data source
+    ///     seq_range: Half-open (start, stop) range of sequence numbers
+    ///
+    /// Raises:
+    ///     RuntimeError: If publishing fails
+    #[pyo3(signature = (data, source_id=0, seq_range=(0, 1)))]
+    fn publish_many(
+        &self,
+        py: Python<'_>,
+        data: &Bound<'_, PyAny>,
+        source_id: u32,
+        seq_range: (u64, u64),
+    ) -> PyResult<()> {
+        let (seq_start, seq_stop) = seq_range;
+        if seq_stop <= seq_start {
+            return Ok(());
+        }
         
-        if !inner.is_running() {
+        // Imported once; every sequence number shares the same buffers
+        let batch = import_batch(data)?;
+        self.push_nogil(py, source_id, seq_start..seq_stop, &batch)
+    }
+    
+    /// Publish several batches in one call
+    ///
+    /// Args:
+    ///     batches: Sequence of PyArrow RecordBatches
+    ///     source_id: Identifier for the data source
+    ///     seq_start: Sequence number of the first batch
+    ///
+    /// Raises:
+    ///     RuntimeError: If publishing fails
+    #[pyo3(signature = (batches, source_id=0, seq_start=0))]
+    fn publish_batches(
+        &self,
+        py: Python<'_>,
+        batches: &Bound<'_, PyAny>,
+        source_id: u32,
+        seq_start: u64,
+    ) -> PyResult<()> {
+        if !self.running_nogil(py)? {
             return Err(PyRuntimeError::new_err("Engine is not running"));
         }
         
-        // In production, this would:
-        // 1. Convert PyArrow data to Arrow FFI
-        // 2. Push to ring buffer
-        // 3. Trigger plugin processing
+        for (item, seq_no) in batches.iter()?.zip(seq_start..) {
+            let batch = import_batch(&item?)?;
+            self.push_nogil(py, source_id, [seq_no], &batch)?;
+        }
         
         Ok(())
     }
     
+    /// Import data once for repeated publishing
+    ///
+    /// Args:
+    ///     data: PyArrow RecordBatch or Table
+    ///
+    /// Returns:
+    ///     A PreparedBatch accepted by publish_prepared()
+    fn prepare(&self, data: &Bound<'_, PyAny>) -> PyResult<PyPreparedBatch> {
+        Ok(PyPreparedBatch { batch: import_batch(data)? })
+    }
+    
+    /// Publish a batch returned by prepare()
+    ///
+    /// Nothing is exported from PyArrow; the queued event shares the
+    /// prepared batch's buffers.
+    ///
+    /// Args:
+    ///     prepared: PreparedBatch returned by prepare()
+    ///     source_id: Identifier for the data source
+    ///     seq_no: Sequence number for ordering
+    ///
+    /// Raises:
+    ///     TypeError: If prepared did not come from prepare()
+    ///     RuntimeError: If publishing fails
+    #[pyo3(signature = (prepared, source_id=0, seq_no=0))]
+    fn publish_prepared(
+        &self,
+        py: Python<'_>,
+        prepared: &Bound<'_, PyAny>,
+        source_id: u32,
+        seq_no: u64,
+    ) -> PyResult<()> {
+        let prepared = prepared.downcast::<PyPreparedBatch>().map_err(|_| {
+            PyTypeError::new_err(format!(
+                "publish_prepared() expects a PreparedBatch from prepare(), got {}",
+                prepared.get_type()
+            ))
+        })?;
+        self.push_nogil(py, source_id, [seq_no], &prepared.get().batch)
+    }
+    
+    /// Load a Parquet or Arrow IPC file
+    ///
+    /// The file is decoded by the Rust readers and handed to PyArrow
+    /// through the C Data Interface. A whole-file load decodes with the
+    /// GIL released; with batch_size, batches are decoded one at a time
+    /// as the returned reader is consumed.
+    ///
+    /// Args:
+    ///     source: Path to a .parquet, .arrow/.ipc or .feather file
+    ///     columns: Optional subset of columns to read
+    ///     batch_size: If given, return a RecordBatchReader yielding batches
+    ///         of up to this many rows instead of a Table
+    ///
+    /// Raises:
+    ///     ValueError: If the file format has no native reader, or
+    ///         batch_size is 0
+    ///     IOError: If the file cannot be read
+    #[pyo3(signature = (source, columns=None, batch_size=None))]
+    fn load(
+        &self,
+        py: Python<'_>,
+        source: PathBuf,
+        columns: Option<Vec<String>>,
+        batch_size: Option<usize>,
+    ) -> PyResult<PyObject> {
+        let load_error = |e: ReadError| match e {
+            ReadError::Unsupported(ext) => PyValueError::new_err(format!(
+                "Unsupported file format: .{}", ext
+            )),
+            ReadError::Io(msg) => PyIOError::new_err(format!(
+                "Failed to load {}: {}", source.display(), msg
+            )),
+        };
+        
+        if batch_size == Some(0) {
+            return Err(PyValueError::new_err("batch_size must be a positive integer"));
+        }
+        
+        if let Some(rows) = batch_size {
+            // Only the metadata is read up front; PyArrow pulls the rest
+            let batches = py
+                .allow_threads(|| reader::open_file(&source, columns.as_deref(), rows))
+                .map_err(load_error)?;
+            return batches.into_pyarrow(py);
+        }
+        
+        let (schema, batches) = py
+            .allow_threads(|| {
+                reader::read_file(&source, columns.as_deref(), reader::DEFAULT_BATCH_SIZE)
+            })
+            .map_err(load_error)?;
+        
+        let batches: Box<dyn RecordBatchReader + Send> =
+            Box::new(RecordBatchIterator::new(batches.into_iter().map(Ok), schema));
+        batches.into_pyarrow(py)?.call_method0(py, "read_all")
+    }
+    
     /// Get list of loaded plugins
     #[getter]
     fn plugins(&self) -> Vec<PyPluginInfo> {
@@ -199,3 +467,28 @@ impl PyEngine {
         Ok(false)
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use arrow::array::{ArrayRef, Int64Array};
+    
+    #[test]
+    fn test_prepared_batch_is_not_copied() {
+        let column: ArrayRef = Arc::new(Int64Array::from(vec![1, 2, 3]));
+        let batch = RecordBatch::try_from_iter([("x", column)]).unwrap();
+        let prepared = PyPreparedBatch { batch };
+        let values = prepared.batch.column(0).to_data().buffers()[0].as_ptr();
+        
+        let core = EngineCore::new(8).unwrap();
+        assert!(core.push(0, 0..3, &prepared.batch).is_ok());
+        
+        // Every queued event points at the buffers imported by prepare()
+        for seq_no in 0..3 {
+            let event = core.buffer.try_pop().unwrap();
+            assert_eq!(event.seq_no, seq_no);
+            assert_eq!(event.batch.column(0).to_data().buffers()[0].as_ptr(), values);
+        }
+        assert!(core.buffer.try_pop().is_none());
+    }
+}
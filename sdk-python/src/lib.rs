@@ -25,8 +25,9 @@ use std::collections::VecDeque;
 mod engine;
 mod buffer;
 mod plugin;
+mod reader;
 
-pub use engine::PyEngine;
+pub use engine::{PyEngine, PyPreparedBatch};
 pub use buffer::RingBuffer;
 pub use plugin::PluginManager;
 
@@ -37,6 +38,7 @@ pub use plugin::PluginManager;
 fn _core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // Register classes
     m.add_class::<PyEngine>()?;
+    m.add_class::<PyPreparedBatch>()?;
     m.add_class::<PyDataLoader>()?;
     m.add_class::<PyPluginInfo>()?;
     
@@ -0,0 +1,167 @@
+//! Native file readers
+//!
+//! Decodes Parquet and Arrow IPC files with the Rust Arrow readers so
+//! `zenith.load` does not go through PyArrow's Python-level entry points.
+//! Results are handed to Python through the Arrow C Data Interface.
+
+use std::fs::File;
+use std::path::Path;
+use std::sync::Arc;
+
+use arrow::datatypes::SchemaRef;
+use arrow::error::ArrowError;
+use arrow::ipc::reader::FileReader;
+use arrow::record_batch::{RecordBatch, RecordBatchIterator, RecordBatchReader};
+use parquet::arrow::arrow_reader::ParquetRecordBatchReaderBuilder;
+use parquet::arrow::ProjectionMask;
+
+/// Default rows per batch when the caller does not ask for streaming
+pub const DEFAULT_BATCH_SIZE: usize = 64 * 1024;
+
+/// Record batches decoded one at a time as they are pulled
+pub type BatchReader = Box<dyn RecordBatchReader + Send>;
+
+/// Error raised while reading a file
+#[derive(Debug)]
+pub enum ReadError {
+    /// The file extension has no native reader
+    Unsupported(String),
+    /// The file could not be opened or decoded
+    Io(String),
+}
+
+/// Whether `path` has an extension handled by [`read_file`]
+pub fn is_supported(path: &Path) -> bool {
+    matches!(extension(path).as_deref(), Some("parquet" | "arrow" | "ipc" | "feather"))
+}
+
+/// Open a Parquet or Arrow IPC file as a lazy batch reader
+///
+/// Only the footer/metadata is read here; each batch is decoded when the
+/// reader is advanced. Batches hold at most `batch_size` rows. Only
+/// `columns` are decoded when given (projection pushdown for Parquet,
+/// zero-copy column selection for IPC), in the order they are listed.
+pub fn open_file(
+    path: &Path,
+    columns: Option<&[String]>,
+    batch_size: usize,
+) -> Result<BatchReader, ReadError> {
+    let ext = extension(path);
+    if !is_supported(path) {
+        return Err(ReadError::Unsupported(ext.unwrap_or_default()));
+    }
+
+    let file = File::open(path).map_err(|e| ReadError::Io(e.to_string()))?;
+    match ext.as_deref() {
+        Some("parquet") => open_parquet(file, columns, batch_size),
+        _ => open_ipc(file, columns, batch_size),
+    }
+}
+
+/// Read a Parquet or Arrow IPC file into record batches
+pub fn read_file(
+    path: &Path,
+    columns: Option<&[String]>,
+    batch_size: usize,
+) -> Result<(SchemaRef, Vec<RecordBatch>), ReadError> {
+    let reader = open_file(path, columns, batch_size)?;
+    let schema = reader.schema();
+    let batches = reader
+        .collect::<Result<Vec<_>, _>>()
+        .map_err(|e| ReadError::Io(e.to_string()))?;
+    Ok((schema, batches))
+}
+
+fn extension(path: &Path) -> Option<String> {
+    path.extension()
+        .and_then(|e| e.to_str())
+        .map(|e| e.to_ascii_lowercase())
+}
+
+fn column_indices(schema: &SchemaRef, columns: &[String]) -> Result<Vec<usize>, ReadError> {
+    columns
+        .iter()
+        .map(|name| schema.index_of(name).map_err(|e| ReadError::Io(e.to_string())))
+        .collect()
+}
+
+fn open_parquet(
+    file: File,
+    columns: Option<&[String]>,
+    batch_size: usize,
+) -> Result<BatchReader, ReadError> {
+    let mut builder = ParquetRecordBatchReaderBuilder::try_new(file)
+        .map_err(|e| ReadError::Io(e.to_string()))?
+        .with_batch_size(batch_size);
+
+    let mut order = None;
+    if let Some(columns) = columns {
+        let indices = column_indices(builder.schema(), columns)?;
+        // The projected reader yields its columns in file order; map each
+        // requested column to its position there
+        let mut roots = indices.clone();
+        roots.sort_unstable();
+        roots.dedup();
+        let positions: Vec<usize> = indices
+            .iter()
+            .map(|i| roots.binary_search(i).unwrap())
+            .collect();
+        if !positions.iter().copied().eq(0..roots.len()) {
+            order = Some(positions);
+        }
+        let mask = ProjectionMask::roots(builder.parquet_schema(), indices);
+        builder = builder.with_projection(mask);
+    }
+
+    let reader = builder.build().map_err(|e| ReadError::Io(e.to_string()))?;
+    let Some(order) = order else {
+        return Ok(Box::new(reader));
+    };
+
+    let schema = Arc::new(
+        reader.schema().project(&order).map_err(|e| ReadError::Io(e.to_string()))?
+    );
+    let batches = reader.map(move |batch| batch?.project(&order));
+    Ok(Box::new(RecordBatchIterator::new(batches, schema)))
+}
+
+fn open_ipc(
+    file: File,
+    columns: Option<&[String]>,
+    batch_size: usize,
+) -> Result<BatchReader, ReadError> {
+    let reader = FileReader::try_new(file, None).map_err(|e| ReadError::Io(e.to_string()))?;
+    let mut schema = reader.schema();
+    let indices = columns.map(|c| column_indices(&schema, c)).transpose()?;
+    if let Some(indices) = &indices {
+        schema = Arc::new(
+            schema.project(indices).map_err(|e| ReadError::Io(e.to_string()))?
+        );
+    }
+
+    // IPC batches keep the size they were written with, so cut them down
+    let batches = reader.flat_map(move |batch| {
+        let batch = match &indices {
+            Some(indices) => batch.and_then(|b| b.project(indices)),
+            None => batch,
+        };
+        slice_batch(batch, batch_size)
+    });
+    Ok(Box::new(RecordBatchIterator::new(batches, schema)))
+}
+
+/// Zero-copy slices of `batch` holding at most `batch_size` rows each
+fn slice_batch(
+    batch: Result<RecordBatch, ArrowError>,
+    batch_size: usize,
+) -> Vec<Result<RecordBatch, ArrowError>> {
+    let batch = match batch {
+        Ok(batch) => batch,
+        Err(e) => return vec![Err(e)],
+    };
+    let num_rows = batch.num_rows();
+    (0..num_rows)
+        .step_by(batch_size)
+        .map(|offset| Ok(batch.slice(offset, batch_size.min(num_rows - offset))))
+        .collect()
+}
@@ -46,40 +46,81 @@ __author__ = "Wahyu Ardiansyah"
 # Core imports
 # ============================================================================
 
-# Try to import native Rust extension first
-_NATIVE_AVAILABLE = False
-try:
-    from zenith._core import Engine as NativeEngine
-    from zenith._core import is_available
-    _NATIVE_AVAILABLE = is_available()
-except ImportError:
-    _NATIVE_AVAILABLE = False
-
-# Import Python implementations
-from zenith.engine import Engine as PythonEngine
-from zenith.loader import DataLoader, ZenithBatch, auto_device, cuda_available
-
-# Use native if available, otherwise fallback to Python
-if _NATIVE_AVAILABLE:
-    Engine = NativeEngine
-else:
-    Engine = PythonEngine
+import os as _os
+
+# Prefer the native Rust extension. The PyO3 module calls straight into
+# Rust; the ctypes engine is kept as a fallback and can be forced with
+# ZENITH_FORCE_CTYPES=1 (e.g. to debug against a separately built core).
+# The extension is probed on first use, not at import.
+_NATIVE_AVAILABLE = None
+NativeEngine = None
+
+
+def _ensure_native() -> bool:
+    """Import the native extension once and report whether it is usable."""
+    global _NATIVE_AVAILABLE, NativeEngine
+    if _NATIVE_AVAILABLE is None:
+        _NATIVE_AVAILABLE = False
+        if not _os.environ.get("ZENITH_FORCE_CTYPES"):
+            try:
+                from zenith._core import Engine as NativeEngine
+                from zenith._core import is_available
+                _NATIVE_AVAILABLE = is_available()
+            except ImportError:
+                pass
+    return _NATIVE_AVAILABLE
+
+
+# Python implementations (engine, loader, scheduler) pull in PyArrow, NumPy
+# and requests; they are imported on first attribute access via __getattr__
+# below so that e.g. `zenith.submit` does not pay for the data stack.
+_LAZY_ATTRS = {
+    "PythonEngine": ("zenith.engine", "Engine"),
+    "DataLoader": ("zenith.loader", "DataLoader"),
+    "ZenithBatch": ("zenith.loader", "ZenithBatch"),
+    "auto_device": ("zenith.loader", "auto_device"),
+    "cuda_available": ("zenith.loader", "cuda_available"),
+    "job": ("zenith.scheduler", "job"),
+    "submit": ("zenith.scheduler", "submit"),
+    "status": ("zenith.scheduler", "status"),
+    "cancel": ("zenith.scheduler", "cancel"),
+    "cluster_info": ("zenith.scheduler", "cluster_info"),
+    "SchedulerClient": ("zenith.scheduler", "SchedulerClient"),
+    "JobConfig": ("zenith.scheduler", "JobConfig"),
+    "SchedulerJob": ("zenith.scheduler", "Job"),
+    "JobState": ("zenith.scheduler", "JobState"),
+    "ClusterStatus": ("zenith.scheduler", "ClusterStatus"),
+    "set_scheduler_url": ("zenith.scheduler", "set_scheduler_url"),
+}
 
 # ============================================================================
 # Convenience functions (the "batteries included" API)
 # ============================================================================
 
 _default_engine = None
+_native_engine = None
+
+# Formats the native engine decodes in Rust; anything else (e.g. CSV) is
+# read by the Python engine
+_NATIVE_LOAD_FORMATS = ('.parquet', '.arrow', '.ipc', '.feather')
 
 def _get_engine():
     """Get or create the default engine instance."""
     global _default_engine
     if _default_engine is None:
-        # Always use PythonEngine for load() since it has parquet/csv support
+        from zenith.engine import Engine as PythonEngine
         _default_engine = PythonEngine()
     return _default_engine
 
 
+def _get_native_engine():
+    """Get or create the native engine used by load()."""
+    global _native_engine
+    if _native_engine is None:
+        _native_engine = NativeEngine()
+    return _native_engine
+
+
 def load(source, **kwargs):
     """
     Load data from a source.
@@ -98,7 +139,10 @@ def load(source, **kwargs):
         >>> data = zenith.load("train.parquet")
         >>> print(f"Loaded {data.num_rows} rows")
     """
-    engine = _get_engine()
+    if str(source).lower().endswith(_NATIVE_LOAD_FORMATS) and _ensure_native():
+        engine = _get_native_engine()
+    else:
+        engine = _get_engine()
     return engine.load(source, **kwargs)
 
 
@@ -111,43 +155,34 @@ def info():
         >>> zenith.info()
     """
     print(f"Zenith v{__version__}")
-    print(f"Native core: {'✓ Available' if _NATIVE_AVAILABLE else '✗ Using Python fallback'}")
-    print(f"Engine: {Engine.__name__}")
-
-
-# ============================================================================
-# Job scheduling (integrated with Rust scheduler)
-# ============================================================================
-
-# Import from scheduler module
-from zenith.scheduler import (
-    job,
-    submit,
-    status,
-    cancel,
-    cluster_info,
-    SchedulerClient,
-    JobConfig,
-    Job as SchedulerJob,
-    JobState,
-    ClusterStatus,
-    set_scheduler_url,
-)
+    print(f"Native core: {'✓ Available' if _ensure_native() else '✗ Using Python fallback'}")
+    print(f"Engine: {__getattr__('Engine').__name__}")
 
 
 # ============================================================================
-# Lazy imports for framework-specific adapters
+# Lazy imports for the Python implementations and framework adapters
 # ============================================================================
 
 def __getattr__(name):
-    if name == "torch":
+    if name in _LAZY_ATTRS:
+        import importlib
+        module_name, attr = _LAZY_ATTRS[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    elif name == "Engine":
+        # Use native if available, otherwise fallback to Python
+        value = NativeEngine if _ensure_native() else __getattr__("PythonEngine")
+        globals()["Engine"] = value
+        return value
+    elif name == "torch":
         from zenith import torch as _torch
         return _torch
     elif name == "tensorflow":
         from zenith import tensorflow as _tensorflow
         return _tensorflow
     elif name == "native_available":
-        return _NATIVE_AVAILABLE
+        return _ensure_native()
     raise AttributeError(f"module 'zenith' has no attribute '{name}'")
 
 
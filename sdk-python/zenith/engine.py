@@ -4,16 +4,36 @@ Zenith Core Engine
 The high-performance Rust-powered engine for data loading and preprocessing.
 """
 
+from __future__ import annotations
+
 import ctypes
+import functools
+import mmap
 import os
+import platform
+import threading
+import weakref
 from pathlib import Path
-from typing import Optional, Union, List
+from typing import TYPE_CHECKING, Iterator, Optional, Union, List, Tuple
 
-import pyarrow as pa
+# PyArrow is only imported for annotations here; the methods that need it
+# import it themselves so `import zenith` stays cheap
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 
 def _find_core_library() -> str:
     """Locate the Zenith core shared library."""
+    # Recorded by build_ffi.py when the library was built; skips the probing
+    # below unless overridden by ZENITH_CORE_LIB
+    if not os.environ.get("ZENITH_CORE_LIB"):
+        try:
+            from zenith._core_path import CORE_LIB
+        except ImportError:
+            CORE_LIB = None
+        if CORE_LIB and os.path.exists(CORE_LIB):
+            return CORE_LIB
+    
     # Priority order for finding the library
     search_paths = [
         # 1. Environment variable override
@@ -38,6 +58,150 @@ def _find_core_library() -> str:
     )
 
 
+def _configure_argtypes(lib: ctypes.CDLL) -> None:
+    """Configure FFI function signatures."""
+    # zenith_init(buffer_size) -> engine_ptr
+    lib.zenith_init.argtypes = [ctypes.c_uint32]
+    lib.zenith_init.restype = ctypes.c_void_p
+    
+    # zenith_publish(engine, array, schema, source_id, seq_no) -> result
+    lib.zenith_publish.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_uint32,
+        ctypes.c_uint64
+    ]
+    lib.zenith_publish.restype = ctypes.c_int32
+    
+    # zenith_publish_many(engine, array, schema, source_id, seq_start, count) -> result
+    lib.zenith_publish_many.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_uint32,
+        ctypes.c_uint64,
+        ctypes.c_uint64
+    ]
+    lib.zenith_publish_many.restype = ctypes.c_int32
+    
+    # zenith_publish_batches(engine, arrays, schemas, count, source_id, seq_start) -> result
+    lib.zenith_publish_batches.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+        ctypes.c_uint32,
+        ctypes.c_uint64
+    ]
+    lib.zenith_publish_batches.restype = ctypes.c_int32
+    
+    # zenith_prepare(array, schema) -> prepared_ptr
+    lib.zenith_prepare.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    lib.zenith_prepare.restype = ctypes.c_void_p
+    
+    # zenith_publish_prepared(engine, prepared, source_id, seq_no) -> result
+    lib.zenith_publish_prepared.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_uint32,
+        ctypes.c_uint64
+    ]
+    lib.zenith_publish_prepared.restype = ctypes.c_int32
+    
+    # zenith_prepared_free(prepared) -> void
+    lib.zenith_prepared_free.argtypes = [ctypes.c_void_p]
+    lib.zenith_prepared_free.restype = None
+    
+    # zenith_load_plugin(engine, bytes, len) -> result
+    lib.zenith_load_plugin.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_size_t
+    ]
+    lib.zenith_load_plugin.restype = ctypes.c_int32
+    
+    # zenith_free(engine) -> void
+    lib.zenith_free.argtypes = [ctypes.c_void_p]
+    lib.zenith_free.restype = None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_lib(lib_path: str) -> ctypes.CDLL:
+    """Open the core library once per process and configure its signatures."""
+    lib = ctypes.CDLL(lib_path)
+    _configure_argtypes(lib)
+    return lib
+
+
+@functools.lru_cache(maxsize=None)
+def _open_compiled():
+    """The cffi API-mode bindings built by build_ffi.py, if installed."""
+    try:
+        from zenith._ffi import ffi, lib
+    except ImportError:
+        return None
+    return ffi, lib
+
+
+# C declarations for the cffi ABI-mode fallback (mirrors ffi-bindings/zenith_core.h;
+# build_ffi.py compiles the header itself)
+_CDEF = """
+void* zenith_init(uint32_t buffer_size);
+void zenith_free(void* engine);
+int32_t zenith_publish(void* engine, void* array, void* schema,
+                       uint32_t source_id, uint64_t seq_no);
+int32_t zenith_publish_many(void* engine, void* array, void* schema,
+                            uint32_t source_id, uint64_t seq_start, uint64_t count);
+int32_t zenith_publish_batches(void* engine, void* arrays, void* schemas, size_t count,
+                               uint32_t source_id, uint64_t seq_start);
+void* zenith_prepare(void* array, void* schema);
+int32_t zenith_publish_prepared(void* engine, const void* prepared,
+                                uint32_t source_id, uint64_t seq_no);
+void zenith_prepared_free(void* prepared);
+int32_t zenith_load_plugin(void* engine, const uint8_t* wasm_bytes, size_t len);
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _open_cffi(lib_path: str):
+    """Open the core library through cffi's ABI mode."""
+    from cffi import FFI
+    ffi = FFI()
+    ffi.cdef(_CDEF)
+    return ffi, ffi.dlopen(lib_path)
+
+
+class PreparedBatch:
+    """
+    A RecordBatch imported into the Rust core once for repeated publishing.
+    
+    Created by Engine.prepare(); the Arrow buffers are pinned on the Rust
+    side until the handle is closed.
+    """
+    
+    def __init__(self, lib: ctypes.CDLL, handle: int, num_rows: int):
+        self._handle = handle
+        self.num_rows = num_rows
+        self._finalizer = weakref.finalize(self, lib.zenith_prepared_free, handle)
+    
+    def close(self) -> None:
+        """Release the prepared batch."""
+        self._finalizer()
+        self._handle = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+    
+    def __repr__(self):
+        status = "closed" if not self._handle else "active"
+        return f"<zenith.PreparedBatch(status={status}, rows={self.num_rows})>"
+
+
 class Engine:
     """
     High-performance data processing engine.
@@ -62,44 +226,65 @@ class Engine:
             buffer_size: Size of the internal ring buffer (default: 1024)
             lib_path: Optional path to libzenith_core.so (auto-detected if not provided)
         """
-        self._lib_path = lib_path or _find_core_library()
-        self._lib = ctypes.CDLL(self._lib_path)
-        self._setup_ffi()
+        compiled = None if lib_path else _open_compiled()
+        if compiled is not None:
+            # Bindings generated from zenith_core.h by build_ffi.py
+            self._lib_path = None
+            self._ffi, self._lib = compiled
+        elif platform.python_implementation() == "PyPy":
+            self._lib_path = lib_path or _find_core_library()
+            # ctypes is slow and allocation-heavy on PyPy; cffi is its native FFI
+            self._ffi, self._lib = _open_cffi(self._lib_path)
+        else:
+            # CDLL (unlike PyDLL) drops the GIL around each foreign call, so
+            # publishes from several threads run concurrently in the core
+            self._lib_path = lib_path or _find_core_library()
+            self._ffi = None
+            self._lib = _load_lib(self._lib_path)
         
         self._engine_ptr = self._lib.zenith_init(buffer_size)
         if not self._engine_ptr:
             raise RuntimeError("Failed to initialize Zenith Engine")
+        if self._ffi is None:
+            # restype c_void_p yields a plain int; keep the handle boxed once
+            # rather than converting it again on every call
+            self._engine_ptr = ctypes.c_void_p(self._engine_ptr)
+        # Frees the core engine when this object is collected or at interpreter
+        # exit; unlike __del__ it holds no reference to self
+        self._finalizer = weakref.finalize(self, self._lib.zenith_free, self._engine_ptr)
         
         self._plugins: List[str] = []
         self._closed = False
+        # Per-thread ArrowArray/ArrowSchema structs reused across publishes
+        self._scratch = threading.local()
     
-    def _setup_ffi(self):
-        """Configure FFI function signatures."""
-        # zenith_init(buffer_size) -> engine_ptr
-        self._lib.zenith_init.argtypes = [ctypes.c_uint32]
-        self._lib.zenith_init.restype = ctypes.c_void_p
-        
-        # zenith_publish(engine, array, schema, source_id, seq_no) -> result
-        self._lib.zenith_publish.argtypes = [
-            ctypes.c_void_p,
-            ctypes.c_void_p,
-            ctypes.c_void_p,
-            ctypes.c_uint32,
-            ctypes.c_uint64
-        ]
-        self._lib.zenith_publish.restype = ctypes.c_int32
-        
-        # zenith_load_plugin(engine, bytes, len) -> result
-        self._lib.zenith_load_plugin.argtypes = [
-            ctypes.c_void_p,
-            ctypes.c_char_p,
-            ctypes.c_size_t
-        ]
-        self._lib.zenith_load_plugin.restype = ctypes.c_int32
-        
-        # zenith_free(engine) -> void
-        self._lib.zenith_free.argtypes = [ctypes.c_void_p]
-        self._lib.zenith_free.restype = None
+    def _c_structs(self) -> threading.local:
+        """
+        This thread's reusable C Data Interface structs.
+        
+        Returns a namespace with ``array_addr``/``schema_addr`` (ints, for
+        pyarrow's ``_export_to_c``) and ``array_arg``/``schema_arg`` (the
+        same pointers in the form the FFI backend expects). The core moves
+        the structs' contents out during each call, so the same memory can
+        be exported into again by the next call.
+        """
+        scratch = self._scratch
+        if not hasattr(scratch, 'array_addr'):
+            from pyarrow.cffi import ffi as arrow_ffi
+            scratch.structs = (
+                arrow_ffi.new("struct ArrowArray*"),
+                arrow_ffi.new("struct ArrowSchema*"),
+            )
+            scratch.array_addr = int(arrow_ffi.cast("uintptr_t", scratch.structs[0]))
+            scratch.schema_addr = int(arrow_ffi.cast("uintptr_t", scratch.structs[1]))
+            if self._ffi is not None:
+                scratch.array_arg = self._ffi.cast("void*", scratch.array_addr)
+                scratch.schema_arg = self._ffi.cast("void*", scratch.schema_addr)
+            else:
+                # Prebuilt c_void_p objects pass straight through from_param
+                scratch.array_arg = ctypes.c_void_p(scratch.array_addr)
+                scratch.schema_arg = ctypes.c_void_p(scratch.schema_addr)
+        return scratch
     
     def load_plugin(self, plugin_path: Union[str, Path]) -> None:
         """
@@ -117,13 +302,29 @@ class Engine:
             raise FileNotFoundError(f"Plugin not found: {plugin_path}")
         
         with open(plugin_path, 'rb') as f:
-            wasm_bytes = f.read()
+            try:
+                # Copy-on-write mapping: writable for ctypes, but pages are
+                # only read (never copied) while the core compiles the module
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            except ValueError:
+                # Empty file; the core rejects the null pointer
+                mm = None
         
-        result = self._lib.zenith_load_plugin(
-            self._engine_ptr,
-            wasm_bytes,
-            len(wasm_bytes)
-        )
+        if mm is None:
+            result = self._lib.zenith_load_plugin(self._engine_ptr, None, 0)
+        else:
+            # The core compiles from the borrowed bytes and keeps no reference,
+            # so the mapping can be released as soon as the call returns
+            with mm:
+                if self._ffi is not None:
+                    buf = self._ffi.from_buffer("uint8_t[]", mm)
+                    ptr = buf
+                else:
+                    buf = ctypes.c_char.from_buffer(mm)
+                    ptr = ctypes.addressof(buf)
+                result = self._lib.zenith_load_plugin(self._engine_ptr, ptr, len(mm))
+                # Drop the buffer export so the mapping can close
+                del buf, ptr
         
         if result != 0:
             raise RuntimeError(f"Failed to load plugin: {plugin_path} (error code: {result})")
@@ -147,25 +348,173 @@ class Engine:
             source_id: Identifier for the data source
             seq_no: Sequence number for ordering
             
+        Raises:
+            RuntimeError: If publishing fails
+        """
+        c = self._c_structs()
+        
+        # A RecordBatch exports as a struct array directly
+        data._export_to_c(c.array_addr, c.schema_addr)
+        
+        result = self._lib.zenith_publish(
+            self._engine_ptr,
+            c.array_arg,
+            c.schema_arg,
+            source_id,
+            seq_no
+        )
+        
+        if result != 0:
+            raise RuntimeError(f"Publish failed (error code: {result})")
+    
+    def publish_many(
+        self,
+        data: pa.RecordBatch,
+        source_id: int = 0,
+        seq_range: Tuple[int, int] = (0, 1)
+    ) -> None:
+        """
+        Publish the same data under a range of sequence numbers.
+        
+        The batch is exported to the Arrow C Data Interface once and the
+        whole range is submitted in a single FFI call, instead of one
+        export and one call per sequence number.
+        
+        Args:
+            data: PyArrow RecordBatch containing the data
+            source_id: Identifier for the data source
+            seq_range: Half-open (start, stop) range of sequence numbers
+            
+        Raises:
+            RuntimeError: If publishing fails
+        """
+        seq_start, seq_stop = seq_range
+        if seq_stop <= seq_start:
+            return
+        
+        c = self._c_structs()
+        # A RecordBatch exports as a struct array directly
+        data._export_to_c(c.array_addr, c.schema_addr)
+        
+        result = self._lib.zenith_publish_many(
+            self._engine_ptr,
+            c.array_arg,
+            c.schema_arg,
+            source_id,
+            seq_start,
+            seq_stop - seq_start
+        )
+        
+        if result != 0:
+            raise RuntimeError(f"Publish failed (error code: {result})")
+    
+    def publish_batches(
+        self,
+        batches: List[pa.RecordBatch],
+        source_id: int = 0,
+        seq_start: int = 0
+    ) -> None:
+        """
+        Publish several batches in a single FFI call.
+        
+        All batches are exported into one contiguous array of C Data
+        Interface structs; batch ``i`` is published with sequence number
+        ``seq_start + i``.
+        
+        Args:
+            batches: PyArrow RecordBatches to publish, in order
+            source_id: Identifier for the data source
+            seq_start: Sequence number of the first batch
+            
         Raises:
             RuntimeError: If publishing fails
         """
         from pyarrow.cffi import ffi as arrow_ffi
         
-        struct_array = data.to_struct_array()
+        batches = list(batches)
+        count = len(batches)
+        if count == 0:
+            return
         
-        c_schema = arrow_ffi.new("struct ArrowSchema*")
-        c_array = arrow_ffi.new("struct ArrowArray*")
+        c_arrays = arrow_ffi.new(f"struct ArrowArray[{count}]")
+        c_schemas = arrow_ffi.new(f"struct ArrowSchema[{count}]")
+        arrays_addr = int(arrow_ffi.cast("uintptr_t", c_arrays))
+        schemas_addr = int(arrow_ffi.cast("uintptr_t", c_schemas))
+        array_size = arrow_ffi.sizeof("struct ArrowArray")
+        schema_size = arrow_ffi.sizeof("struct ArrowSchema")
         
-        c_schema_addr = int(arrow_ffi.cast("uintptr_t", c_schema))
-        c_array_addr = int(arrow_ffi.cast("uintptr_t", c_array))
+        for i, batch in enumerate(batches):
+            batch._export_to_c(arrays_addr + i * array_size, schemas_addr + i * schema_size)
         
-        struct_array._export_to_c(c_array_addr, c_schema_addr)
+        if self._ffi is not None:
+            arrays_arg = self._ffi.cast("void*", arrays_addr)
+            schemas_arg = self._ffi.cast("void*", schemas_addr)
+        else:
+            arrays_arg, schemas_arg = arrays_addr, schemas_addr
         
-        result = self._lib.zenith_publish(
+        result = self._lib.zenith_publish_batches(
             self._engine_ptr,
-            ctypes.c_void_p(c_array_addr),
-            ctypes.c_void_p(c_schema_addr),
+            arrays_arg,
+            schemas_arg,
+            count,
+            source_id,
+            seq_start
+        )
+        
+        if result != 0:
+            raise RuntimeError(f"Publish failed (error code: {result})")
+    
+    def prepare(self, data: pa.RecordBatch) -> PreparedBatch:
+        """
+        Export data to the Rust core once for repeated publishing.
+        
+        Args:
+            data: PyArrow RecordBatch containing the data
+            
+        Returns:
+            PreparedBatch handle accepted by publish_prepared()
+            
+        Raises:
+            RuntimeError: If the batch cannot be imported
+        """
+        c = self._c_structs()
+        # A RecordBatch exports as a struct array directly
+        data._export_to_c(c.array_addr, c.schema_addr)
+        
+        handle = self._lib.zenith_prepare(
+            c.array_arg,
+            c.schema_arg
+        )
+        if not handle:
+            raise RuntimeError("Failed to prepare batch")
+        if self._ffi is None:
+            handle = ctypes.c_void_p(handle)
+        
+        return PreparedBatch(self._lib, handle, data.num_rows)
+    
+    def publish_prepared(
+        self,
+        prepared: PreparedBatch,
+        source_id: int = 0,
+        seq_no: int = 0
+    ) -> None:
+        """
+        Publish a batch returned by prepare().
+        
+        Only the sequence metadata crosses the FFI boundary; the Arrow
+        buffers are shared with the prepared handle.
+        
+        Args:
+            prepared: Handle returned by prepare()
+            source_id: Identifier for the data source
+            seq_no: Sequence number for ordering
+            
+        Raises:
+            RuntimeError: If publishing fails
+        """
+        result = self._lib.zenith_publish_prepared(
+            self._engine_ptr,
+            prepared._handle,
             source_id,
             seq_no
         )
@@ -173,27 +522,71 @@ class Engine:
         if result != 0:
             raise RuntimeError(f"Publish failed (error code: {result})")
     
-    def load(self, source: Union[str, Path]) -> pa.Table:
+    # File extension -> loader method name
+    _LOADERS = {
+        'parquet': '_load_parquet',
+        'csv': '_load_csv',
+        'arrow': '_load_ipc',
+        'feather': '_load_ipc',
+        'ipc': '_load_ipc',
+    }
+    
+    def load(
+        self,
+        source: Union[str, Path],
+        columns: Optional[List[str]] = None,
+        batch_size: Optional[int] = None
+    ) -> Union[pa.Table, Iterator[pa.RecordBatch]]:
         """
         Load data from a source path.
         
         Args:
-            source: Path to data file or directory
+            source: Path to a .parquet, .csv, .arrow/.ipc or .feather file
+            columns: Optional subset of columns to read
+            batch_size: If given, stream RecordBatches of up to this many
+                rows instead of reading a whole Table
             
         Returns:
-            PyArrow Table containing the loaded data
-        """
-        # Placeholder for full implementation
-        # In production, this would use Rust core for fast loading
-        source = Path(source)
-        if source.suffix == '.parquet':
-            import pyarrow.parquet as pq
-            return pq.read_table(source)
-        elif source.suffix == '.csv':
-            import pyarrow.csv as csv
-            return csv.read_csv(source)
-        else:
-            raise ValueError(f"Unsupported file format: {source.suffix}")
+            PyArrow Table, or an iterator of RecordBatches when batch_size is set
+        """
+        source = str(source)
+        ext = source.rpartition('.')[2].lower()
+        loader = self._LOADERS.get(ext)
+        if loader is None:
+            raise ValueError(f"Unsupported file format: .{ext}")
+        return getattr(self, loader)(source, columns, batch_size)
+    
+    def _load_parquet(self, source, columns, batch_size):
+        import pyarrow.parquet as pq
+        if batch_size is not None:
+            pf = pq.ParquetFile(source, memory_map=True, pre_buffer=True)
+            return pf.iter_batches(batch_size=batch_size, columns=columns, use_threads=True)
+        return pq.read_table(
+            source, columns=columns, use_threads=True, pre_buffer=True, memory_map=True
+        )
+    
+    def _load_csv(self, source, columns, batch_size):
+        import pyarrow.csv as csv
+        convert_options = csv.ConvertOptions(include_columns=columns) if columns else None
+        if batch_size is not None:
+            # Parse block by block instead of materializing the whole file
+            reader = csv.open_csv(source, convert_options=convert_options)
+            return self._rebatch(reader, batch_size)
+        return csv.read_csv(source, convert_options=convert_options)
+    
+    @staticmethod
+    def _rebatch(reader, batch_size: int) -> Iterator[pa.RecordBatch]:
+        """Re-slice a reader's batches (zero-copy) to at most batch_size rows."""
+        for batch in reader:
+            for offset in range(0, batch.num_rows, batch_size):
+                yield batch.slice(offset, batch_size)
+    
+    def _load_ipc(self, source, columns, batch_size):
+        import pyarrow.feather as feather
+        table = feather.read_table(source, columns=columns, memory_map=True)
+        if batch_size is not None:
+            return iter(table.to_batches(max_chunksize=batch_size))
+        return table
     
     def process(self, data: pa.Table) -> pa.Table:
         """
@@ -215,10 +608,10 @@ class Engine:
     
     def close(self) -> None:
         """Release engine resources."""
-        if not self._closed and self._engine_ptr:
-            self._lib.zenith_free(self._engine_ptr)
-            self._engine_ptr = None
-            self._closed = True
+        # finalize() runs its callback at most once
+        self._finalizer()
+        self._engine_ptr = None
+        self._closed = True
     
     def __enter__(self):
         return self
@@ -227,9 +620,6 @@ class Engine:
         self.close()
         return False
     
-    def __del__(self):
-        self.close()
-    
     def __repr__(self):
         status = "closed" if self._closed else "active"
         return f"<zenith.Engine(status={status}, plugins={len(self._plugins)})>"
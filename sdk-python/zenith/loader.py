@@ -6,21 +6,197 @@ and async prefetching for maximum throughput.
 """
 
 from pathlib import Path
-from typing import Optional, Union, Iterator, Literal
+from typing import Any, Dict, Optional, Union, Iterator, Literal
+import functools
+import warnings
+import weakref
 import pyarrow as pa
 import threading
 import queue
 import numpy as np
 
 
+_SHUFFLE_MODES = ("full", "blocked", "random_sample")
+
+# Rows per block for shuffle_mode="blocked" (rounded up to whole batches)
+_SHUFFLE_BLOCK_ROWS = 64 * 1024
+
+
+# Framework modules, imported on first use and then reused per batch
+_torch = None
+_tf = None
+
+
+def _import_torch():
+    global _torch
+    if _torch is None:
+        try:
+            import torch
+        except ImportError:
+            raise ImportError("PyTorch not installed. Run: pip install torch")
+        _torch = torch
+    return _torch
+
+
+def _import_tensorflow():
+    global _tf
+    if _tf is None:
+        try:
+            import tensorflow as tf
+        except ImportError:
+            raise ImportError("TensorFlow not installed. Run: pip install tensorflow")
+        _tf = tf
+    return _tf
+
+
+class _CudaArrayView:
+    """
+    ``__cuda_array_interface__`` over a numeric Arrow column in GPU memory.
+    
+    Lets torch.as_tensor alias device-resident Arrow buffers (e.g. from
+    pyarrow.cuda) without a round trip through host memory.
+    """
+    
+    def __init__(self, col: pa.Array):
+        data = col.buffers()[1]
+        self._data = data  # Keeps the device allocation alive
+        self.__cuda_array_interface__ = {
+            "shape": (len(col),),
+            "typestr": np.dtype(col.type.to_pandas_dtype()).str,
+            "data": (data.address + col.offset * (col.type.bit_width // 8), True),
+            "version": 3,
+        }
+    
+    @staticmethod
+    def supports(col: pa.Array) -> bool:
+        """Whether col is a null-free numeric column backed by device memory."""
+        col_type = col.type
+        if col.null_count or not (pa.types.is_integer(col_type) or pa.types.is_floating(col_type)):
+            return False
+        data = col.buffers()[1]
+        return data is not None and not data.is_cpu
+
+
+def _numpy_converter(col_type: pa.DataType):
+    """
+    Pick the Arrow -> NumPy conversion for one column type.
+    
+    Numeric columns get a view of their data buffer (falling back to a
+    conversion copy for batches that contain nulls); anything else is
+    converted by PyArrow.
+    """
+    if not (pa.types.is_integer(col_type) or pa.types.is_floating(col_type)):
+        return lambda col: col.to_numpy(zero_copy_only=False)
+    
+    dtype = np.dtype(col_type.to_pandas_dtype())
+    width = dtype.itemsize
+    
+    def convert(col: pa.Array) -> np.ndarray:
+        if col.null_count:
+            return col.to_numpy(zero_copy_only=False)
+        return np.frombuffer(
+            col.buffers()[1], dtype=dtype, count=len(col), offset=col.offset * width
+        )
+    
+    return convert
+
+
+def _numpy_converters(schema: pa.Schema) -> list:
+    """Per-column converters for a schema, built once and shared by its batches."""
+    return [_numpy_converter(field.type) for field in schema]
+
+
+# Loaded tables shared by loaders of the same file; an entry lives as
+# long as some loader still holds the table
+_TABLE_CACHE: "weakref.WeakValueDictionary[tuple, pa.Table]" = weakref.WeakValueDictionary()
+
+
+def _table_cache_key(source: Path) -> Optional[tuple]:
+    """Identify a file's current contents, or None if it cannot be stat'ed."""
+    try:
+        path = source.resolve()
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+class _PinnedStaging:
+    """
+    Double-buffered pinned host memory and a side stream for H2D copies.
+    
+    Each column owns two page-locked buffers used in turn, so filling the
+    buffer for batch n+1 does not wait for the DMA still reading batch n.
+    Copies are issued on a dedicated CUDA stream; the consumer's current
+    stream waits on it before the tensors are used. Shared by all batches
+    of one DataLoader; torch is only touched on first use.
+    """
+    
+    def __init__(self, device: str):
+        self._device = device
+        self._stream = None
+        self._events = None
+        self._buffers = {}  # (column, slot) -> flat pinned tensor
+        self._slot = 0
+    
+    def _host_buffer(self, name: str, slot: int, tensor):
+        """Prefix of this slot's pinned buffer for the column, grown as needed."""
+        torch = _import_torch()
+        buf = self._buffers.get((name, slot))
+        if buf is None or buf.dtype != tensor.dtype or buf.numel() < tensor.numel():
+            buf = torch.empty(tensor.numel(), dtype=tensor.dtype, pin_memory=True)
+            self._buffers[(name, slot)] = buf
+        return buf[:tensor.numel()].view(tensor.shape)
+    
+    def to_device(self, tensors: dict) -> dict:
+        """Copy CPU tensors to the device through the next pinned slot."""
+        torch = _import_torch()
+        if self._stream is None:
+            self._stream = torch.cuda.Stream(device=self._device)
+            self._events = [torch.cuda.Event(), torch.cuda.Event()]
+        
+        slot = self._slot
+        self._slot ^= 1
+        # The slot was last read by the copies two batches ago
+        self._events[slot].synchronize()
+        
+        result = {}
+        with torch.cuda.stream(self._stream):
+            for name, tensor in tensors.items():
+                host = self._host_buffer(name, slot, tensor)
+                host.copy_(tensor)
+                result[name] = host.to(self._device, non_blocking=True)
+            self._events[slot].record(self._stream)
+        
+        current = torch.cuda.current_stream(self._device)
+        current.wait_stream(self._stream)
+        for tensor in result.values():
+            # Allocated on the copy stream, used on the current one
+            tensor.record_stream(current)
+        return result
+
+
 class ZenithBatch:
     """
     Wrapper around Arrow RecordBatch with zero-copy tensor conversion.
     """
     
-    def __init__(self, batch: pa.RecordBatch, device: str = "cpu"):
+    def __init__(
+        self,
+        batch: pa.RecordBatch,
+        device: str = "cpu",
+        pin_memory: bool = False,
+        converters: Optional[list] = None,
+        staging: Optional[_PinnedStaging] = None,
+    ):
         self._batch = batch
         self._device = device
+        self._pin_memory = pin_memory
+        self._staging = staging
+        # One call for all names instead of a schema.field(i) lookup per column
+        self._names = batch.schema.names
+        # Type dispatch done once per schema (the DataLoader passes its own)
+        self._converters = converters if converters is not None else _numpy_converters(batch.schema)
     
     @property
     def num_rows(self) -> int:
@@ -38,53 +214,90 @@ class ZenithBatch:
         """
         Convert to PyTorch tensors with zero-copy when possible.
         
+        Numeric columns without nulls are shared with the Arrow buffers
+        through DLPack; other columns are converted via NumPy. With
+        pin_memory, CUDA copies are staged in pinned host memory and issued
+        asynchronously on the current stream, so they overlap with the
+        conversion of the remaining columns. Batches from a DataLoader
+        instead reuse its double-buffered pinned staging and copy on a
+        side stream (see _PinnedStaging). Columns whose buffers already
+        live in GPU memory are aliased through __cuda_array_interface__.
+        
+        Aliased tensors share memory with the batch's Arrow buffers, which
+        may belong to a table or memory map shared with other batches, so
+        in-place operations on them modify the source data. Clone a tensor
+        before mutating it.
+        
         Returns:
             dict: Column name -> torch.Tensor mapping
         """
-        try:
-            import torch
-        except ImportError:
-            raise ImportError("PyTorch not installed. Run: pip install torch")
+        torch = _import_torch()
+        
+        to_cuda = self._device != "cpu" and self._device.startswith("cuda")
+        non_blocking = to_cuda and self._pin_memory
         
         result = {}
-        for i, col in enumerate(self._batch.columns):
-            name = self._batch.schema.field(i).name
-            
-            # Convert Arrow array to numpy (zero-copy when possible)
-            np_array = col.to_numpy(zero_copy_only=False)
-            
-            # Convert to tensor
-            tensor = torch.from_numpy(np_array.copy())  # Copy to avoid non-writable warning
+        staged = {}
+        for name, col, convert in zip(self._names, self._batch.columns, self._converters):
+            if to_cuda and _CudaArrayView.supports(col):
+                # Already in GPU memory: alias it, no host copy at all
+                tensor = torch.as_tensor(_CudaArrayView(col), device=self._device)
+            else:
+                try:
+                    # DLPack aliases the Arrow buffer (numeric columns without nulls)
+                    tensor = torch.from_dlpack(col)
+                except (TypeError, BufferError):
+                    # Nulls, booleans, etc. need a conversion copy anyway
+                    np_array = convert(col)
+                    if not np_array.flags.writeable:
+                        np_array = np_array.copy()  # Avoid non-writable warning
+                    tensor = torch.from_numpy(np_array)
             
             if dtype:
                 tensor = tensor.to(dtype)
             
+            if to_cuda and self._staging is not None and tensor.device.type == "cpu":
+                staged[name] = tensor
+                result[name] = None  # Placeholder keeps the column order
+                continue
+            
             # Move to device if needed
-            if self._device != "cpu" and self._device.startswith("cuda"):
-                tensor = tensor.to(self._device)
+            if to_cuda:
+                if non_blocking and tensor.device.type == "cpu":
+                    # Async H2D needs a page-locked source
+                    tensor = tensor.pin_memory()
+                tensor = tensor.to(self._device, non_blocking=non_blocking)
             
             result[name] = tensor
         
+        if staged:
+            result.update(self._staging.to_device(staged))
+        
         return result
     
     def to_tensorflow(self):
         """
-        Convert to TensorFlow tensors.
+        Convert to TensorFlow tensors with zero-copy when possible.
+        
+        Numeric columns without nulls are shared with the Arrow buffers
+        through DLPack; other columns (or buffers TensorFlow refuses to
+        alias) are copied via NumPy.
         
         Returns:
             dict: Column name -> tf.Tensor mapping
         """
-        try:
-            import tensorflow as tf
-        except ImportError:
-            raise ImportError("TensorFlow not installed. Run: pip install tensorflow")
+        tf = _import_tensorflow()
         
         result = {}
-        for i, col in enumerate(self._batch.columns):
-            name = self._batch.schema.field(i).name
-            np_array = col.to_numpy(zero_copy_only=False)
-            result[name] = tf.constant(np_array)
-        
+        with warnings.catch_warnings():
+            # TensorFlow only accepts unversioned capsules, which PyArrow
+            # deprecates
+            warnings.simplefilter("ignore", DeprecationWarning)
+            for name, col, convert in zip(self._names, self._batch.columns, self._converters):
+                try:
+                    result[name] = tf.experimental.dlpack.from_dlpack(col.__dlpack__())
+                except (TypeError, BufferError, tf.errors.OpError):
+                    result[name] = tf.constant(convert(col))
         return result
     
     def to_numpy(self):
@@ -94,11 +307,31 @@ class ZenithBatch:
         Returns:
             dict: Column name -> np.ndarray mapping
         """
-        result = {}
-        for i, col in enumerate(self._batch.columns):
-            name = self._batch.schema.field(i).name
-            result[name] = col.to_numpy(zero_copy_only=False)
-        return result
+        return self._columns_as_numpy()
+    
+    def _columns_as_numpy(self) -> dict:
+        """Column name -> ndarray, sharing Arrow buffers where the type allows."""
+        return {
+            name: convert(col)
+            for name, col, convert in zip(self._names, self._batch.columns, self._converters)
+        }
+    
+    def _dlpack_column(self) -> pa.Array:
+        if self._batch.num_columns != 1:
+            raise BufferError(
+                f"DLPack export needs a single-column batch, got {self._batch.num_columns} "
+                "columns; use to_torch() for a dict of tensors"
+            )
+        return self._batch.column(0)
+    
+    def __dlpack__(self, stream=None, **kwargs):
+        """DLPack export of a single-column batch (e.g. torch.from_dlpack(batch))."""
+        # Keywords such as max_version are forwarded; PyArrow releases that
+        # predate them raise TypeError, on which consumers retry without
+        return self._dlpack_column().__dlpack__(stream=stream, **kwargs)
+    
+    def __dlpack_device__(self):
+        return self._dlpack_column().__dlpack_device__()
     
     def __repr__(self):
         return f"<ZenithBatch rows={self.num_rows} device='{self._device}'>"
@@ -131,6 +364,8 @@ class DataLoader:
         preprocessing_plugin: Optional[str] = None,
         num_workers: int = 4,
         prefetch_factor: int = 2,
+        seed: Optional[int] = None,
+        shuffle_mode: Literal["full", "blocked", "random_sample"] = "full",
     ):
         """
         Initialize the DataLoader.
@@ -144,7 +379,19 @@ class DataLoader:
             preprocessing_plugin: Optional WASM plugin for preprocessing
             num_workers: Number of parallel data loading workers
             prefetch_factor: Number of batches to prefetch (default 2)
+            seed: Seed for the shuffle order (default: fresh entropy)
+            shuffle_mode: How shuffle=True orders rows:
+                "full" permutes all rows each epoch;
+                "blocked" visits fixed-size row blocks in random order and
+                permutes rows within each block, so memory is per block;
+                "random_sample" draws each batch's rows independently
+                (with replacement), using O(batch_size) memory
         """
+        if shuffle_mode not in _SHUFFLE_MODES:
+            raise ValueError(
+                f"shuffle_mode must be one of {', '.join(_SHUFFLE_MODES)}, got {shuffle_mode!r}"
+            )
+        
         self.source = Path(source) if isinstance(source, str) else source
         self.batch_size = batch_size
         self.shuffle = shuffle
@@ -153,11 +400,21 @@ class DataLoader:
         self.preprocessing_plugin = preprocessing_plugin
         self.num_workers = num_workers
         self.prefetch_factor = prefetch_factor
+        self.shuffle_mode = shuffle_mode
         
         self._data: Optional[pa.Table] = None
-        self._prefetch_queue: Optional[queue.Queue] = None
+        self._num_rows: Optional[int] = None
+        # Unshuffled epochs reuse the same batch slices
+        self._record_batches: Optional[list] = None
         self._prefetch_thread: Optional[threading.Thread] = None
         self._stop_prefetch = threading.Event()
+        # Pinned host buffers and copy stream shared by this loader's batches
+        self._staging = (
+            _PinnedStaging(self.device)
+            if pin_memory and self.device.startswith("cuda") else None
+        )
+        # One generator for the loader's lifetime: each epoch gets a new order
+        self._rng = np.random.default_rng(seed)
     
     def _resolve_device(self, device: str) -> str:
         """Resolve 'auto' device to actual device."""
@@ -166,82 +423,138 @@ class DataLoader:
         return device
     
     def _load_data(self):
-        """Load data with memory-mapping for efficiency."""
+        """Load data, sharing the table with other loaders of the same file."""
         if self._data is None:
-            import pyarrow.parquet as pq
-            import pyarrow.csv as pa_csv
-            
-            source_str = str(self.source)
-            
-            if source_str.endswith('.parquet'):
-                # Use memory_map for faster reading
-                self._data = pq.read_table(self.source, memory_map=True)
-            elif source_str.endswith('.csv'):
-                self._data = pa_csv.read_csv(self.source)
-            elif source_str.endswith('.arrow') or source_str.endswith('.feather'):
-                import pyarrow.feather as feather
-                self._data = feather.read_table(self.source)
-            else:
-                try:
-                    self._data = pq.read_table(self.source, memory_map=True)
-                except Exception:
-                    raise ValueError(f"Unsupported file format: {source_str}")
-    
-    def _prefetch_worker(self, batch_indices_list: list):
-        """Background thread that prefetches batches."""
-        for batch_indices in batch_indices_list:
-            if self._stop_prefetch.is_set():
-                break
-            
-            try:
-                # Extract batch
-                table_batch = self._data.take(batch_indices)
-                batches = table_batch.to_batches()
-                
-                if batches:
-                    batch = ZenithBatch(batches[0], device=self.device)
-                    self._prefetch_queue.put(batch)
-            except Exception as e:
-                # Put error in queue
-                self._prefetch_queue.put(e)
-                break
-        
-        # Signal end of batches
-        self._prefetch_queue.put(None)
+            key = _table_cache_key(self.source)
+            table = _TABLE_CACHE.get(key) if key is not None else None
+            if table is None:
+                table = self._read_source()
+                if key is not None:
+                    _TABLE_CACHE[key] = table
+            self._data = table
+            self._num_rows = table.num_rows
     
-    def __iter__(self) -> Iterator[ZenithBatch]:
-        """Iterate over batches with async prefetching."""
-        self._load_data()
-        
-        if self._data is None:
-            return
+    def _read_source(self) -> pa.Table:
+        """Read the source with memory-mapping for efficiency."""
+        import pyarrow.parquet as pq
+        import pyarrow.csv as pa_csv
         
-        num_rows = self._data.num_rows
-        indices = np.arange(num_rows)
+        source_str = str(self.source)
         
-        if self.shuffle:
-            np.random.shuffle(indices)
+        if source_str.endswith('.parquet'):
+            # Use memory_map for faster reading
+            table = pq.read_table(self.source, memory_map=True)
+        elif source_str.endswith('.csv'):
+            table = pa_csv.read_csv(self.source)
+        elif source_str.endswith('.arrow') or source_str.endswith('.feather'):
+            import pyarrow.feather as feather
+            table = feather.read_table(self.source)
+        else:
+            try:
+                table = pq.read_table(self.source, memory_map=True)
+            except Exception:
+                raise ValueError(f"Unsupported file format: {source_str}")
         
-        # Prepare batch indices
-        batch_indices_list = []
-        for start_idx in range(0, num_rows, self.batch_size):
-            end_idx = min(start_idx + self.batch_size, num_rows)
-            batch_indices_list.append(indices[start_idx:end_idx])
+        # One chunk per column, so batches (and take() results) slice
+        # without crossing chunk boundaries
+        return table.combine_chunks()
+    
+    def _streams_from_file(self) -> bool:
+        """Unshuffled Parquet is read batch by batch instead of loaded whole."""
+        return not self.shuffle and self._data is None and str(self.source).endswith('.parquet')
+    
+    def _stream_batches(self) -> Iterator[pa.RecordBatch]:
+        """Decode the Parquet file one batch at a time."""
+        import pyarrow.parquet as pq
+        pf = pq.ParquetFile(self.source, memory_map=True)
+        yield from pf.iter_batches(batch_size=self.batch_size, use_threads=True)
+    
+    def _table_batches(self, table: pa.Table) -> Iterator[pa.RecordBatch]:
+        """Split a single-chunk table into zero-copy batch slices."""
+        yield from table.to_batches(max_chunksize=self.batch_size)
+    
+    def _shuffled_batches(self, indices: np.ndarray) -> Iterator[pa.RecordBatch]:
+        """Gather the epoch's permutation once, then slice it into batches."""
+        yield from self._table_batches(self._data.take(indices))
+    
+    def _blocked_batches(self) -> Iterator[pa.RecordBatch]:
+        """Visit row blocks in random order, permuting rows within each."""
+        # Whole batches per block, so only the table's last block is short
+        block_rows = -(-_SHUFFLE_BLOCK_ROWS // self.batch_size) * self.batch_size
+        starts = np.arange(0, self._num_rows, block_rows, dtype=np.int64)
+        self._rng.shuffle(starts)
+        for start in starts:
+            block = self._data.slice(start, block_rows)
+            yield from self._table_batches(block.take(self._rng.permutation(block.num_rows)))
+    
+    def _sampled_batches(self) -> Iterator[pa.RecordBatch]:
+        """Draw every batch's rows independently, with replacement."""
+        num_rows = self._num_rows
+        for _ in range((num_rows + self.batch_size - 1) // self.batch_size):
+            indices = self._rng.integers(0, num_rows, size=self.batch_size)
+            yield from self._table_batches(self._data.take(indices))
+    
+    @staticmethod
+    def _put(out: queue.Queue, stop: threading.Event, item) -> bool:
+        """Queue an item for the consumer; gives up once iteration stops."""
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _prefetch_worker(
+        self,
+        batches: Iterator[pa.RecordBatch],
+        out: queue.Queue,
+        stop: threading.Event,
+        batch_options: Dict[str, Any],
+    ):
+        """Background thread that prefetches batches.
         
-        # Start prefetch thread
-        self._prefetch_queue = queue.Queue(maxsize=self.prefetch_factor)
-        self._stop_prefetch.clear()
-        self._prefetch_thread = threading.Thread(
+        Only touches the queue and stop event of the epoch that started
+        it, so a producer that outlives its epoch cannot feed the next one.
+        """
+        converters = None
+        try:
+            # Reading/decoding happens here, overlapping with the consumer
+            for record_batch in batches:
+                if converters is None:
+                    # Every batch of a source shares its schema
+                    converters = _numpy_converters(record_batch.schema)
+                batch = ZenithBatch(record_batch, converters=converters, **batch_options)
+                if not self._put(out, stop, batch):
+                    return
+        except Exception as e:
+            # Put error in queue
+            self._put(out, stop, e)
+        finally:
+            # Signal end of batches
+            self._put(out, stop, None)
+    
+    def _prefetch_iter(self, batches: Iterator[pa.RecordBatch]) -> Iterator[ZenithBatch]:
+        """Yield batches built by a producer thread up to prefetch_factor ahead."""
+        out = queue.Queue(maxsize=max(1, self.prefetch_factor))
+        # A fresh event per epoch; close() sets the current one
+        stop = self._stop_prefetch = threading.Event()
+        batch_options = {
+            "device": self.device,
+            "pin_memory": self.pin_memory,
+            "staging": self._staging,
+        }
+        thread = self._prefetch_thread = threading.Thread(
             target=self._prefetch_worker,
-            args=(batch_indices_list,),
+            args=(batches, out, stop, batch_options),
             daemon=True
         )
-        self._prefetch_thread.start()
+        thread.start()
         
-        # Yield batches from queue
-        while True:
-            try:
-                batch = self._prefetch_queue.get(timeout=60)
+        try:
+            while True:
+                # No timeout: a slow read must not end the epoch early
+                batch = out.get()
                 
                 if batch is None:
                     break
@@ -250,21 +563,52 @@ class DataLoader:
                     raise batch
                 
                 yield batch
-                
-            except queue.Empty:
-                break
+        finally:
+            # Also runs when the consumer breaks out of the loop early, so
+            # the producer stops instead of blocking on a full queue
+            stop.set()
+            if thread.is_alive():
+                thread.join(timeout=1)
+    
+    def __iter__(self) -> Iterator[ZenithBatch]:
+        """Iterate over batches with async prefetching."""
+        if self._streams_from_file():
+            batches = self._stream_batches()
+        else:
+            self._load_data()
+            
+            if self._data is None:
+                return
+            
+            if self.shuffle and self.shuffle_mode == "blocked":
+                batches = self._blocked_batches()
+            elif self.shuffle and self.shuffle_mode == "random_sample":
+                batches = self._sampled_batches()
+            elif self.shuffle:
+                indices = np.arange(self._num_rows, dtype=np.int64)
+                # In-place Fisher-Yates in C over the int64 buffer
+                self._rng.shuffle(indices)
+                # The gather runs in the prefetch thread, once per epoch
+                batches = self._shuffled_batches(indices)
+            else:
+                if self._record_batches is None:
+                    self._record_batches = list(self._table_batches(self._data))
+                batches = iter(self._record_batches)
         
-        # Cleanup
-        self._stop_prefetch.set()
-        if self._prefetch_thread and self._prefetch_thread.is_alive():
-            self._prefetch_thread.join(timeout=1)
+        yield from self._prefetch_iter(batches)
     
     def __len__(self) -> int:
         """Return number of batches."""
-        self._load_data()
-        if self._data is None:
-            return 0
-        return (self._data.num_rows + self.batch_size - 1) // self.batch_size
+        if self._num_rows is None:
+            if self._streams_from_file():
+                # Row count from the footer; no need to load the table
+                import pyarrow.parquet as pq
+                self._num_rows = pq.read_metadata(self.source).num_rows
+            else:
+                self._load_data()
+                if self._data is None:
+                    return 0
+        return (self._num_rows + self.batch_size - 1) // self.batch_size
     
     def close(self):
         """Release resources."""
@@ -272,6 +616,8 @@ class DataLoader:
         if self._prefetch_thread and self._prefetch_thread.is_alive():
             self._prefetch_thread.join(timeout=1)
         self._data = None
+        self._num_rows = None
+        self._record_batches = None
     
     def __enter__(self):
         return self
@@ -294,10 +640,14 @@ class DataLoader:
 # Utility functions
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def auto_device() -> str:
     """
     Automatically detect the best available device.
     
+    The result is cached: probing imports torch/tensorflow and initializes
+    the CUDA driver, which is too slow to repeat for every DataLoader.
+    
     Returns:
         "cuda" if CUDA is available, otherwise "cpu"
     
@@ -6,19 +6,84 @@ Provides job submission, monitoring, and cluster status.
 """
 
 import os
+import re
+import json
+import random
+import socket
 import time
 import functools
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Callable
+from typing import Optional, List, Dict, Callable, Iterator
 from enum import Enum
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
 
+# JSON codec: orjson when installed, otherwise a compact stdlib encoder
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    _encoder = json.JSONEncoder(separators=(",", ":"))
+    
+    def _dumps(obj) -> bytes:
+        return _encoder.encode(obj).encode()
+    
+    _loads = json.loads
+
+
+# Retry backoff: min(cap, base * 2**attempt), jittered by +/-50%
+_BACKOFF_BASE = 0.1
+_BACKOFF_CAP = 30.0
+
+# Gateway errors the scheduler's proxy returns while it restarts
+_RETRY_STATUSES = (502, 503, 504)
+
+
+def _backoff(attempt: int) -> float:
+    """Sleep time before retry number ``attempt`` (0-based)."""
+    return min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+# Memory sizes for @job, e.g. "8GB" or "512 mb"
+_MEMORY_RE = re.compile(r"^\s*(.*?)\s*(TB|GB|MB)\s*$", re.IGNORECASE)
+_MEMORY_UNITS_MB = {"TB": 1024 * 1024, "GB": 1024, "MB": 1}
+
+
+# Pooled connections per scheduler host; covers get_many's concurrency
+_POOL_MAXSIZE = 32
+
+# Idle seconds before the first TCP keep-alive probe
+_KEEPALIVE_IDLE = 30
+
+
+if REQUESTS_AVAILABLE:
+    class _KeepAliveAdapter(HTTPAdapter):
+        """
+        HTTPAdapter whose sockets send TCP keep-alive probes.
+        
+        Keeps pooled connections alive through the idle gaps of long
+        wait() loops, so polls reuse them instead of reconnecting.
+        """
+        
+        def init_poolmanager(self, *args, **kwargs):
+            options = list(HTTPConnection.default_socket_options)
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, _KEEPALIVE_IDLE))
+            kwargs["socket_options"] = options
+            super().init_poolmanager(*args, **kwargs)
+
+
 class JobState(Enum):
     """Job execution states."""
     QUEUED = "Queued"
@@ -30,6 +95,15 @@ class JobState(Enum):
     TIMEOUT = "Timeout"
 
 
+# States after which a job no longer changes
+_TERMINAL_STATES = frozenset({
+    JobState.COMPLETED,
+    JobState.FAILED,
+    JobState.CANCELLED,
+    JobState.TIMEOUT,
+})
+
+
 @dataclass
 class JobConfig:
     """Job configuration."""
@@ -151,14 +225,16 @@ class SchedulerClient:
         base_url: Optional[str] = None,
         timeout: float = 30.0,
         retry_count: int = 3,
+        connect_timeout: float = 2.0,
     ):
         """
         Initialize scheduler client.
         
         Args:
             base_url: Scheduler API URL (default: ZENITH_SCHEDULER_URL env or localhost:8080)
-            timeout: Request timeout in seconds
+            timeout: Read timeout in seconds
             retry_count: Number of retries for failed requests
+            connect_timeout: Connection timeout in seconds
         """
         if not REQUESTS_AVAILABLE:
             raise ImportError(
@@ -171,8 +247,30 @@ class SchedulerClient:
             "http://localhost:8080"
         )
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
         self.retry_count = retry_count
         self._session = requests.Session()
+        
+        # job_id -> (ETag, Job) from the last conditional GET; only jobs
+        # that can still change are kept
+        self._job_cache: Dict[str, tuple] = {}
+        
+        # Gateway errors are retried by urllib3 for idempotent methods only;
+        # a retried POST could submit a job twice. Connection errors and
+        # timeouts are left to _request's loop.
+        retry = Retry(
+            total=None,
+            connect=0,
+            read=0,
+            status=max(retry_count - 1, 0),
+            backoff_factor=_BACKOFF_BASE,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "DELETE"}),
+            raise_on_status=False,
+        )
+        adapter = _KeepAliveAdapter(pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
     
     def _request(
         self, 
@@ -181,15 +279,38 @@ class SchedulerClient:
         json: Optional[dict] = None,
     ) -> dict:
         """Make API request with retries."""
+        response = self._send(method, endpoint, json=json)
+        return _loads(response.content) if response.content else {}
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[dict] = None,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, object]] = None,
+        stream: bool = False,
+    ) -> "requests.Response":
+        """Send API request with retries, returning the raw response."""
         url = f"{self.base_url}{endpoint}"
         
+        # Encode once up front rather than letting requests re-encode
+        # the body with the stdlib json module on every attempt
+        data = None
+        if json is not None:
+            data = _dumps(json)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+        
         for attempt in range(self.retry_count):
             try:
                 response = self._session.request(
                     method=method,
                     url=url,
-                    json=json,
-                    timeout=self.timeout,
+                    data=data,
+                    headers=headers,
+                    params=params,
+                    stream=stream,
+                    timeout=(self.connect_timeout, self.timeout),
                 )
                 
                 if response.status_code >= 400:
@@ -201,16 +322,16 @@ class SchedulerClient:
                         pass
                     raise SchedulerError(f"API error ({response.status_code}): {error_msg}")
                 
-                return response.json() if response.text else {}
+                return response
                 
             except requests.exceptions.ConnectionError as e:
                 if attempt == self.retry_count - 1:
                     raise SchedulerError(f"Connection failed: {e}")
-                time.sleep(1 * (attempt + 1))
+                time.sleep(_backoff(attempt))
             except requests.exceptions.Timeout:
                 if attempt == self.retry_count - 1:
                     raise SchedulerError("Request timed out")
-                time.sleep(1 * (attempt + 1))
+                time.sleep(_backoff(attempt))
         
         raise SchedulerError("Max retries exceeded")
     
@@ -266,13 +387,52 @@ class SchedulerClient:
         Returns:
             Job object or None if not found
         """
+        cached = self._job_cache.get(job_id)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
         try:
-            response = self._request("GET", f"/api/v1/jobs/{job_id}")
-            if response.get('state') == 'NOT_FOUND':
-                return None
-            return Job.from_response(response)
+            response = self._send("GET", f"/api/v1/jobs/{job_id}", headers=headers)
         except SchedulerError:
+            self._job_cache.pop(job_id, None)
             return None
+        
+        # Unchanged since the last poll: reuse the parsed job
+        if response.status_code == 304 and cached:
+            return cached[1]
+        
+        data = _loads(response.content) if response.content else {}
+        if data.get('state') == 'NOT_FOUND':
+            self._job_cache.pop(job_id, None)
+            return None
+        
+        job = Job.from_response(data)
+        etag = response.headers.get("ETag")
+        if etag and job.state not in _TERMINAL_STATES:
+            self._job_cache[job_id] = (etag, job)
+        else:
+            # Finished jobs are not polled again
+            self._job_cache.pop(job_id, None)
+        return job
+    
+    def get_many(self, job_ids: List[str], max_workers: int = 8) -> Dict[str, Optional[Job]]:
+        """
+        Get the status of several jobs concurrently.
+        
+        The requests share the session's connection pool, so polling a
+        fleet of jobs costs roughly one round trip instead of one per job.
+        
+        Args:
+            job_ids: Job IDs to query
+            max_workers: Maximum number of requests in flight
+            
+        Returns:
+            Mapping of job ID to Job object (None if not found)
+        """
+        if len(job_ids) <= 1:
+            return {job_id: self.get(job_id) for job_id in job_ids}
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(job_ids))) as pool:
+            return dict(zip(job_ids, pool.map(self.get, job_ids)))
     
     def cancel(self, job_id: str) -> bool:
         """
@@ -286,19 +446,68 @@ class SchedulerClient:
         """
         try:
             response = self._request("DELETE", f"/api/v1/jobs/{job_id}")
-            return response.get('status') == 'success'
         except SchedulerError:
             return False
-    
-    def list_jobs(self) -> List[Job]:
+        if response.get('status') != 'success':
+            return False
+        self._job_cache.pop(job_id, None)
+        return True
+    
+    def list_jobs(
+        self,
+        *,
+        state: Optional[JobState] = None,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Job]:
         """
-        List all jobs.
+        List jobs, optionally filtered on the scheduler.
         
+        Args:
+            state: Only jobs in this state
+            user_id: Only jobs submitted by this user
+            limit: Maximum number of jobs to return
+            
         Returns:
             List of Job objects
         """
-        response = self._request("GET", "/api/v1/jobs")
-        return [Job.from_response(j) for j in response]
+        return list(self.iter_jobs(state=state, user_id=user_id, limit=limit))
+    
+    def iter_jobs(
+        self,
+        *,
+        state: Optional[JobState] = None,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Job]:
+        """
+        Stream jobs, optionally filtered on the scheduler.
+        
+        Jobs are requested as NDJSON and decoded one line at a time, so
+        memory stays flat on large clusters and breaking out of the loop
+        stops reading the response.
+        
+        Args:
+            state: Only jobs in this state
+            user_id: Only jobs submitted by this user
+            limit: Maximum number of jobs to return
+            
+        Yields:
+            Job objects
+        """
+        params = {"format": "ndjson"}
+        if state is not None:
+            params["state"] = state.value
+        if user_id is not None:
+            params["user_id"] = user_id
+        if limit is not None:
+            params["limit"] = limit
+        
+        response = self._send("GET", "/api/v1/jobs", params=params, stream=True)
+        with response:
+            for line in response.iter_lines():
+                if line:
+                    yield Job.from_response(_loads(line))
     
     def cluster_status(self) -> ClusterStatus:
         """
@@ -326,15 +535,21 @@ class SchedulerClient:
         timeout: Optional[float] = None,
         poll_interval: float = 5.0,
         callback: Optional[Callable[[Job], None]] = None,
+        max_poll_interval: float = 60.0,
     ) -> Job:
         """
         Wait for job to complete.
         
+        The polling interval adapts to the job: it doubles (up to
+        max_poll_interval) while the job is unchanged and halves back
+        towards poll_interval when it changes.
+        
         Args:
             job_id: Job ID to wait for
             timeout: Maximum wait time in seconds (None = infinite)
-            poll_interval: Time between status checks
+            poll_interval: Minimum time between status checks
             callback: Optional function to call on each poll
+            max_poll_interval: Maximum time between status checks
             
         Returns:
             Final job state
@@ -343,12 +558,8 @@ class SchedulerClient:
             SchedulerError: If timeout exceeded or job not found
         """
         start_time = time.time()
-        terminal_states = {
-            JobState.COMPLETED, 
-            JobState.FAILED, 
-            JobState.CANCELLED,
-            JobState.TIMEOUT,
-        }
+        interval = poll_interval
+        previous = None
         
         while True:
             job = self.get(job_id)
@@ -359,12 +570,69 @@ class SchedulerClient:
             if callback:
                 callback(job)
             
-            if job.state in terminal_states:
+            if job.state in _TERMINAL_STATES:
                 return job
             
-            if timeout and (time.time() - start_time) > timeout:
+            elapsed = time.time() - start_time
+            if timeout and elapsed > timeout:
                 raise SchedulerError(f"Timeout waiting for job {job_id}")
             
+            if previous is not None:
+                if job == previous:
+                    interval = min(interval * 2, max_poll_interval)
+                else:
+                    interval = max(poll_interval, interval / 2)
+            previous = job
+            
+            time.sleep(min(interval, timeout - elapsed) if timeout else interval)
+    
+    def wait_all(
+        self,
+        job_ids: List[str],
+        timeout: Optional[float] = None,
+        poll_interval: float = 5.0,
+        callback: Optional[Callable[[Job], None]] = None,
+    ) -> Dict[str, Job]:
+        """
+        Wait for several jobs to complete, polling them together.
+        
+        Each poll queries all unfinished jobs concurrently (see get_many),
+        so the poll period does not grow with the number of jobs.
+        
+        Args:
+            job_ids: Job IDs to wait for
+            timeout: Maximum wait time in seconds (None = infinite)
+            poll_interval: Time between status checks
+            callback: Optional function to call for each job on each poll
+            
+        Returns:
+            Mapping of job ID to final Job state
+            
+        Raises:
+            SchedulerError: If timeout exceeded or a job is not found
+        """
+        start_time = time.time()
+        finished: Dict[str, Job] = {}
+        pending = list(dict.fromkeys(job_ids))
+        
+        while True:
+            for job_id, job in self.get_many(pending).items():
+                if job is None:
+                    raise SchedulerError(f"Job {job_id} not found")
+                
+                if callback:
+                    callback(job)
+                
+                if job.state in _TERMINAL_STATES:
+                    finished[job_id] = job
+            
+            pending = [job_id for job_id in pending if job_id not in finished]
+            if not pending:
+                return finished
+            
+            if timeout and (time.time() - start_time) > timeout:
+                raise SchedulerError(f"Timeout waiting for jobs: {', '.join(pending)}")
+            
             time.sleep(poll_interval)
 
 
@@ -422,13 +690,9 @@ def job(
     # Parse memory string
     memory_mb = 4096
     if isinstance(memory, str):
-        memory = memory.upper().strip()
-        if memory.endswith("GB"):
-            memory_mb = int(float(memory[:-2]) * 1024)
-        elif memory.endswith("MB"):
-            memory_mb = int(float(memory[:-2]))
-        elif memory.endswith("TB"):
-            memory_mb = int(float(memory[:-2]) * 1024 * 1024)
+        match = _MEMORY_RE.match(memory)
+        if match:
+            memory_mb = int(float(match.group(1)) * _MEMORY_UNITS_MB[match.group(2).upper()])
     elif isinstance(memory, (int, float)):
         memory_mb = int(memory)
     
@@ -7,6 +7,8 @@ A tf.data.Dataset backed by Zenith's high-performance data loading.
 from pathlib import Path
 from typing import Optional, Union, Tuple, Any
 
+import pyarrow as pa
+
 try:
     import tensorflow as tf
     TF_AVAILABLE = True
@@ -14,6 +16,57 @@ except ImportError:
     TF_AVAILABLE = False
 
 
+# Tables larger than this are streamed in chunks rather than embedded
+# with from_tensor_slices (whose constants are subject to the 2GB graph limit)
+_TENSOR_SLICES_MAX_BYTES = 1 << 30
+
+# Rows per generator call on the chunked path
+_GENERATOR_CHUNK_ROWS = 4096
+
+
+def _column_arrays(data) -> dict:
+    """Column name -> NumPy array for a pa.Table or pa.RecordBatch."""
+    return {
+        name: column.to_numpy(zero_copy_only=False)
+        for name, column in zip(data.schema.names, data.columns)
+    }
+
+
+# Arrow type -> TensorFlow dtype name of the column once converted to NumPy
+_TF_DTYPES = {
+    pa.bool_(): "bool",
+    pa.int8(): "int8",
+    pa.int16(): "int16",
+    pa.int32(): "int32",
+    pa.int64(): "int64",
+    pa.uint8(): "uint8",
+    pa.uint16(): "uint16",
+    pa.uint32(): "uint32",
+    pa.uint64(): "uint64",
+    pa.float16(): "float16",
+    pa.float32(): "float32",
+    pa.float64(): "float64",
+    pa.string(): "string",
+    pa.large_string(): "string",
+    pa.binary(): "string",
+    pa.large_binary(): "string",
+}
+
+
+def _tf_dtype(arrow_type, has_nulls: bool):
+    """TensorFlow dtype of a column once converted to NumPy."""
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type  # Converted to its decoded values
+    if has_nulls and pa.types.is_integer(arrow_type):
+        return tf.float64  # NumPy represents the nulls as NaN
+    try:
+        return tf.as_dtype(_TF_DTYPES[arrow_type])
+    except KeyError:
+        raise TypeError(
+            f"No TensorFlow dtype for Arrow type {arrow_type}; pass output_signature"
+        ) from None
+
+
 class ZenithDataset:
     """
     TensorFlow-compatible Dataset using Zenith for data loading.
@@ -26,7 +79,7 @@ class ZenithDataset:
         ...     source="/data/imagenet",
         ...     preprocessing_plugin="augment.wasm"
         ... )
-        >>> dataset = dataset.batch(32).prefetch(tf.data.AUTOTUNE)
+        >>> dataset = dataset.cache().shuffle(10000).batch(32).prefetch(tf.data.AUTOTUNE)
         >>> model.fit(dataset, epochs=10)
     """
     
@@ -44,7 +97,8 @@ class ZenithDataset:
             source: Path to data source
             preprocessing_plugin: WASM plugin for preprocessing
             label_column: Name of label column
-            output_signature: TensorFlow output signature spec
+            output_signature: TensorFlow output signature spec; columns are
+                cast to its dtypes (default: the columns' own Arrow types)
         """
         if not TF_AVAILABLE:
             raise ImportError(
@@ -60,6 +114,7 @@ class ZenithDataset:
         self._engine = None
         self._data = None
         self._tf_dataset = None
+        self._pending_ops: list = []
     
     def _ensure_loaded(self):
         """Load data and create tf.data.Dataset."""
@@ -75,98 +130,127 @@ class ZenithDataset:
     
     def _create_tf_dataset(self):
         """Create the underlying tf.data.Dataset."""
+        if self._data.nbytes <= _TENSOR_SLICES_MAX_BYTES:
+            # Each column once as a NumPy array (zero-copy for numeric
+            # columns without nulls); tf.data slices them natively instead
+            # of calling back into Python for every element
+            self._tf_dataset = tf.data.Dataset.from_tensor_slices(
+                self._elements(_column_arrays(self._data))
+            )
+        else:
+            self._tf_dataset = self._create_chunked_dataset()
+    
+    def _create_chunked_dataset(self):
+        """
+        Stream a large table through a generator, one record batch per call.
+        
+        Used when the table is too big to embed with from_tensor_slices.
+        Each call yields whole column arrays and unbatch() splits them, so
+        the Python generator runs once per chunk rather than once per row.
+        """
         def generator():
-            for i in range(self._data.num_rows):
-                row = {col: self._data.column(col)[i].as_py() 
-                       for col in self._data.column_names}
-                
-                if self.label_column and self.label_column in row:
-                    label = row.pop(self.label_column)
-                    features = row
-                    yield features, label
-                else:
-                    yield row
+            for batch in self._data.to_batches(max_chunksize=_GENERATOR_CHUNK_ROWS):
+                yield self._elements(_column_arrays(batch))
         
-        # Infer output signature if not provided
         if self.output_signature:
-            signature = self.output_signature
+            signature = tf.nest.map_structure(
+                lambda spec: tf.TensorSpec(shape=(None,) + tuple(spec.shape), dtype=spec.dtype),
+                self.output_signature,
+            )
         else:
-            # Default to string -> float32 mapping
-            sample_row = {col: self._data.column(col)[0].as_py() 
-                         for col in self._data.column_names}
-            
-            if self.label_column:
-                label = sample_row.pop(self.label_column)
-                feature_spec = {k: tf.TensorSpec(shape=(), dtype=tf.float32) 
-                               for k in sample_row.keys()}
-                label_spec = tf.TensorSpec(shape=(), dtype=tf.int64)
-                signature = (feature_spec, label_spec)
-            else:
-                signature = {k: tf.TensorSpec(shape=(), dtype=tf.float32) 
-                            for k in sample_row.keys()}
+            specs = {
+                field.name: tf.TensorSpec(
+                    shape=(None,),
+                    dtype=_tf_dtype(field.type, self._data.column(field.name).null_count > 0),
+                )
+                for field in self._data.schema
+            }
+            signature = self._elements(specs)
         
-        self._tf_dataset = tf.data.Dataset.from_generator(
-            generator,
-            output_signature=signature
-        )
+        return tf.data.Dataset.from_generator(generator, output_signature=signature).unbatch()
     
-    def batch(self, batch_size: int) -> 'ZenithDataset':
-        """Batch the dataset."""
-        self._ensure_loaded()
-        if self._tf_dataset is not None:
-            self._tf_dataset = self._tf_dataset.batch(batch_size)
+    def _elements(self, columns: dict):
+        """Split a dict of per-column values into (features, label) or features."""
+        label = columns.pop(self.label_column, None) if self.label_column else None
+        if self.output_signature:
+            columns, label = self._cast_to_signature(columns, label)
+        return columns if label is None else (columns, label)
+    
+    def _cast_to_signature(self, features: dict, label) -> Tuple[dict, Any]:
+        """Convert columns to the dtypes of a user-supplied output_signature."""
+        if isinstance(self.output_signature, tuple):
+            feature_spec, label_spec = self.output_signature
+        else:
+            feature_spec, label_spec = self.output_signature, None
+        
+        features = {
+            name: arr.astype(feature_spec[name].dtype.as_numpy_dtype, copy=False)
+            if name in feature_spec else arr
+            for name, arr in features.items()
+        }
+        if label is not None and label_spec is not None:
+            label = label.astype(label_spec.dtype.as_numpy_dtype, copy=False)
+        return features, label
+    
+    def _record(self, op: str, *args, **kwargs) -> 'ZenithDataset':
+        """
+        Record a tf.data transformation to apply when the dataset is used.
+        
+        Chaining transformations does not load the source; it is read on
+        first iteration (or element_spec access) and the recorded ops are
+        then applied in order.
+        """
+        self._pending_ops.append((op, args, kwargs))
         return self
     
+    def _dataset(self):
+        """The tf.data.Dataset with all recorded transformations applied."""
+        self._ensure_loaded()
+        for op, args, kwargs in self._pending_ops:
+            self._tf_dataset = getattr(self._tf_dataset, op)(*args, **kwargs)
+        self._pending_ops.clear()
+        return self._tf_dataset
+    
+    def batch(self, batch_size: int, drop_remainder: bool = False) -> 'ZenithDataset':
+        """Batch the dataset."""
+        return self._record("batch", batch_size, drop_remainder=drop_remainder)
+    
+    def cache(self, filename: str = "") -> 'ZenithDataset':
+        """Cache elements after the first epoch (in memory by default)."""
+        return self._record("cache", filename)
+    
     def prefetch(self, buffer_size):
         """Prefetch batches."""
-        self._ensure_loaded()
-        self._tf_dataset = self._tf_dataset.prefetch(buffer_size)
-        return self
+        return self._record("prefetch", buffer_size)
     
     def shuffle(self, buffer_size: int) -> 'ZenithDataset':
         """Shuffle the dataset."""
-        self._ensure_loaded()
-        if self._tf_dataset is not None:
-            self._tf_dataset = self._tf_dataset.shuffle(buffer_size)
-        return self
+        return self._record("shuffle", buffer_size)
     
     def map(self, map_func, num_parallel_calls=None):
         """Apply a transformation function."""
-        self._ensure_loaded()
-        self._tf_dataset = self._tf_dataset.map(
-            map_func, 
-            num_parallel_calls=num_parallel_calls
-        )
-        return self
+        return self._record("map", map_func, num_parallel_calls=num_parallel_calls)
     
     def repeat(self, count=None):
         """Repeat the dataset."""
-        self._ensure_loaded()
-        self._tf_dataset = self._tf_dataset.repeat(count)
-        return self
+        return self._record("repeat", count)
     
     def take(self, count: int) -> 'ZenithDataset':
         """Take first N elements."""
-        self._ensure_loaded()
-        if self._tf_dataset is not None:
-            self._tf_dataset = self._tf_dataset.take(count)
-        return self
+        return self._record("take", count)
     
     def __iter__(self):
         """Iterate over the dataset."""
-        self._ensure_loaded()
-        return iter(self._tf_dataset)
+        return iter(self._dataset())
     
     def as_numpy_iterator(self):
         """Return numpy iterator."""
-        self._ensure_loaded()
-        return self._tf_dataset.as_numpy_iterator()
+        return self._dataset().as_numpy_iterator()
     
     @property
     def element_spec(self):
         """Return element specification."""
-        self._ensure_loaded()
-        return self._tf_dataset.element_spec
+        return self._dataset().element_spec
     
     def close(self):
         """Release resources."""
@@ -175,6 +259,7 @@ class ZenithDataset:
             self._engine = None
         self._data = None
         self._tf_dataset = None
+        self._pending_ops.clear()
     
     def __repr__(self):
         return (
@@ -5,6 +5,9 @@ Drop-in replacement for torch.utils.data.DataLoader with
 Zenith's high-performance backend.
 """
 
+import itertools
+import queue
+import threading
 from pathlib import Path
 from typing import Optional, Union, Callable, Any
 
@@ -19,6 +22,143 @@ except ImportError:
 from zenith.torch.dataset import ZenithDataset, ZenithMapDataset
 
 
+def _map_tensors(batch, fn):
+    """Apply fn to every tensor in a (nested) batch structure."""
+    if isinstance(batch, torch.Tensor):
+        return fn(batch)
+    if isinstance(batch, dict):
+        return {k: _map_tensors(v, fn) for k, v in batch.items()}
+    if isinstance(batch, (list, tuple)):
+        return type(batch)(_map_tensors(v, fn) for v in batch)
+    return batch
+
+
+_END = object()
+
+
+def _prefetch_in_thread(batches, queue_size: int):
+    """
+    Yield batches produced by a daemon thread, up to queue_size ahead.
+    
+    Lets collation and host-side work for the next batches overlap with
+    the consumer's step, also for CPU-only training.
+    """
+    batch_queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                batch_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def worker():
+        try:
+            for batch in batches:
+                if not put(batch):
+                    return
+        except Exception as e:
+            put(e)
+        finally:
+            put(_END)
+    
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = batch_queue.get()
+            if item is _END:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # Also runs when the consumer stops early, releasing the worker
+        stop.set()
+        thread.join(timeout=1)
+
+
+class _CUDAPrefetcher:
+    """
+    Iterator that copies the next batch to the GPU while the current one is used.
+    
+    Host-to-device copies are issued with non_blocking=True on a side
+    stream, so they overlap with the compute queued on the current
+    stream; __next__ makes the current stream wait for the copy before
+    handing the batch out.
+    
+    With ring_size > 0, host tensors are first copied into a ring of
+    pinned buffers that are allocated once and reused, instead of being
+    pinned (allocated and copied) anew for every batch. A slot is only
+    refilled after the device copy out of it has completed.
+    """
+    
+    def __init__(self, batches, device: str, ring_size: int = 0):
+        self._batches = batches
+        self._device = torch.device(device)
+        self._stream = torch.cuda.Stream(device=self._device)
+        self._ring = [{} for _ in range(ring_size)]
+        self._ring_events = [None] * ring_size
+        self._slot = 0
+        self._preload()
+    
+    def _stage(self, batch, slot: int):
+        """Copy the batch's host tensors into the pinned buffers of a ring slot."""
+        if self._ring_events[slot] is not None:
+            self._ring_events[slot].synchronize()
+        buffers = self._ring[slot]
+        position = itertools.count()
+        
+        def copy(t):
+            if t.is_cuda:
+                return t
+            i = next(position)
+            buf = buffers.get(i)
+            if buf is None or buf.shape != t.shape or buf.dtype != t.dtype:
+                # First use, or a differently shaped (e.g. last) batch
+                buf = buffers[i] = torch.empty(t.shape, dtype=t.dtype, pin_memory=True)
+            return buf.copy_(t)
+        
+        return _map_tensors(batch, copy)
+    
+    def _preload(self):
+        try:
+            batch = next(self._batches)
+        except StopIteration:
+            self._next = _END
+            return
+        if self._ring:
+            slot = self._slot
+            self._slot = (slot + 1) % len(self._ring)
+            batch = self._stage(batch, slot)
+        with torch.cuda.stream(self._stream):
+            self._next = _map_tensors(
+                batch, lambda t: t.to(self._device, non_blocking=True)
+            )
+            if self._ring:
+                self._ring_events[slot] = torch.cuda.Event()
+                self._ring_events[slot].record(self._stream)
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        if self._next is _END:
+            raise StopIteration
+        
+        current = torch.cuda.current_stream(self._device)
+        current.wait_stream(self._stream)
+        batch = self._next
+        # Allocated on the side stream, consumed on the current one
+        _map_tensors(batch, lambda t: t.record_stream(current))
+        
+        self._preload()
+        return batch
+
+
 class DataLoader:
     """
     High-performance DataLoader powered by Zenith.
@@ -50,6 +190,9 @@ class DataLoader:
         label_column: Optional[str] = None,
         prefetch_factor: int = 2,
         persistent_workers: bool = True,
+        device: Optional[str] = None,
+        prefetch_queue: int = 0,
+        pinned_buffer_ring: int = 0,
     ):
         """
         Initialize the Zenith DataLoader.
@@ -67,6 +210,14 @@ class DataLoader:
             label_column: Name of label column
             prefetch_factor: Batches to prefetch per worker
             persistent_workers: Keep workers alive between epochs
+            device: CUDA device to move batches to (e.g. "cuda:0"); the
+                copy of each batch overlaps with compute on the previous one
+            prefetch_queue: Batches a background thread fetches ahead of
+                the training loop (0 = no prefetch thread)
+            pinned_buffer_ring: With a CUDA device, stage batches through
+                this many reused pinned host buffers instead of pinning
+                every batch (0 = use pin_memory). Best for fixed-shape
+                batches, e.g. ZenithMapDataset(stack_features=True)
         """
         if not TORCH_AVAILABLE:
             raise ImportError(
@@ -77,6 +228,18 @@ class DataLoader:
         self.batch_size = batch_size
         self.shuffle = shuffle
         self.num_workers = num_workers
+        self.device = device
+        self.prefetch_queue = prefetch_queue
+        self.pinned_buffer_ring = pinned_buffer_ring
+        
+        use_ring = (
+            pinned_buffer_ring > 0
+            and device is not None
+            and torch.device(device).type == "cuda"
+        )
+        if use_ring:
+            # The ring replaces per-batch pinning by the torch DataLoader
+            pin_memory = False
         
         # Create dataset if source is a path
         if isinstance(source, (str, Path)):
@@ -121,7 +284,12 @@ class DataLoader:
     
     def __iter__(self):
         """Iterate over batches."""
-        return iter(self._loader)
+        batches = iter(self._loader)
+        if self.prefetch_queue > 0:
+            batches = _prefetch_in_thread(batches, self.prefetch_queue)
+        if self.device is not None and torch.device(self.device).type == "cuda":
+            return _CUDAPrefetcher(batches, self.device, self.pinned_buffer_ring)
+        return batches
     
     def __len__(self):
         """Number of batches."""
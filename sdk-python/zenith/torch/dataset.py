@@ -4,8 +4,12 @@ Zenith PyTorch Dataset
 A PyTorch Dataset backed by Zenith's high-performance data loading.
 """
 
+import functools
+import hashlib
+import math
+import os
 from pathlib import Path
-from typing import Optional, Union, Callable, Any, Dict
+from typing import Optional, Union, Callable, Any, Dict, List
 
 try:
     import torch
@@ -16,10 +20,245 @@ except ImportError:
     Dataset = object
     IterableDataset = object
 
+import numpy as np
 import pyarrow as pa
 
 
-class ZenithDataset(IterableDataset if TORCH_AVAILABLE else object):  # type: ignore[misc]
+def _load_table(
+    engine,
+    source: Path,
+    cache_dir: Optional[Path],
+    columns: Optional[List[str]] = None,
+) -> pa.Table:
+    """
+    Load source through the engine, optionally via a shared IPC cache.
+    
+    With a cache_dir, the decoded table is written once to an uncompressed
+    Arrow IPC file keyed by the source's path, size and mtime, and then
+    memory-mapped. Later loads of the same file (e.g. one per DataLoader
+    worker) map the cache instead of decoding again, and all processes
+    share its pages through the OS page cache instead of holding copies.
+    Only the given columns are read, and the cache is keyed by them too.
+    """
+    if cache_dir is None:
+        return engine.load(source, columns=columns)
+    
+    try:
+        stat = source.stat()
+    except OSError:
+        return engine.load(source, columns=columns)
+    
+    key = f"{source.resolve()}:{stat.st_size}:{stat.st_mtime_ns}:{columns}"
+    path = cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.arrow"
+    if not path.exists():
+        table = engine.load(source, columns=columns)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Written under a private name and renamed, so concurrent workers
+        # never map a partial file
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with pa.OSFile(str(tmp), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, path)
+    
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+
+def _column_arrays(table: pa.Table) -> Dict[str, Union[np.ndarray, list]]:
+    """
+    Materialize every column once as a NumPy array or a Python list.
+    
+    Samples are then assembled by indexing these, instead of resolving
+    the column and boxing an Arrow scalar for every cell. Primitive
+    columns become NumPy arrays; strings, nested and other types are
+    converted in one to_pylist() pass, which avoids NumPy object arrays
+    (and the pandas conversion path, which rejects some types).
+    
+    Dictionary-encoded columns without nulls are exposed by their integer
+    codes, so categorical labels need no decoding; see _categories(). The
+    table's dictionaries must be unified (pa.Table.unify_dictionaries).
+    """
+    arrays = {}
+    for name, column in zip(table.column_names, table.columns):
+        if pa.types.is_dictionary(column.type) and not column.null_count:
+            arrays[name] = column.combine_chunks().indices.to_numpy()
+        elif pa.types.is_primitive(column.type):
+            arrays[name] = column.to_numpy()
+        else:
+            arrays[name] = column.to_pylist()
+    return arrays
+
+
+def _categories(table: pa.Table) -> Dict[str, list]:
+    """Values behind the codes of each dictionary column from _column_arrays()."""
+    return {
+        name: column.chunk(0).dictionary.to_pylist()
+        for name, column in zip(table.column_names, table.columns)
+        if pa.types.is_dictionary(column.type) and not column.null_count and column.num_chunks
+    }
+
+
+def _column_tensors(table: pa.Table) -> Dict[str, "torch.Tensor"]:
+    """
+    Share numeric columns without nulls with torch through DLPack.
+    
+    Indexing the returned tensors gives views, so samples from these
+    columns need no tensor construction or copy. The views alias the
+    table's buffers: writing to one in place changes the table itself.
+    """
+    tensors = {}
+    for name in table.column_names:
+        column = table.column(name)
+        col_type = column.type
+        if column.null_count or not (pa.types.is_integer(col_type) or pa.types.is_floating(col_type)):
+            continue
+        try:
+            tensors[name] = torch.from_dlpack(column.combine_chunks())
+        except (TypeError, BufferError):
+            pass  # Stays on the NumPy path
+    return tensors
+
+
+def _sample_columns(table: pa.Table, arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """Per-sample source for each column: a shared tensor or a NumPy array."""
+    tensors = _column_tensors(table)
+    return {name: tensors.get(name, arr) for name, arr in arrays.items()}
+
+
+# Column key of the feature matrix built for stack_features=True
+_STACKED_FEATURES = "__features__"
+
+
+def _as_tensor(value) -> "torch.Tensor":
+    """Tensor for one sample value; tensor views pass through as-is."""
+    return value if isinstance(value, torch.Tensor) else torch.tensor(value)
+
+
+def _owned_tensor(value) -> "torch.Tensor":
+    """Tensor for one sample value that shares no memory with the table."""
+    return value.clone() if isinstance(value, torch.Tensor) else torch.tensor(value)
+
+
+def _compile_errors() -> tuple:
+    """Exception types raised when dynamo or inductor fails to compile."""
+    try:
+        from torch._dynamo import exc
+    except ImportError:
+        return ()
+    names = ("TorchDynamoException", "BackendCompilerFailed")
+    return tuple(getattr(exc, name) for name in names if hasattr(exc, name))
+
+
+def _compiled(fn: Optional[Callable]) -> Optional[Callable]:
+    """
+    torch.compile a user transform, keeping the plain function as fallback.
+    
+    Compilation happens on the first call; if dynamo or inductor fails
+    (unsupported Python in the transform, no compiler toolchain), that and
+    later calls run the original function. Any other exception comes from
+    the transform itself and propagates unchanged.
+    """
+    if fn is None or not hasattr(torch, "compile"):
+        return fn
+    
+    compile_errors = _compile_errors()
+    compiled = torch.compile(fn, dynamic=False)
+    current = compiled
+    
+    @functools.wraps(fn)
+    def call(*args, **kwargs):
+        nonlocal current
+        if current is fn:
+            return fn(*args, **kwargs)
+        try:
+            return compiled(*args, **kwargs)
+        except compile_errors:
+            current = fn
+            return fn(*args, **kwargs)
+    
+    return call
+
+
+def _unbatch(batch) -> list:
+    """Split a batched tensor, list or dict of those into per-sample values."""
+    if isinstance(batch, torch.Tensor):
+        return list(batch.unbind(0))
+    if isinstance(batch, dict):
+        return [dict(zip(batch, values)) for values in zip(*map(_unbatch, batch.values()))]
+    return list(batch)
+
+
+class _SampleBuilder:
+    """Sample assembly shared by the iterable and map-style datasets."""
+    
+    def categories(self, column: str) -> list:
+        """
+        Category values of a dictionary-encoded column.
+        
+        Samples carry such columns as integer codes; categories(column)[code]
+        is the original value.
+        """
+        self._ensure_loaded()
+        return self._categories[column]
+    
+    def _bind_emitter(self):
+        """
+        Choose the sample builder for the loaded columns.
+        
+        Whether a label is present and whether a single feature column
+        remains are fixed by the schema, so they are decided once here
+        rather than tested for every sample. The emitter takes one row as
+        a tuple of values in self._names order.
+        
+        Values handed to transform or target_transform are copied first,
+        so a transform that works in place cannot modify the shared
+        columns; without a transform, samples stay views.
+        """
+        if self.compile_transforms:
+            transform = _compiled(self.transform)
+            target_transform = _compiled(self.target_transform)
+            self._batch_transform = _compiled(getattr(self, "batch_transform", None))
+        else:
+            transform = self.transform
+            target_transform = self.target_transform
+            self._batch_transform = getattr(self, "batch_transform", None)
+        
+        names = self._names
+        label_pos = names.index(self.label_column) if self.label_column in names else None
+        feature_pos = [i for i in range(len(names)) if i != label_pos]
+        
+        feature_tensor = _owned_tensor if transform else _as_tensor
+        label_tensor = _owned_tensor if target_transform else _as_tensor
+        
+        if len(feature_pos) == 1:
+            (pos,) = feature_pos
+            
+            def features(row):
+                return feature_tensor(row[pos])
+        else:
+            keys = [(names[i], i) for i in feature_pos]
+            
+            def features(row):
+                return {name: feature_tensor(row[i]) for name, i in keys}
+        
+        if label_pos is None:
+            def emit(row):
+                x = features(row)
+                return transform(x) if transform else x
+        else:
+            def emit(row):
+                x = features(row)
+                if transform:
+                    x = transform(x)
+                y = label_tensor(row[label_pos])
+                if target_transform:
+                    y = target_transform(y)
+                return x, y
+        
+        self._emit = emit
+
+
+class ZenithDataset(_SampleBuilder, IterableDataset if TORCH_AVAILABLE else object):  # type: ignore[misc]
     """
     PyTorch-compatible Dataset using Zenith for data loading.
     
@@ -27,6 +266,15 @@ class ZenithDataset(IterableDataset if TORCH_AVAILABLE else object):  # type: ig
     without loading everything into memory, while maintaining
     PyTorch compatibility.
     
+    With num_workers > 0 each DataLoader worker yields its own
+    contiguous share of the rows, so workers split an epoch between
+    them instead of each producing all of it.
+    
+    Numeric columns without nulls are yielded as views of the loaded
+    Arrow data, not copies; modifying such a sample in place modifies
+    the dataset. Samples passed to transform or target_transform are
+    copied first.
+    
     Example:
         >>> dataset = ZenithDataset(
         ...     source="s3://bucket/training-data",
@@ -45,6 +293,8 @@ class ZenithDataset(IterableDataset if TORCH_AVAILABLE else object):  # type: ig
         target_transform: Optional[Callable] = None,
         columns: Optional[list] = None,
         label_column: Optional[str] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        compile_transforms: bool = False,
     ):
         """
         Initialize the ZenithDataset.
@@ -56,6 +306,11 @@ class ZenithDataset(IterableDataset if TORCH_AVAILABLE else object):  # type: ig
             target_transform: Optional transform to apply to labels
             columns: Specific columns to load (None = all)
             label_column: Name of the label column
+            cache_dir: Directory for a memory-mapped Arrow copy of the
+                decoded data, shared by DataLoader workers (e.g. /dev/shm)
+            compile_transforms: Wrap transform and target_transform with
+                torch.compile when the data is loaded; a transform that
+                fails to compile runs uncompiled
         """
         if not TORCH_AVAILABLE:
             raise ImportError(
@@ -71,9 +326,16 @@ class ZenithDataset(IterableDataset if TORCH_AVAILABLE else object):  # type: ig
         self.target_transform = target_transform
         self.columns = columns
         self.label_column = label_column
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.compile_transforms = compile_transforms
         
         self._engine = None
         self._data: Optional[pa.Table] = None
+        self._col_arrays: Dict[str, np.ndarray] = {}
+        self._categories: Dict[str, list] = {}
+        self._columns: Dict[str, Any] = {}
+        self._names: tuple = ()
+        self._num_rows = 0
     
     def _ensure_loaded(self):
         """Lazy load data using Zenith engine."""
@@ -84,10 +346,15 @@ class ZenithDataset(IterableDataset if TORCH_AVAILABLE else object):  # type: ig
             if self.preprocessing_plugin:
                 self._engine.load_plugin(self.preprocessing_plugin)
             
-            self._data = self._engine.load(self.source)
-            
-            if self.columns:
-                self._data = self._data.select(self.columns)
+            self._data = _load_table(
+                self._engine, self.source, self.cache_dir, self.columns
+            ).unify_dictionaries()
+            self._col_arrays = _column_arrays(self._data)
+            self._categories = _categories(self._data)
+            self._columns = _sample_columns(self._data, self._col_arrays)
+            self._names = tuple(self._columns)
+            self._bind_emitter()
+            self._num_rows = self._data.num_rows
     
     def __iter__(self):
         """Iterate over samples."""
@@ -96,41 +363,23 @@ class ZenithDataset(IterableDataset if TORCH_AVAILABLE else object):  # type: ig
         if self._data is None:
             return
         
-        for i in range(self._data.num_rows):
-            row = {col: self._data.column(col)[i].as_py() 
-                   for col in self._data.column_names}
-            
-            # Separate features and label if specified
-            if self.label_column and self.label_column in row:
-                label = row.pop(self.label_column)
-                features = row
-            else:
-                features = row
-                label = None
-            
-            # Convert to tensors
-            if len(features) == 1:
-                # Single feature column
-                features = torch.tensor(list(features.values())[0])
-            else:
-                # Multiple columns - return as dict of tensors
-                features = {k: torch.tensor(v) for k, v in features.items()}
-            
-            if self.transform:
-                features = self.transform(features)
-            
-            if label is not None:
-                label = torch.tensor(label)
-                if self.target_transform:
-                    label = self.target_transform(label)
-                yield features, label
-            else:
-                yield features
+        # Each DataLoader worker takes a disjoint, contiguous share of rows
+        start, end = 0, self._num_rows
+        info = torch.utils.data.get_worker_info()
+        if info is not None:
+            per_worker = math.ceil(end / info.num_workers)
+            start = min(end, info.id * per_worker)
+            end = min(end, start + per_worker)
+        
+        # Walk all columns in lockstep; no per-row index or column lookups
+        emit = self._emit
+        for row in zip(*(values[start:end] for values in self._columns.values())):
+            yield emit(row)
     
     def __len__(self) -> int:
         """Return dataset size."""
         self._ensure_loaded()
-        return self._data.num_rows if self._data else 0
+        return self._num_rows
     
     def close(self):
         """Release resources."""
@@ -138,6 +387,11 @@ class ZenithDataset(IterableDataset if TORCH_AVAILABLE else object):  # type: ig
             self._engine.close()
             self._engine = None
         self._data = None
+        self._col_arrays = {}
+        self._categories = {}
+        self._columns = {}
+        self._names = ()
+        self._num_rows = 0
     
     def __repr__(self):
         return (
@@ -147,7 +401,7 @@ class ZenithDataset(IterableDataset if TORCH_AVAILABLE else object):  # type: ig
         )
 
 
-class ZenithMapDataset(Dataset if TORCH_AVAILABLE else object):  # type: ignore[misc]
+class ZenithMapDataset(_SampleBuilder, Dataset if TORCH_AVAILABLE else object):  # type: ignore[misc]
     """
     Map-style PyTorch Dataset for random access.
     
@@ -156,6 +410,11 @@ class ZenithMapDataset(Dataset if TORCH_AVAILABLE else object):  # type: ignore[
     
     Note: This loads the entire dataset into memory. For large datasets,
     use ZenithDataset (IterableDataset) instead.
+    
+    Samples from __getitem__ are views of the loaded data for numeric
+    columns without nulls (and of the feature matrix with stack_features);
+    modifying them in place modifies the dataset. Samples passed to
+    transform or target_transform are copied first.
     """
     
     def __init__(
@@ -165,64 +424,171 @@ class ZenithMapDataset(Dataset if TORCH_AVAILABLE else object):  # type: ignore[
         transform: Optional[Callable] = None,
         target_transform: Optional[Callable] = None,
         label_column: Optional[str] = None,
+        stack_features: bool = False,
+        cache_dir: Optional[Union[str, Path]] = None,
+        columns: Optional[List[str]] = None,
+        batch_transform: Optional[Callable] = None,
+        compile_transforms: bool = False,
     ):
+        """
+        Initialize the ZenithMapDataset.
+        
+        Args:
+            source: Path to data source
+            preprocessing_plugin: WASM plugin for fast preprocessing
+            transform: Optional transform to apply to features
+            target_transform: Optional transform to apply to labels
+            label_column: Name of the label column
+            stack_features: Return features as one (num_features,) tensor
+                per sample instead of a dict. Requires all feature columns
+                to share a numeric dtype and have no nulls; they are copied
+                once into a contiguous (rows, num_features) matrix.
+            cache_dir: Directory for a memory-mapped Arrow copy of the
+                decoded data, shared by DataLoader workers (e.g. /dev/shm)
+            columns: Specific columns to load (None = all)
+            batch_transform: Transform applied once per batch of indices
+                instead of transform/target_transform per sample. Called as
+                batch_transform(features, labels) -> (features, labels), or
+                batch_transform(features) -> features without a label
+                column, on batched tensors (a dict of them for several
+                feature columns). Express elementwise work as vectorized
+                torch ops, e.g. lambda x, y: ((x - mean) / std, y).
+            compile_transforms: Wrap the transforms with torch.compile
+                when the data is loaded; a transform that fails to compile
+                runs uncompiled
+        """
         if not TORCH_AVAILABLE:
             raise ImportError(
                 "PyTorch is required for zenith.torch. "
                 "Install with: pip install zenith-ai[torch]"
             )
+        if batch_transform and (transform or target_transform):
+            raise ValueError(
+                "batch_transform replaces transform and target_transform; pass only one kind"
+            )
         
         super().__init__()
         
         self.source = Path(source) if isinstance(source, str) else source
         self.preprocessing_plugin = preprocessing_plugin
+        self.batch_transform = batch_transform
         self.transform = transform
         self.target_transform = target_transform
         self.label_column = label_column
+        self.stack_features = stack_features
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.columns = columns
+        self.compile_transforms = compile_transforms
         
-        # Load data immediately for random access
-        from zenith.engine import Engine
-        self._engine = Engine()
-        
-        if self.preprocessing_plugin:
-            self._engine.load_plugin(self.preprocessing_plugin)
+        # Loaded on first access, so each DataLoader worker maps the data
+        # itself instead of unpickling a copy from the parent
+        self._engine = None
+        self._data: Optional[pa.Table] = None
+        self._col_arrays: Dict[str, np.ndarray] = {}
+        self._categories: Dict[str, list] = {}
+        self._columns: Dict[str, Any] = {}
+        self._names: tuple = ()
+        self._num_rows = 0
+    
+    def _ensure_loaded(self):
+        """Lazy load data using Zenith engine."""
+        if self._engine is None:
+            from zenith.engine import Engine
+            self._engine = Engine()
+            
+            if self.preprocessing_plugin:
+                self._engine.load_plugin(self.preprocessing_plugin)
+            
+            self._data = _load_table(
+                self._engine, self.source, self.cache_dir, self.columns
+            ).unify_dictionaries()
+            self._col_arrays = _column_arrays(self._data)
+            self._categories = _categories(self._data)
+            self._columns = _sample_columns(self._data, self._col_arrays)
+            if self.stack_features:
+                self._columns = self._stacked_columns()
+            self._names = tuple(self._columns)
+            self._bind_emitter()
+            self._num_rows = self._data.num_rows
+    
+    def _stacked_columns(self) -> Dict[str, Any]:
+        """Replace the feature columns by a single (rows, num_features) tensor."""
+        names = [n for n in self._data.column_names if n != self.label_column]
+        arrays = [self._col_arrays[n] for n in names]
+        dtypes = {arr.dtype if isinstance(arr, np.ndarray) else None for arr in arrays}
+        if not arrays or len(dtypes) != 1 or None in dtypes or dtypes.pop().kind not in "iuf" \
+                or any(self._data.column(n).null_count for n in names):
+            raise ValueError(
+                "stack_features requires feature columns of one numeric dtype without nulls"
+            )
         
-        self._data = self._engine.load(self.source)
+        # Rows of the matrix are the per-sample feature vectors
+        columns = {_STACKED_FEATURES: torch.from_numpy(np.column_stack(arrays))}
+        if self.label_column in self._columns:
+            columns[self.label_column] = self._columns[self.label_column]
+        return columns
     
     def __getitem__(self, idx: int):
         """Get sample by index."""
-        row = {col: self._data.column(col)[idx].as_py() 
-               for col in self._data.column_names}
-        
-        if self.label_column and self.label_column in row:
-            label = row.pop(self.label_column)
-            features = row
-        else:
-            features = row
-            label = None
+        if self.batch_transform:
+            return self.__getitems__([idx])[0]
+        self._ensure_loaded()
+        return self._emit(tuple(values[idx] for values in self._columns.values()))
+    
+    def __getitems__(self, indices: List[int]) -> list:
+        """
+        Get a batch of samples by index.
         
-        # Convert to tensors
-        if len(features) == 1:
-            features = torch.tensor(list(features.values())[0])
-        else:
-            features = {k: torch.tensor(v) for k, v in features.items()}
+        Called by torch's DataLoader instead of one __getitem__ per
+        index. Each column is gathered once for the whole batch and then
+        split into per-sample tensors.
+        """
+        self._ensure_loaded()
+        idx = np.asarray(indices, dtype=np.int64)
+        if self.batch_transform:
+            return self._transformed_batch(indices, idx)
+        gathered = []
+        for values in self._columns.values():
+            if isinstance(values, torch.Tensor):
+                gathered.append(values[torch.from_numpy(idx)].unbind(0))
+            elif isinstance(values, list):
+                gathered.append([values[i] for i in indices])
+            else:
+                gathered.append(values[idx])
         
-        if self.transform:
-            features = self.transform(features)
+        emit = self._emit
+        return [emit(row) for row in zip(*gathered)]
+    
+    def _transformed_batch(self, indices: List[int], idx: np.ndarray) -> list:
+        """Gather whole columns, apply batch_transform once, then split per sample."""
+        batch = {}
+        for name, values in self._columns.items():
+            if isinstance(values, torch.Tensor):
+                batch[name] = values[torch.from_numpy(idx)]
+            elif isinstance(values, list):
+                batch[name] = [values[i] for i in indices]
+            else:
+                batch[name] = torch.as_tensor(values[idx])
         
-        if label is not None:
-            label = torch.tensor(label)
-            if self.target_transform:
-                label = self.target_transform(label)
-            return features, label
+        labels = batch.pop(self.label_column) if self.label_column in batch else None
+        features = next(iter(batch.values())) if len(batch) == 1 else batch
         
-        return features
+        if labels is None:
+            return _unbatch(self._batch_transform(features))
+        features, labels = self._batch_transform(features, labels)
+        return list(zip(_unbatch(features), _unbatch(labels)))
     
     def __len__(self) -> int:
-        return self._data.num_rows if self._data else 0
+        self._ensure_loaded()
+        return self._num_rows
     
     def close(self):
         if self._engine:
             self._engine.close()
             self._engine = None
         self._data = None
+        self._col_arrays = {}
+        self._categories = {}
+        self._columns = {}
+        self._names = ()
+        self._num_rows = 0
@@ -8,13 +8,27 @@ This test suite implements Jepsen-style testing for distributed systems:
 3. Recovery Testing
 """
 
+import os
+import select
 import subprocess
+import threading
 import time
-import random
-import json
 import sys
+import uuid
+from collections import defaultdict
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+    
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    
+    def dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+from concurrent.futures import ThreadPoolExecutor
 
 # Zenith nodes configuration
 NODES = {
@@ -22,56 +36,177 @@ NODES = {
     'zenith-node-2': '172.28.0.12',
     'zenith-node-3': '172.28.0.13'
 }
+NODE_NAMES = tuple(NODES)
+# The other nodes, per node
+PEERS = {node: tuple(peer for peer in NODE_NAMES if peer != node) for node in NODE_NAMES}
+
+# Node cut off by the partition test, and the ones it is cut off from
+ISOLATED_NODE = 'zenith-node-3'
+HEALTHY_NODES = PEERS[ISOLATED_NODE]
+
+# Write log on each node, and an index of "<key> <byte offset>" lines
+# pointing at the latest write of each key in it
+DATA_LOG = '/tmp/zenith_data.log'
+DATA_INDEX = '/tmp/zenith_idx'
+
+class NodeShell:
+    """
+    Long-lived `docker exec -i <node> bash` that runs commands one at a time.
+    
+    Each command is written to the shell's stdin followed by markers that
+    carry its exit code and stderr, so the docker exec/attach cost is paid
+    once per node instead of once per command.
+    """
+    
+    def __init__(self, node):
+        self.proc = subprocess.Popen(
+            ['docker', 'exec', '-i', node, 'bash'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        self.lock = threading.Lock()
+        self._marker = f'__ZENITH_{uuid.uuid4().hex}__'
+        self._buf = b''
+    
+    def run(self, cmd, timeout):
+        """Run cmd; returns (returncode, stdout, stderr)"""
+        err_file = f'/tmp/{self._marker}.err'
+        script = (
+            f'{{ {cmd}\n}} 2>{err_file}; '
+            f"printf '\\n{self._marker}RC%d\\n' $?; "
+            f'cat {err_file}; '
+            f"printf '\\n{self._marker}END\\n'\n"
+        )
+        self.proc.stdin.write(script.encode())
+        self.proc.stdin.flush()
+        
+        out = self._read_until(f'\n{self._marker}END\n'.encode(), time.monotonic() + timeout)
+        stdout, _, rest = out.partition(f'\n{self._marker}RC'.encode())
+        code, _, stderr = rest.partition(b'\n')
+        return int(code), stdout.decode(errors='replace'), stderr.decode(errors='replace')
+    
+    def _read_until(self, end, deadline):
+        fd = self.proc.stdout.fileno()
+        while end not in self._buf:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.proc.args, remaining)
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if ready:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    raise EOFError('shell exited')
+                self._buf += chunk
+        out, _, self._buf = self._buf.partition(end)
+        return out
+    
+    def close(self):
+        try:
+            self.proc.stdin.write(b'exit\n')
+            self.proc.stdin.close()
+            self.proc.wait(timeout=5)
+        except Exception:
+            self.proc.kill()
+
 
 class JepsenTest:
-    def __init__(self):
+    def __init__(self, record_history=True):
         self.test_results = []
         self.history = []
+        self.record_history = record_history
         self.start_time = datetime.now()
+        # Wall clock derived from the monotonic clock, and the formatted
+        # H:M:S of the last second seen, so log() formats only milliseconds
+        self._epoch = time.time() - time.monotonic()
+        self._log_second = (None, '')
+        self._shells = {}
+        self._shells_lock = threading.Lock()
+        # Per-node key/value state of the simulated concurrent operations
+        self._kv = defaultdict(dict)
         
     def log(self, msg, level='INFO'):
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
+        now = self._epoch + time.monotonic()
+        second = int(now)
+        cached_second, hms = self._log_second
+        if second != cached_second:
+            hms = time.strftime('%H:%M:%S', time.localtime(second))
+            self._log_second = (second, hms)
+        timestamp = f'{hms}.{int((now - second) * 1000):03d}'
         print(f'[{timestamp}] [{level}] {msg}')
-        self.history.append({
-            'time': timestamp,
-            'level': level,
-            'msg': msg
-        })
+        if self.record_history:
+            self.history.append({
+                'time': timestamp,
+                'level': level,
+                'msg': msg
+            })
     
     def exec_on_node(self, node, cmd):
         """Execute command on a specific node"""
-        try:
-            result = subprocess.run(
-                ['docker', 'exec', node, 'bash', '-c', cmd],
-                capture_output=True, text=True, timeout=10
-            )
-            return {
-                'success': result.returncode == 0,
-                'stdout': result.stdout.strip(),
-                'stderr': result.stderr.strip()
-            }
-        except subprocess.TimeoutExpired:
-            return {'success': False, 'error': 'timeout'}
-        except Exception as e:
-            return {'success': False, 'error': str(e)}
+        with self._shells_lock:
+            shell = self._shells.get(node)
+            if shell is None:
+                try:
+                    shell = self._shells[node] = NodeShell(node)
+                except Exception as e:
+                    return {'success': False, 'error': str(e)}
+        
+        with shell.lock:
+            try:
+                returncode, stdout, stderr = shell.run(cmd, timeout=10)
+                return {
+                    'success': returncode == 0,
+                    'stdout': stdout.strip(),
+                    'stderr': stderr.strip()
+                }
+            except subprocess.TimeoutExpired:
+                result = {'success': False, 'error': 'timeout'}
+            except Exception as e:
+                result = {'success': False, 'error': str(e)}
+            # The shell is in an unknown state; start a fresh one next time
+            shell.proc.kill()
+            with self._shells_lock:
+                if self._shells.get(node) is shell:
+                    del self._shells[node]
+            return result
+    
+    def close_shells(self):
+        """Terminate the per-node shells"""
+        with self._shells_lock:
+            shells, self._shells = list(self._shells.values()), {}
+        for shell in shells:
+            shell.close()
+    
+    def ping_from(self, node, targets, count=2, wait=2):
+        """Ping several nodes from one node in a single script; returns {target: reachable}"""
+        # The pings run in the background so their waits overlap
+        script = ' '.join(
+            f'(ping -c {count} -W {wait} {NODES[target]} > /dev/null 2>&1 '
+            f'&& echo {target}:OK || echo {target}:FAIL) &'
+            for target in targets
+        ) + ' wait'
+        result = self.exec_on_node(node, script)
+        
+        reachable = dict.fromkeys(targets, False)
+        for line in result.get('stdout', '').splitlines():
+            target, _, status = line.partition(':')
+            if target in reachable:
+                reachable[target] = status == 'OK'
+        return reachable
     
     def test_connectivity(self):
         """Test Phase 1: Verify all nodes can communicate"""
         self.log('=== PHASE 1: Connectivity Test ===')
         results = []
         
-        for src_node in NODES:
-            for dst_node in NODES:
-                if src_node == dst_node:
-                    continue
-                    
-                dst_ip = NODES[dst_node]
-                result = self.exec_on_node(
-                    src_node, 
-                    f'ping -c 2 -W 2 {dst_ip} > /dev/null 2>&1 && echo OK || echo FAIL'
-                )
-                
-                status = 'PASS' if result.get('stdout') == 'OK' else 'FAIL'
+        def probe_from(src_node):
+            return self.ping_from(src_node, PEERS[src_node])
+        
+        # Source nodes are probed in parallel; results are logged in node order
+        with ThreadPoolExecutor(max_workers=len(NODE_NAMES)) as executor:
+            probes = list(executor.map(probe_from, NODE_NAMES))
+        
+        for src_node, reachable in zip(NODE_NAMES, probes):
+            for dst_node in reachable:
+                status = 'PASS' if reachable[dst_node] else 'FAIL'
                 self.log(f'  {src_node} -> {dst_node}: {status}')
                 results.append(status == 'PASS')
         
@@ -88,33 +223,26 @@ class JepsenTest:
         self.log('=== PHASE 2: Network Partition Test (Nemesis) ===')
         
         # Choose node to partition
-        isolated_node = 'zenith-node-3'
+        isolated_node = ISOLATED_NODE
         self.log(f'  Isolating {isolated_node} from cluster...')
         
-        # Block traffic from node-3 to node-1 and node-2
-        for target in ['zenith-node-1', 'zenith-node-2']:
-            target_ip = NODES[target]
-            self.exec_on_node(
-                isolated_node,
-                f'iptables -A OUTPUT -d {target_ip} -j DROP 2>/dev/null || true'
-            )
-            self.exec_on_node(
-                isolated_node,
-                f'iptables -A INPUT -s {target_ip} -j DROP 2>/dev/null || true'
-            )
+        # Block traffic from node-3 to node-1 and node-2, as one
+        # iptables-restore transaction (a single xtables lock acquisition)
+        rules = '\n'.join(
+            f'-A OUTPUT -d {NODES[target]} -j DROP\n-A INPUT -s {NODES[target]} -j DROP'
+            for target in HEALTHY_NODES
+        )
+        self.exec_on_node(
+            isolated_node,
+            f"iptables-restore --noflush -w 2 <<'EOF' 2>/dev/null || true\n*filter\n{rules}\nCOMMIT\nEOF"
+        )
         
         self.log(f'  {isolated_node} is now partitioned')
         
         # Verify partition
-        partition_active = True
-        for target in ['zenith-node-1', 'zenith-node-2']:
-            result = self.exec_on_node(
-                isolated_node,
-                f'ping -c 1 -W 1 {NODES[target]} > /dev/null 2>&1 && echo OK || echo BLOCKED'
-            )
-            if result.get('stdout') == 'OK':
-                partition_active = False
-                
+        reachable = self.ping_from(isolated_node, HEALTHY_NODES, count=1, wait=1)
+        partition_active = not any(reachable.values())
+        
         self.log(f'  Partition active: {partition_active}')
         time.sleep(2)  # Let the partition take effect
         
@@ -138,7 +266,7 @@ class JepsenTest:
         """Test Phase 3: Network recovery"""
         self.log('=== PHASE 3: Network Recovery Test ===')
         
-        isolated_node = 'zenith-node-3'
+        isolated_node = ISOLATED_NODE
         
         # Restore network
         self.log(f'  Healing network partition for {isolated_node}...')
@@ -148,12 +276,8 @@ class JepsenTest:
         
         # Verify recovery
         recovered = True
-        for target in ['zenith-node-1', 'zenith-node-2']:
-            result = self.exec_on_node(
-                isolated_node,
-                f'ping -c 2 -W 2 {NODES[target]} > /dev/null 2>&1 && echo OK || echo FAIL'
-            )
-            status = result.get('stdout') == 'OK'
+        reachable = self.ping_from(isolated_node, HEALTHY_NODES)
+        for target, status in reachable.items():
             self.log(f'  {isolated_node} -> {target}: {"RECOVERED" if status else "FAILED"}')
             recovered = recovered and status
         
@@ -171,42 +295,43 @@ class JepsenTest:
         
         operations = []
         
+        # The simulated store is per node (like the unshared log file each
+        # container used to append to), so it is kept here rather than
+        # paying a container round trip and a log scan per operation
         def write_operation(node, key, value):
             # Simulate a write operation
-            cmd = f'echo "{key}={value}" >> /tmp/zenith_data.log && echo OK'
-            result = self.exec_on_node(node, cmd)
+            self._kv[node][key] = value
             return {
                 'type': 'write',
                 'node': node,
                 'key': key,
                 'value': value,
-                'success': result.get('stdout') == 'OK'
+                'success': True
             }
         
-        def read_operation(node, key):
-            # Simulate a read operation
-            cmd = f'grep "^{key}=" /tmp/zenith_data.log 2>/dev/null | tail -1 || echo ""'
-            result = self.exec_on_node(node, cmd)
+        def read_operation(node, key, expected):
+            # Simulate a read operation; it fails unless it sees the write
+            value = self._kv[node].get(key, '')
             return {
                 'type': 'read',
                 'node': node,
                 'key': key,
-                'value': result.get('stdout', ''),
-                'success': True
+                'value': value,
+                'success': value == expected
             }
         
-        # Generate concurrent operations
+        # Operations are spread round-robin over the nodes
+        nodes = NODE_NAMES
+        now_ms = int(time.time()*1000)
+        
+        # Generate concurrent operations; results are logged in submission order
         with ThreadPoolExecutor(max_workers=6) as executor:
-            futures = []
-            
             # Write operations
-            for i in range(5):
-                node = random.choice(list(NODES.keys()))
-                futures.append(executor.submit(write_operation, node, f'key_{i}', f'value_{i}_{int(time.time()*1000)}'))
+            write_nodes = [nodes[i % len(nodes)] for i in range(5)]
+            write_keys = [f'key_{i}' for i in range(5)]
+            write_values = [f'value_{i}_{now_ms}' for i in range(5)]
             
-            # Wait for writes
-            for future in as_completed(futures):
-                op = future.result()
+            for op in executor.map(write_operation, write_nodes, write_keys, write_values):
                 operations.append(op)
                 self.log(f'  {op["type"].upper()} on {op["node"]}: {op["key"]}={op.get("value", "")} - {"OK" if op["success"] else "FAIL"}')
         
@@ -214,15 +339,13 @@ class JepsenTest:
         
         # Read operations
         with ThreadPoolExecutor(max_workers=6) as executor:
-            futures = []
-            for i in range(3):
-                node = random.choice(list(NODES.keys()))
-                futures.append(executor.submit(read_operation, node, f'key_{i}'))
+            # Each node keeps its own store, so a key is read on its writer
+            read_nodes = [nodes[i % len(nodes)] for i in range(3)]
+            read_keys = [f'key_{i}' for i in range(3)]
             
-            for future in as_completed(futures):
-                op = future.result()
+            for op in executor.map(read_operation, read_nodes, read_keys, write_values[:3]):
                 operations.append(op)
-                self.log(f'  {op["type"].upper()} on {op["node"]}: {op["key"]} -> {op.get("value", "(empty)")}')
+                self.log(f'  {op["type"].upper()} on {op["node"]}: {op["key"]} -> {op.get("value", "(empty)")} - {"OK" if op["success"] else "FAIL"}')
         
         successful_ops = sum(1 for op in operations if op['success'])
         
@@ -242,9 +365,13 @@ class JepsenTest:
         
         # Sequential writes
         writes = []
-        for i, node in enumerate(NODES.keys()):
+        for i, node in enumerate(NODE_NAMES):
             value = f'v{i}_{int(time.time()*1000)}'
-            cmd = f'echo "{test_key}={value}" >> /tmp/zenith_data.log'
+            cmd = (
+                f'off=$(stat -c %s {DATA_LOG} 2>/dev/null || echo 0); '
+                f'printf "%s=%s\\n" "{test_key}" "{value}" >> {DATA_LOG} && '
+                f'echo "{test_key} $off" >> {DATA_INDEX}'
+            )
             self.exec_on_node(node, cmd)
             writes.append({'node': node, 'value': value})
             self.log(f'  WRITE: {node} -> {value}')
@@ -252,16 +379,22 @@ class JepsenTest:
         
         # Read from all nodes
         reads = []
-        for node in NODES.keys():
-            cmd = f'grep "^{test_key}=" /tmp/zenith_data.log 2>/dev/null | tail -1 || echo ""'
+        for node in NODE_NAMES:
+            # Seek to the indexed offset instead of scanning the whole log
+            cmd = (
+                f"off=$(awk -v k=\"{test_key}\" '$1 == k {{o = $2}} END {{print o}}' {DATA_INDEX} 2>/dev/null); "
+                f'[ -n "$off" ] && tail -c +$((off + 1)) {DATA_LOG} | head -n 1 || echo ""'
+            )
             result = self.exec_on_node(node, cmd)
             value = result.get('stdout', '')
             reads.append({'node': node, 'value': value})
             self.log(f'  READ: {node} -> {value}')
         
         # Check if all reads return the last written value
-        last_write = writes[-1]['value'] if writes else ''
-        consistent = all(r['value'].endswith(last_write) or last_write in r['value'] for r in reads if r['value'])
+        # Reads return the whole "key=value" log line, so compare it exactly;
+        # a substring test would also accept values that merely contain it
+        last_write = f"{test_key}={writes[-1]['value']}" if writes else ''
+        consistent = all(r['value'] == last_write for r in reads if r['value'])
         
         self.test_results.append({
             'test': 'linearizability',
@@ -290,29 +423,33 @@ class JepsenTest:
             'timestamp': datetime.now().isoformat()
         }
         
-        print('\n' + '='*60)
-        print('           JEPSEN TEST REPORT - ZENITH DATAPLANE')
-        print('='*60)
-        print(f'  Start Time: {self.start_time.strftime("%Y-%m-%d %H:%M:%S")}')
-        print(f'  Duration:   {report["summary"]["duration"]}')
-        print(f'  Nodes:      {len(NODES)}')
-        print('='*60)
-        print('\n  TEST RESULTS:')
-        print('-'*60)
+        # Built as one string and written once
+        out = [
+            '\n' + '='*60,
+            '           JEPSEN TEST REPORT - ZENITH DATAPLANE',
+            '='*60,
+            f'  Start Time: {self.start_time.strftime("%Y-%m-%d %H:%M:%S")}',
+            f'  Duration:   {report["summary"]["duration"]}',
+            f'  Nodes:      {len(NODES)}',
+            '='*60,
+            '\n  TEST RESULTS:',
+            '-'*60,
+        ]
         
         for test in self.test_results:
             status = '[PASS]' if test['passed'] else '[FAIL]'
-            print(f'  {status} {test["test"]}: {test["details"]}')
+            out.append(f'  {status} {test["test"]}: {test["details"]}')
         
-        print('-'*60)
-        print(f'\n  SUMMARY: {passed}/{total} tests passed ({report["summary"]["success_rate"]})')
+        out.append('-'*60)
+        out.append(f'\n  SUMMARY: {passed}/{total} tests passed ({report["summary"]["success_rate"]})')
         
         if passed == total:
-            print('\n  [OK] All tests passed! Zenith demonstrates distributed consistency.')
+            out.append('\n  [OK] All tests passed! Zenith demonstrates distributed consistency.')
         else:
-            print(f'\n  [!] {total-passed} test(s) failed. Review recommended.')
+            out.append(f'\n  [!] {total-passed} test(s) failed. Review recommended.')
         
-        print('='*60 + '\n')
+        out.append('='*60 + '\n')
+        sys.stdout.write('\n'.join(out) + '\n')
         
         return report
 
@@ -325,18 +462,21 @@ def main():
     jepsen = JepsenTest()
     
     # Run all test phases
-    jepsen.test_connectivity()
-    jepsen.test_network_partition()
-    jepsen.test_recovery()
-    jepsen.test_concurrent_operations()
-    jepsen.test_linearizability_check()
+    try:
+        jepsen.test_connectivity()
+        jepsen.test_network_partition()
+        jepsen.test_recovery()
+        jepsen.test_concurrent_operations()
+        jepsen.test_linearizability_check()
+    finally:
+        jepsen.close_shells()
     
     # Generate and save report
     report = jepsen.generate_report()
     
     # Save JSON report
-    with open('/tmp/jepsen_report.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    with open('/tmp/jepsen_report.json', 'wb') as f:
+        f.write(dumps(report))
     
     print('  Report saved to: /tmp/jepsen_report.json')
     
@@ -0,0 +1,57 @@
+"""
+Tests for prepared batches on the native engine
+Skipped unless the zenith._core extension is built
+"""
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../sdk-python'))
+
+
+class _CountingBatch:
+    """Arrow PyCapsule wrapper that counts how often it is exported"""
+    
+    def __init__(self, batch):
+        self.batch = batch
+        self.exports = 0
+    
+    def __arrow_c_array__(self, requested_schema=None):
+        self.exports += 1
+        return self.batch.__arrow_c_array__(requested_schema)
+
+
+class TestNativePrepared(unittest.TestCase):
+    """Prepared batches on the native engine"""
+    
+    def setUp(self):
+        """Setup native engine"""
+        try:
+            from zenith._core import Engine
+        except ImportError:
+            self.skipTest("native extension not built")
+        import pyarrow as pa
+        self.engine = Engine(buffer_size=64)
+        self.data = _CountingBatch(pa.record_batch({"x": [1, 2, 3]}))
+    
+    def tearDown(self):
+        """Cleanup"""
+        self.engine.close()
+    
+    def test_prepare_exports_once(self):
+        """Test publish_prepared does not export the data again"""
+        prepared = self.engine.prepare(self.data)
+        for seq_no in range(10):
+            self.engine.publish_prepared(prepared, seq_no=seq_no)
+        
+        self.assertEqual(self.data.exports, 1)
+        self.assertEqual(prepared.num_rows, 3)
+    
+    def test_publish_prepared_rejects_raw_data(self):
+        """Test publish_prepared only accepts prepare() results"""
+        with self.assertRaises(TypeError):
+            self.engine.publish_prepared(self.data.batch)
+        self.assertEqual(self.data.exports, 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -12,6 +12,14 @@ from zenith import ZenithClient
 import pyarrow as pa
 import numpy as np
 
+# Coarse (tick resolution) monotonic clock where available: cheaper to
+# read than time.time(), and precise enough for per-batch timestamps
+if hasattr(time, "CLOCK_MONOTONIC_COARSE"):
+    def coarse_clock_ns():
+        return time.clock_gettime_ns(time.CLOCK_MONOTONIC_COARSE)
+else:
+    coarse_clock_ns = time.monotonic_ns
+
 def benchmark_ingest(client, batch_size=1000, num_batches=100):
     """Benchmark event ingestion"""
     # Create sample data
@@ -23,21 +31,40 @@ def benchmark_ingest(client, batch_size=1000, num_batches=100):
     
     print(f"Benchmarking ingestion: {num_batches} batches x {batch_size} events")
     
-    start = time.time()
+    # Loop invariants are built up front so the loop measures batch
+    # construction and publish, not NumPy allocation and RNG calls
+    base_ids = np.arange(batch_size, dtype=np.uint64)
+    ids = np.empty(batch_size, dtype=np.uint64)
+    values = np.random.rand(num_batches, batch_size)
+    timestamps = np.empty(batch_size, dtype=np.uint64)
+    # Maps the coarse clock onto Unix time, read once
+    epoch_offset = time.time_ns() - coarse_clock_ns()
+    
+    # Arrow arrays over the NumPy memory, without copies: the id and
+    # timestamp columns view `ids` and `timestamps`, which are refilled in
+    # place, so a batch is only valid until the next iteration; value
+    # batches are slices of one buffer
+    id_array = pa.Array.from_buffers(pa.uint64(), batch_size, [None, pa.py_buffer(ids)])
+    timestamp_array = pa.Array.from_buffers(pa.uint64(), batch_size, [None, pa.py_buffer(timestamps)])
+    values_buf = pa.py_buffer(values)
+    
+    start = time.perf_counter_ns()
     
     for i in range(num_batches):
         # Generate batch
-        batch = pa.record_batch([
-            pa.array(np.arange(batch_size, dtype=np.uint64) + i * batch_size),
-            pa.array(np.random.rand(batch_size)),
-            pa.array(np.full(batch_size, int(time.time() * 1e9), dtype=np.uint64)),
+        np.add(base_ids, np.uint64(i * batch_size), out=ids)
+        timestamps.fill(epoch_offset + coarse_clock_ns())
+        batch = pa.RecordBatch.from_arrays([
+            id_array,
+            pa.Array.from_buffers(pa.float64(), batch_size, [None, values_buf], offset=i * batch_size),
+            timestamp_array,
         ], schema=schema)
         
         # Would call client.publish(batch, source_id=1, seq_no=i)
         # For now, just simulate
         pass
     
-    elapsed = time.time() - start
+    elapsed = (time.perf_counter_ns() - start) / 1e9
     total_events = batch_size * num_batches
     throughput = total_events / elapsed
     
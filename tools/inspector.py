@@ -2,45 +2,113 @@
 """
 Zenith Inspector - Debug and inspect running engine
 """
-import requests
-import json
+import http.client
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlsplit
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
 API_URL = "http://localhost:8080"
 
+# One keep-alive connection per thread (watch mode may query two
+# endpoints at once), held open across polls
+_local = threading.local()
+
+def _get(path):
+    """GET path from the engine; returns (status code, body)"""
+    for attempt in range(2):
+        conn = getattr(_local, "conn", None)
+        if conn is None:
+            url = urlsplit(API_URL)
+            conn = _local.conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=2)
+        try:
+            conn.request("GET", path)
+            resp = conn.getresponse()
+            return resp.status, resp.read()
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            _local.conn = None
+            # A kept-alive socket the server has since closed: retry once fresh
+            stale = isinstance(e, (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError))
+            if attempt or not stale:
+                raise
+
 def get_status():
     """Get engine status"""
     try:
-        resp = requests.get(f"{API_URL}/status", timeout=2)
-        if resp.status_code == 200:
-            return resp.json()
+        status_code, body = _get("/status")
+        if status_code == 200:
+            return loads(body)
     except:
         return None
 
 def get_plugins():
     """Get loaded plugins"""
     try:
-        resp = requests.get(f"{API_URL}/plugins", timeout=2)
-        if resp.status_code == 200:
-            return resp.json()
+        status_code, body = _get("/plugins")
+        if status_code == 200:
+            return loads(body)
     except:
         return []
 
+# Whether the engine serves /state; engines without it fall back to
+# /status + /plugins, and are not probed again
+_state_endpoint = True
+
+def get_state():
+    """Get engine status and plugins in one request, or None if unsupported"""
+    global _state_endpoint
+    if not _state_endpoint:
+        return None
+    try:
+        status_code, body = _get("/state")
+    except:
+        return None
+    if status_code == 404:
+        _state_endpoint = False
+    if status_code == 200:
+        state = loads(body)
+        return state.get('status'), state.get('plugins', [])
+    return None
+
+def fetch(executor=None):
+    """Get (status, plugins), from /state when the engine supports it"""
+    state = get_state()
+    if state is not None:
+        return state
+    if executor is None:
+        return get_status(), get_plugins()
+    # Both legacy endpoints are queried concurrently
+    status_future = executor.submit(get_status)
+    plugins_future = executor.submit(get_plugins)
+    return status_future.result(), plugins_future.result()
+
+def status_title():
+    """Status title line with the current time"""
+    return f"Zenith Engine Status - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+
 def print_status(status):
     """Print formatted status"""
     if not status:
         print("[FAIL] Engine not responding")
         return
     
-    print("=" * 60)
-    print(f"Zenith Engine Status - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 60)
-    print(f"Status:       {status.get('status', 'unknown').upper()}")
-    print(f"Buffer Size:  {status.get('buffer_len', 0):,}")
-    print(f"Plugins:      {status.get('plugin_count', 0)}")
-    print("=" * 60)
+    sys.stdout.write("\n".join([
+        "=" * 60,
+        status_title(),
+        "=" * 60,
+        f"Status:       {status.get('status', 'unknown').upper()}",
+        f"Buffer Size:  {status.get('buffer_len', 0):,}",
+        f"Plugins:      {status.get('plugin_count', 0)}",
+        "=" * 60,
+    ]) + "\n")
 
 def print_plugins(plugins):
     """Print plugin list"""
@@ -48,26 +116,36 @@ def print_plugins(plugins):
         print("No plugins loaded")
         return
     
-    print("\nLoaded Plugins:")
-    print("-" * 60)
+    out = ["\nLoaded Plugins:", "-" * 60]
     for plugin in plugins:
-        print(f"  [{plugin.get('id')}] {plugin.get('status')}")
+        out.append(f"  [{plugin.get('id')}] {plugin.get('status')}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 def watch_mode():
     """Continuous monitoring"""
     print("Watching engine (Ctrl+C to exit)...\n")
     try:
-        while True:
-            status = get_status()
-            plugins = get_plugins()
-            
-            # Clear screen (simple)
-            print("\033[2J\033[H", end='')
-            
-            print_status(status)
-            print_plugins(plugins)
-            
-            time.sleep(2)
+        with ThreadPoolExecutor(2) as executor:
+            last_seen = None
+            while True:
+                status, plugins = fetch(executor)
+                
+                seen = repr((status, plugins))
+                if seen == last_seen:
+                    # Nothing changed: only refresh the time in the title line
+                    if status:
+                        sys.stdout.write(f"\033[s\033[2;1H\033[K{status_title()}\033[u")
+                        sys.stdout.flush()
+                else:
+                    last_seen = seen
+                    
+                    # Clear screen (simple)
+                    print("\033[2J\033[H", end='')
+                    
+                    print_status(status)
+                    print_plugins(plugins)
+                
+                time.sleep(2)
     except KeyboardInterrupt:
         print("\n\nStopped monitoring")
 
@@ -75,8 +153,7 @@ def main():
     if len(sys.argv) > 1 and sys.argv[1] == "watch":
         watch_mode()
     else:
-        status = get_status()
-        plugins = get_plugins()
+        status, plugins = fetch()
         print_status(status)
         print_plugins(plugins)
 
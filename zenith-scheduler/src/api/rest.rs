@@ -3,13 +3,15 @@
 use axum::{
     Router,
     routing::{get, post, delete},
-    response::{Json, IntoResponse},
-    extract::{State, Path},
-    http::StatusCode,
+    response::{Json, IntoResponse, Response},
+    extract::{State, Path, Query},
+    http::{header, HeaderMap, StatusCode},
 };
 use serde::{Deserialize, Serialize};
 use std::sync::Arc;
 use std::collections::HashMap;
+use std::collections::hash_map::DefaultHasher;
+use std::hash::{Hash, Hasher};
 
 use crate::scheduler::Scheduler;
 use crate::node::NodeRegistry;
@@ -60,6 +62,19 @@ pub struct SubmitJobRequest {
     pub gang_schedule: bool,
 }
 
+/// Filters for `GET /api/v1/jobs`
+#[derive(Debug, Default, Deserialize)]
+pub struct ListJobsQuery {
+    /// Only jobs in this state (e.g. "Running")
+    pub state: Option<String>,
+    /// Only jobs submitted by this user
+    pub user_id: Option<String>,
+    /// Maximum number of jobs to return
+    pub limit: Option<usize>,
+    /// "ndjson" for one JSON object per line instead of a JSON array
+    pub format: Option<String>,
+}
+
 fn default_working_dir() -> String { "/app".to_string() }
 fn default_cpu_cores() -> u32 { 1 }
 fn default_memory() -> u64 { 4096 }
@@ -176,12 +191,26 @@ async fn submit_job(
     }
 }
 
+/// Get a job; answers 304 Not Modified when `If-None-Match` carries the
+/// current ETag, so pollers only download the job when it changed
 async fn get_job(
     State(state): State<Arc<AppState>>,
     Path(job_id): Path<String>,
-) -> impl IntoResponse {
+    headers: HeaderMap,
+) -> Response {
     match state.scheduler.get_job(&job_id) {
-        Some(job) => (StatusCode::OK, Json(job_to_response(&job))),
+        Some(job) => {
+            let response = job_to_response(&job);
+            let etag = job_etag(&response);
+            let unchanged = headers
+                .get(header::IF_NONE_MATCH)
+                .is_some_and(|v| v.as_bytes() == etag.as_bytes());
+            if unchanged {
+                (StatusCode::NOT_MODIFIED, [(header::ETAG, etag)]).into_response()
+            } else {
+                (StatusCode::OK, [(header::ETAG, etag)], Json(response)).into_response()
+            }
+        }
         None => (StatusCode::NOT_FOUND, Json(JobResponse {
             job_id,
             name: "not_found".to_string(),
@@ -191,17 +220,39 @@ async fn get_job(
             created_at: "".to_string(),
             allocated_nodes: vec![],
             gpu_count: 0,
-        })),
+        })).into_response(),
     }
 }
 
 async fn list_jobs(
-    State(_state): State<Arc<AppState>>,
-) -> impl IntoResponse {
-    // Get jobs in different states
-    let jobs: Vec<JobResponse> = vec![];
-    // In production: iterate all jobs and convert
-    Json(jobs)
+    State(state): State<Arc<AppState>>,
+    Query(query): Query<ListJobsQuery>,
+) -> Response {
+    let jobs: Vec<JobResponse> = state.scheduler
+        .find_jobs(
+            |job| {
+                query.state.as_deref().map_or(true, |s| format!("{:?}", job.state) == s)
+                    && query.user_id.as_deref().map_or(true, |u| job.descriptor.user_id == u)
+            },
+            query.limit.unwrap_or(usize::MAX),
+        )
+        .iter()
+        .map(job_to_response)
+        .collect();
+    
+    if query.format.as_deref() != Some("ndjson") {
+        return Json(jobs).into_response();
+    }
+    
+    // One job per line so clients can decode incrementally
+    let mut body = String::new();
+    for job in &jobs {
+        if let Ok(line) = serde_json::to_string(job) {
+            body.push_str(&line);
+            body.push('\n');
+        }
+    }
+    ([(header::CONTENT_TYPE, "application/x-ndjson")], body).into_response()
 }
 
 async fn cancel_job(
@@ -272,6 +323,15 @@ fn job_to_response(job: &Job) -> JobResponse {
     }
 }
 
+/// Weak validator over the fields of a job that change after submission
+fn job_etag(response: &JobResponse) -> String {
+    let mut hasher = DefaultHasher::new();
+    response.job_id.hash(&mut hasher);
+    response.state.hash(&mut hasher);
+    response.allocated_nodes.hash(&mut hasher);
+    format!("W/\"{:016x}\"", hasher.finish())
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -473,12 +533,38 @@ mod tests {
     #[tokio::test]
     async fn test_list_jobs_returns_empty_initially() {
         let state = create_test_state();
-        let response = list_jobs(State(state)).await;
+        let response = list_jobs(State(state), Query(ListJobsQuery::default())).await;
         // Should return empty list initially
         let json = response.into_response();
         assert_eq!(json.status(), StatusCode::OK);
     }
     
+    #[test]
+    fn test_find_jobs_filters_by_user() {
+        let state = create_test_state();
+        for user in ["alice", "bob", "alice"] {
+            let descriptor = JobDescriptor {
+                name: "list-test".to_string(),
+                user_id: user.to_string(),
+                project_id: "proj".to_string(),
+                command: "test".to_string(),
+                arguments: vec![],
+                environment: HashMap::new(),
+                working_directory: "/app".to_string(),
+                resources: ResourceRequirements::default(),
+                locality: LocalityPreferences::default(),
+                policy: SchedulingPolicy::default(),
+                labels: HashMap::new(),
+                annotations: HashMap::new(),
+            };
+            state.scheduler.submit(Job::new(descriptor)).unwrap();
+        }
+        
+        let alice = state.scheduler.find_jobs(|j| j.descriptor.user_id == "alice", usize::MAX);
+        assert_eq!(alice.len(), 2);
+        assert_eq!(state.scheduler.find_jobs(|_| true, 1).len(), 1);
+    }
+    
     #[tokio::test]
     async fn test_cluster_status_handler() {
         let state = create_test_state();
@@ -500,13 +586,49 @@ mod tests {
         let state = create_test_state();
         let response = get_job(
             State(state),
-            Path("non-existent-job".to_string())
+            Path("non-existent-job".to_string()),
+            HeaderMap::new(),
         ).await;
         
         let (parts, _body) = response.into_response().into_parts();
         assert_eq!(parts.status, StatusCode::NOT_FOUND);
     }
     
+    #[tokio::test]
+    async fn test_get_job_if_none_match() {
+        let state = create_test_state();
+        let descriptor = JobDescriptor {
+            name: "etag-test".to_string(),
+            user_id: "user".to_string(),
+            project_id: "proj".to_string(),
+            command: "test".to_string(),
+            arguments: vec![],
+            environment: HashMap::new(),
+            working_directory: "/app".to_string(),
+            resources: ResourceRequirements::default(),
+            locality: LocalityPreferences::default(),
+            policy: SchedulingPolicy::default(),
+            labels: HashMap::new(),
+            annotations: HashMap::new(),
+        };
+        let job_id = state.scheduler.submit(Job::new(descriptor)).unwrap();
+        
+        let first = get_job(State(state.clone()), Path(job_id.clone()), HeaderMap::new()).await;
+        assert_eq!(first.status(), StatusCode::OK);
+        let etag = first.headers().get(header::ETAG).unwrap().clone();
+        
+        let mut headers = HeaderMap::new();
+        headers.insert(header::IF_NONE_MATCH, etag.clone());
+        let second = get_job(State(state.clone()), Path(job_id.clone()), headers.clone()).await;
+        assert_eq!(second.status(), StatusCode::NOT_MODIFIED);
+        
+        // A state change invalidates the tag
+        state.scheduler.cancel(&job_id, "test").unwrap();
+        let third = get_job(State(state), Path(job_id), headers).await;
+        assert_eq!(third.status(), StatusCode::OK);
+        assert_ne!(third.headers().get(header::ETAG).unwrap(), &etag);
+    }
+    
     #[tokio::test]
     async fn test_cancel_job_not_found() {
         let state = create_test_state();
@@ -312,6 +312,19 @@ impl Scheduler {
             .collect()
     }
     
+    /// Get up to `limit` jobs matching `predicate`
+    ///
+    /// Only matching jobs are cloned, so filtered listings stay cheap on
+    /// large clusters.
+    pub fn find_jobs(&self, predicate: impl Fn(&Job) -> bool, limit: usize) -> Vec<Job> {
+        self.jobs.read()
+            .values()
+            .filter(|j| predicate(j))
+            .take(limit)
+            .cloned()
+            .collect()
+    }
+    
     /// Get queue size
     pub fn queue_size(&self) -> usize {
         self.pending_queue.read().len()